@@ -0,0 +1,225 @@
+# answer_matcher.py
+import unicodedata
+from collections import Counter
+import instrument
+from quiz_ids import item_id
+
+# 비교 시 무시하는 문자: 공백과 따옴표만 어디서든 무시하고, 마침표 등은 답안 끝에 있을 때만 무시합니다.
+# + # - . < > ^ / 같은 기호와 숫자는 뜻을 바꾸므로 그대로 비교합니다. (C++ ≠ C, -1 ≠ 1, 2.5 ≠ 25)
+IGNORED_CHARS = frozenset("'\"`‘’“”「」『』")
+TRAILING_PUNCTUATION = ".。!?"
+TOKEN_SEPARATORS = (",", "，", "、")
+# NFD로 분해한 한글 음절의 자모 범위 (초성/중성/종성)
+CHOSEONG = range(0x1100, 0x1113)
+JUNGSEONG = range(0x1161, 0x1176)
+JONGSEONG = range(0x11A8, 0x11C3)
+
+
+def normalize_answer(text: str):
+    """
+    답안을 비교용 문자열로 바꿉니다.
+    - 대소문자 통일, 전각/반각 통일(NFKC)
+    - 한글 음절을 자모로 분해(NFD)하여 받침 하나 차이도 편집 거리 1로 계산되도록 함
+    - 공백과 따옴표, 끝의 마침표/물음표/느낌표 제거 (그 밖의 기호는 유지)
+    """
+    text = unicodedata.normalize("NFKC", text).casefold().strip().rstrip(TRAILING_PUNCTUATION)
+    text = unicodedata.normalize("NFD", text)
+    return "".join(ch for ch in text if not ch.isspace() and ch not in IGNORED_CHARS)
+
+
+def fixed_chars(norm: str):
+    """오타로 보지 않는 문자(숫자, 기호)만 순서대로 모은 문자열. 편집 거리 비교 전에 같아야 합니다."""
+    return "".join(ch for ch in norm if unicodedata.category(ch)[0] in "NPS")
+
+
+def syllables(norm: str):
+    """
+    정규화 문자열을 음절 단위로 묶습니다. 한글 음절은 (초성, 중성, 종성) 튜플, 그 밖의 문자는 그대로
+    예: "콜a" → (("ᄏ", "ᅩ", "ᆯ"), "a")
+    """
+    units, i = [], 0
+    while i < len(norm):
+        ch = norm[i]
+        if ord(ch) in CHOSEONG and i + 1 < len(norm) and ord(norm[i + 1]) in JUNGSEONG:
+            final = norm[i + 2] if i + 2 < len(norm) and ord(norm[i + 2]) in JONGSEONG else ""
+            units.append((ch, norm[i + 1], final))
+            i += 3 if final else 2
+        else:
+            units.append(ch)
+            i += 1
+    return tuple(units)
+
+
+def _unit_cost(x, y):
+    """음절 하나를 다른 음절로 바꾸는 비용. 한 음절 안에서 자모 하나만 다를 때만 오타로 봅니다."""
+    if x == y:
+        return 0
+    if isinstance(x, tuple) and isinstance(y, tuple):
+        return 1 if sum(p != q for p, q in zip(x, y)) == 1 else None
+    if isinstance(x, tuple) or isinstance(y, tuple):
+        return None
+    return 1
+
+
+def syllable_edit_distance(a, b, limit: int):
+    """
+    음절 단위로 묶은 a, b의 편집 거리 (limit을 넘으면 limit + 1)
+    - 한글 음절은 자모 하나 차이(받침 추가/삭제 포함)만 비용 1로 바꿀 수 있고,
+      두 자모 이상 다르거나(외부/내부, 정적/동적, 상향/하향) 음절을 통째로 넣거나 빼면 허용하지 않습니다.
+    - 한글이 아닌 문자는 문자 단위 편집 거리와 같습니다.
+    """
+    over = limit + 1
+    prev = [0]
+    for y in b:
+        prev.append(over if isinstance(y, tuple) else min(prev[-1] + 1, over))
+    for i in range(1, len(a) + 1):
+        x = a[i - 1]
+        cur = [over] * (len(b) + 1)
+        cur[0] = min(prev[0] + 1, over) if not isinstance(x, tuple) else over
+        for j in range(1, len(b) + 1):
+            y = b[j - 1]
+            best = over
+            cost = _unit_cost(x, y)
+            if cost is not None:
+                best = prev[j - 1] + cost
+            if not isinstance(x, tuple) and prev[j] + 1 < best:
+                best = prev[j] + 1
+            if not isinstance(y, tuple) and cur[j - 1] + 1 < best:
+                best = cur[j - 1] + 1
+            cur[j] = min(best, over)
+        if min(cur) > limit:
+            return over
+        prev = cur
+    return prev[len(b)]
+
+
+def split_tokens(text: str):
+    """쉼표 등으로 나열된 답안을 정규화된 항목 집합으로 바꿉니다. 항목이 하나뿐이면 None"""
+    for sep in TOKEN_SEPARATORS[1:]:
+        text = text.replace(sep, TOKEN_SEPARATORS[0])
+    parts = [normalize_answer(p) for p in text.split(TOKEN_SEPARATORS[0])]
+    tokens = frozenset(p for p in parts if p)
+    return tokens if len(tokens) > 1 else None
+
+
+def bounded_edit_distance(a: str, b: str, limit: int):
+    """
+    a, b의 편집 거리가 limit 이하이면 그 값을, 넘으면 limit + 1을 반환합니다.
+    대각선 주변 폭 2*limit+1 만 계산하고, 한 행의 최솟값이 limit을 넘으면 즉시 중단합니다.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # 공통 접두부/접미부는 거리에 영향을 주지 않으므로 잘라 내고 다른 구간만 계산합니다.
+    shorter = min(len(a), len(b))
+    start = 0
+    while start < shorter and a[start] == b[start]:
+        start += 1
+    suffix = 0
+    while suffix < shorter - start and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    a, b = a[start:len(a) - suffix], b[start:len(b) - suffix]
+    if len(a) > len(b):
+        a, b = b, a
+    over = limit + 1
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        cur = [over] * (len(b) + 1)
+        cur[0] = i if i <= limit else over
+        ca = a[i - 1]
+        row_min = cur[0]
+        for j in range(lo, hi + 1):
+            cost = prev[j - 1] + (ca != b[j - 1])
+            if prev[j] + 1 < cost:
+                cost = prev[j] + 1
+            if cur[j - 1] + 1 < cost:
+                cost = cur[j - 1] + 1
+            cur[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return over
+        prev = cur
+    return min(prev[len(b)], over)
+
+
+class CompiledAnswers:
+    """한 문제의 정답 목록을 미리 정규화해 둔 객체"""
+    __slots__ = ("source", "exact", "normalized", "token_sets", "fuzzy")
+
+    def __init__(self, answers):
+        self.source = tuple(answers)
+        self.exact = set(answers)
+        self.normalized = {normalize_answer(a) for a in answers}
+        self.normalized.discard("")
+        self.token_sets = {t for t in map(split_tokens, answers) if t}
+        # 편집 거리 후보: (정규화 문자열, 문자 빈도, 숫자/기호, 음절) - 빈도 차이와 자모 편집 거리로 먼저 걸러 냅니다.
+        self.fuzzy = [(n, Counter(n), fixed_chars(n), syllables(n)) for n in self.normalized]
+
+
+class AnswerMatcher:
+    """
+    사용자 답안을 채점하는 클래스
+    문제별 정규화 결과를 한 번만 계산해 두고, 정답 목록이 바뀌면 다시 계산합니다.
+    컴파일 결과는 아이템 ID(문제 본문 해시)로 찾으므로 은행을 다시 읽어 객체가 바뀌어도 재사용됩니다.
+    """
+    MAX_EDITS = 3          # 허용하는 최대 편집 거리 (자모 단위)
+    CHARS_PER_EDIT = 8     # 자모 8개당 1회까지 오타 허용
+
+    def __init__(self):
+        self._compiled = {}
+
+    def compile(self, q_item: dict):
+        answers = tuple(q_item.get("answers", ()))
+        key = item_id(q_item)
+        entry = self._compiled.get(key)
+        if entry is None or entry.source != answers:
+            entry = CompiledAnswers(answers)
+            self._compiled[key] = entry
+        return entry
+
+    def allowed_edits(self, length: int):
+        return min(self.MAX_EDITS, length // self.CHARS_PER_EDIT)
+
+    @instrument.timed("grade")
+    def grade(self, q_item: dict, user_answer: str):
+        """
+        채점 결과를 반환합니다.
+        - 'exact'  : 등록된 정답과 완전히 같음
+        - 'normal' : 공백/따옴표/끝 마침표/대소문자 차이만 있음
+        - 'tokens' : 쉼표로 나열한 항목이 순서만 다름
+        - 'fuzzy'  : 허용 범위 안의 오타 (숫자와 기호는 오타로 보지 않고, 한글은 음절마다 자모 하나까지만)
+        - None     : 오답
+        """
+        entry = self.compile(q_item)
+        if user_answer in entry.exact:
+            return "exact"
+        norm = normalize_answer(user_answer)
+        if not norm:
+            return None
+        if norm in entry.normalized:
+            return "normal"
+        if entry.token_sets:
+            tokens = split_tokens(user_answer)
+            if tokens and tokens in entry.token_sets:
+                return "tokens"
+        norm_counts = norm_fixed = None
+        for candidate, counts, fixed, units in entry.fuzzy:
+            limit = self.allowed_edits(len(candidate))
+            if limit == 0 or abs(len(candidate) - len(norm)) > limit:
+                continue
+            if norm_fixed is None:
+                norm_fixed = fixed_chars(norm)
+            if norm_fixed != fixed:
+                continue
+            if norm_counts is None:
+                norm_counts = Counter(norm)
+            # 문자 빈도 차이의 절반은 편집 거리의 하한입니다.
+            diff = sum(((counts - norm_counts) + (norm_counts - counts)).values())
+            if (diff + 1) // 2 > limit:
+                continue
+            if (bounded_edit_distance(norm, candidate, limit) <= limit
+                    and syllable_edit_distance(syllables(norm), units, limit) <= limit):
+                return "fuzzy"
+        return None
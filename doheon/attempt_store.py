@@ -0,0 +1,365 @@
+# attempt_store.py
+"""
+풀이 기록(시도 이력) 저장소
+
+한 번의 풀이를 (아이템 ID, 시각, 정답 여부, 응답 시간) 한 행으로 보고,
+각 열을 고정 폭 이진 파일에 따로 덧붙여 저장합니다.
+
+    attempt_stats/item.u64     아이템 ID (quiz_ids.item_id의 16진수를 정수로)
+    attempt_stats/ts.u32       풀이 시각 (epoch 초)
+    attempt_stats/correct.u8   정답 여부 (0/1)
+    attempt_stats/ms.u32       응답 시간 (ms, 0은 측정 안 됨)
+    attempt_stats/items.json   아이템 ID → 그룹/문제 요약 (보고서 표시용)
+
+조회할 때는 열 파일을 mmap으로 열어 memoryview로 바로 읽고,
+65536행마다 만들어 둔 구간 집계(rollup.bin)를 합치므로 수백만 건이라도
+새로 덧붙은 끝부분만 행 단위로 훑습니다.
+"""
+import os
+import sys
+import mmap
+import marshal
+import time
+import argparse
+from array import array
+from collections import Counter
+from file_manager import QuizFileManager, write_atomic
+from quiz_ids import item_id
+import instrument
+
+try:
+    import fcntl  # 여러 프로세스(앱/서버)가 동시에 기록할 때 행이 어긋나지 않도록 잠급니다.
+except ImportError:  # Windows
+    fcntl = None
+
+DEFAULT_DIR = "attempt_stats"
+COLUMNS = (("item", "Q", ".u64"), ("ts", "I", ".u32"), ("correct", "B", ".u8"), ("ms", "I", ".u32"))
+DAY = 24 * 60 * 60
+SEGMENT_ROWS = 1 << 16  # 이 행 수마다 구간 집계를 만들어 둠
+ROLLUP_FILE = "rollup.bin"
+ROLLUP_VERSION = (1, marshal.version)
+FLUSH_ROWS = 256  # 이만큼 쌓이면 세션이 끝나기 전이라도 기록
+
+
+class ItemLabelFileManager(QuizFileManager):
+    """아이템 ID → {"group", "question"} 정보를 저장하는 파일 관리 클래스"""
+    KEY = "items"
+
+
+class _Columns:
+    """열 파일들을 mmap으로 연 읽기 전용 뷰 (with 문으로 사용)"""
+
+    def __init__(self, store):
+        self._maps = []
+        self.views = {}
+        files = [(name, code, store.column_path(name, ext)) for name, code, ext in COLUMNS]
+        sizes = [os.path.getsize(path) if os.path.exists(path) else 0 for _, _, path in files]
+        # 기록 도중 중단되어 열 길이가 다르면 가장 짧은 열에 맞춥니다.
+        self.rows = min(size // array(code).itemsize for (_, code, _), size in zip(files, sizes))
+        for (name, code, path), size in zip(files, sizes):
+            if self.rows == 0:
+                self.views[name] = memoryview(array(code))
+                continue
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mm)
+            # 끊긴 행의 일부 바이트가 남아 있으면 cast가 실패하므로 먼저 온전한 행까지만 자릅니다.
+            with memoryview(mm) as raw:
+                self.views[name] = raw[:self.rows * array(code).itemsize].cast(code)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        for view in self.views.values():
+            view.release()
+        for mm in self._maps:
+            mm.close()
+
+
+class AttemptStore:
+    """열 단위 풀이 기록 저장소"""
+
+    def __init__(self, directory=DEFAULT_DIR, flush_rows=FLUSH_ROWS):
+        self.directory = directory
+        self.flush_rows = flush_rows  # None이면 flush()를 부를 때만 기록 (일괄 채점 등)
+        self._rows = {name: array(code) for name, code, _ in COLUMNS}
+        self._labels = {}
+        self.label_file_manager = ItemLabelFileManager(os.path.join(directory, "items.json"))
+
+    def column_path(self, name, ext):
+        return os.path.join(self.directory, name + ext)
+
+    def _lock(self):
+        """여러 프로세스가 열 파일을 함께 고치지 않도록 잡는 잠금 파일 (닫으면 풀림)"""
+        os.makedirs(self.directory, exist_ok=True)
+        lock = open(os.path.join(self.directory, ".lock"), "a")
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def _trim(self):
+        """(잠금 안에서) 기록 도중 중단되어 다른 열보다 길어진 열을 가장 짧은 열에 맞춰 자르고 행 수를 반환합니다."""
+        paths = [(self.column_path(name, ext), array(code).itemsize) for name, code, ext in COLUMNS]
+        sizes = [os.path.getsize(p) if os.path.exists(p) else 0 for p, _ in paths]
+        rows = min(size // itemsize for (_, itemsize), size in zip(paths, sizes))
+        for (path, itemsize), size in zip(paths, sizes):
+            if size != rows * itemsize:
+                with open(path, "r+b") as f:
+                    f.truncate(rows * itemsize)
+        return rows
+
+    # ----- 기록 -----
+    def record(self, q_item, correct, response_ms=0, group=None, ts=None):
+        """풀이 한 건을 버퍼에 추가합니다. 버퍼가 차면 파일에 기록합니다."""
+        qid = item_id(q_item)
+        self._rows["item"].append(int(qid, 16))
+        self._rows["ts"].append(int(ts if ts is not None else time.time()))
+        self._rows["correct"].append(1 if correct else 0)
+        self._rows["ms"].append(max(0, min(int(response_ms), 0xFFFFFFFF)))
+        if qid not in self._labels:
+            self._labels[qid] = {"group": group or "", "question": q_item.get("question", "").strip().split("\n", 1)[0][:80]}
+        if self.flush_rows and len(self._rows["item"]) >= self.flush_rows:
+            self.flush()
+
+    @instrument.timed("attempts.flush")
+    def flush(self):
+        """버퍼에 쌓인 행을 열 파일마다 한 번씩 덧붙입니다."""
+        if not self._rows["item"]:
+            return
+        lock = self._lock()
+        try:
+            self._trim()  # 이전 기록이 중간에 끊겼으면 맞춰서 자름
+            for name, _, ext in COLUMNS:
+                with open(self.column_path(name, ext), "ab") as f:
+                    f.write(self._rows[name].tobytes())
+            if self._labels:
+                labels = self.label_file_manager.load_file() or {}
+                new = {k: v for k, v in self._labels.items() if k not in labels}
+                if new:
+                    labels.update(new)
+                    self.label_file_manager.save_file(labels)
+        finally:
+            lock.close()
+        self._rows = {name: array(code) for name, code, _ in COLUMNS}
+        self._labels = {}
+
+    # ----- 조회 -----
+    def columns(self):
+        """열 파일 뷰. 기록 도중 끊긴 꼬리가 있으면 열기 전에 잘라 냅니다."""
+        if os.path.isdir(self.directory):
+            lock = self._lock()
+            try:
+                self._trim()
+            finally:
+                lock.close()
+        return _Columns(self)
+
+    def labels(self):
+        return self.label_file_manager.load_file() or {}
+
+    def _load_rollups(self, rows):
+        """저장된 구간 집계 목록. 열 파일이 집계보다 짧아졌으면(초기화 등) 처음부터 다시 만듭니다."""
+        try:
+            with open(os.path.join(self.directory, ROLLUP_FILE), "rb") as f:
+                rollups = marshal.loads(f.read())
+            if rollups.get("version") == ROLLUP_VERSION and len(rollups["segments"]) * SEGMENT_ROWS <= rows:
+                return rollups["segments"]
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            pass
+        return []
+
+    def _save_rollups(self, segments):
+        try:
+            write_atomic(os.path.join(self.directory, ROLLUP_FILE),
+                         marshal.dumps({"version": ROLLUP_VERSION, "segments": segments}), fsync=False)
+        except OSError:
+            pass  # 집계는 다시 만들 수 있으므로 저장 실패는 무시합니다.
+
+    @staticmethod
+    def _aggregate(cols, start, end, groups, agg=None, since=None):
+        """
+        start~end 행 중 since(epoch 초) 이후 기록을 집계에 더합니다.
+        {"items": {ID: [시도, 정답]}, "days": {일: [시도, 정답]}, "ms": {그룹: {구간: 수}}}
+        """
+        agg = agg if agg is not None else {"items": {}, "days": {}, "ms": {}}
+        items, days, ms_hist = agg["items"], agg["days"], agg["ms"]
+        v = cols.views
+        for item, ts, ok, ms in zip(v["item"][start:end], v["ts"][start:end], v["correct"][start:end], v["ms"][start:end]):
+            if since is not None and ts < since:
+                continue
+            count = items.get(item)
+            if count is None:
+                count = items[item] = [0, 0]
+            count[0] += 1
+            count[1] += ok
+            count = days.get(ts // DAY)
+            if count is None:
+                count = days[ts // DAY] = [0, 0]
+            count[0] += 1
+            count[1] += ok
+            if ms:
+                hist = ms_hist.setdefault(groups.get(item, ""), {})
+                bucket = ms_bucket(ms)
+                hist[bucket] = hist.get(bucket, 0) + 1
+        return agg
+
+    @staticmethod
+    def _merge(agg, part):
+        for key in ("items", "days"):
+            target = agg[key]
+            for k, (n, c) in part[key].items():
+                count = target.get(k)
+                if count is None:
+                    target[k] = [n, c]
+                else:
+                    count[0] += n
+                    count[1] += c
+        for group, hist in part["ms"].items():
+            target = agg["ms"].setdefault(group, {})
+            for bucket, n in hist.items():
+                target[bucket] = target.get(bucket, 0) + n
+
+    @instrument.timed("attempts.summary")
+    def summary(self, since=None):
+        """
+        since(epoch 초) 이후 기록 전체의 집계를 반환합니다.
+        SEGMENT_ROWS 행마다 집계를 미리 만들어 rollup.bin에 저장해 두고,
+        조회 때는 구간 집계를 합친 뒤 아직 집계되지 않은 끝부분과 since 경계에 걸친 구간만 직접 훑습니다.
+        - 앱과 서버가 함께 기록하면 행이 시간순이 아닐 수 있으므로 시작 행을 이분 탐색하지 않고,
+          구간 집계의 날짜 범위로 구간 전체를 넣을지/뺄지/훑을지 정합니다.
+        """
+        labels = self.labels()
+        groups = {int(k, 16): v.get("group", "") for k, v in labels.items()}
+        with self.columns() as cols:
+            rows = cols.rows
+            segments = self._load_rollups(rows)
+            full = rows // SEGMENT_ROWS
+            if len(segments) < full:
+                for i in range(len(segments), full):
+                    segments.append(self._aggregate(cols, i * SEGMENT_ROWS, (i + 1) * SEGMENT_ROWS, groups))
+                self._save_rollups(segments)
+            since = int(since) if since else None
+            agg = {"items": {}, "days": {}, "ms": {}}
+            for i, segment in enumerate(segments):
+                first_day, last_day = min(segment["days"]), max(segment["days"])
+                if since is None or first_day * DAY >= since:
+                    self._merge(agg, segment)
+                elif (last_day + 1) * DAY > since:
+                    self._aggregate(cols, i * SEGMENT_ROWS, (i + 1) * SEGMENT_ROWS, groups, agg, since)
+            self._aggregate(cols, full * SEGMENT_ROWS, rows, groups, agg, since)
+        return agg
+
+    def item_stats(self, since=None):
+        """아이템 ID → (시도 수, 정답 수)"""
+        return {f"{k:016x}": (n, c) for k, (n, c) in self.summary(since)["items"].items()}
+
+    def group_accuracy(self, since=None, item_stats=None):
+        """그룹 → (시도 수, 정답 수, 정답률), 시도 수가 많은 순"""
+        labels = self.labels()
+        groups = {}
+        for qid, (n, c) in (item_stats or self.item_stats(since)).items():
+            total = groups.setdefault(labels.get(qid, {}).get("group", ""), [0, 0])
+            total[0] += n
+            total[1] += c
+        return sorted(((g, n, c, c / n) for g, (n, c) in groups.items()), key=lambda x: -x[1])
+
+    def hardest(self, limit=10, min_attempts=3, since=None, item_stats=None):
+        """정답률이 낮은 문제 [(ID, 시도 수, 정답 수, 정답률), ...]"""
+        stats = [(qid, n, c, c / n) for qid, (n, c) in (item_stats or self.item_stats(since)).items()
+                 if n >= min_attempts]
+        stats.sort(key=lambda x: (x[3], -x[1]))
+        return stats[:limit]
+
+    def response_percentiles(self, percentiles=(50, 90, 99), group=None, since=None, summary=None):
+        """응답 시간(ms) 백분위수 {백분위: ms}. group을 주면 해당 그룹 문제만 (오차 약 1.5%)"""
+        hists = (summary or self.summary(since))["ms"]
+        hist = Counter()
+        for name, counts in hists.items():
+            if group is None or name == group:
+                hist.update(counts)
+        total = sum(hist.values())
+        if not total:
+            return {}
+        result, seen, buckets = {}, 0, sorted(hist.items())
+        targets = sorted(percentiles)
+        for bucket, n in buckets:
+            seen += n
+            while targets and seen > total * targets[0] / 100:
+                result[targets.pop(0)] = bucket_value(bucket)
+        for p in targets:
+            result[p] = bucket_value(buckets[-1][0])
+        return {p: result[p] for p in percentiles}
+
+    def trend(self, days=14, now=None, summary=None):
+        """최근 days일의 날짜별 (epoch 일, 시도 수, 정답 수), 오래된 날부터"""
+        now = int(now if now is not None else time.time())
+        first_day = now // DAY - days + 1
+        by_day = (summary or self.summary(first_day * DAY))["days"]
+        return [(day, *by_day[day]) for day in range(first_day, first_day + days) if day in by_day]
+
+    def total(self):
+        with self.columns() as cols:
+            return cols.rows, sum(cols.views["correct"])
+
+
+def ms_bucket(ms):
+    """응답 시간을 로그 구간으로 (128ms 미만은 그대로, 그 이상은 상위 7비트만 남김)"""
+    bits = ms.bit_length()
+    if bits <= 7:
+        return ms
+    return (bits << 7) | (ms >> (bits - 7))
+
+
+def bucket_value(bucket):
+    """ms_bucket의 구간 대푯값(ms)"""
+    if bucket < 128:
+        return bucket
+    bits, top = bucket >> 7, bucket & 127
+    return ((top << 1) | 1) << (bits - 8)
+
+
+def print_report(store, limit=10, since=None, group=None):
+    """풀이 통계 보고서를 출력합니다."""
+    summary = store.summary(since)
+    item_stats = {f"{k:016x}": (n, c) for k, (n, c) in summary["items"].items()}
+    rows = sum(n for n, _ in item_stats.values())
+    if not rows:
+        print("풀이 기록이 없습니다.")
+        return
+    correct = sum(c for _, c in item_stats.values())
+    print(f"\n--- 풀이 통계 (총 {rows}회, 정답률 {correct / rows * 100:.1f}%) ---")
+    labels = store.labels()
+
+    print("\n[그룹별 정답률]")
+    for name, n, c, rate in store.group_accuracy(item_stats=item_stats):
+        print(f"  {name or '(기본)'}: {rate * 100:.1f}% ({c}/{n})")
+
+    print(f"\n[어려운 문제 상위 {limit}개]")
+    for rank, (qid, n, c, rate) in enumerate(store.hardest(limit, item_stats=item_stats), 1):
+        print(f"  {rank:2d}. {labels.get(qid, {}).get('question', qid)}  ({rate * 100:.0f}%, {c}/{n})")
+
+    percentiles = store.response_percentiles(group=group, summary=summary)
+    if percentiles:
+        print("\n[응답 시간]" + (f" ({group})" if group else ""))
+        print("  " + ", ".join(f"p{p} {ms / 1000:.1f}초" for p, ms in percentiles.items()))
+
+    days = store.trend()
+    if days:
+        print("\n[최근 14일 추이]")
+        for day, n, c in days:
+            print(f"  {time.strftime('%m-%d', time.localtime(day * DAY))}: {n}회, 정답률 {c / n * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="풀이 기록 통계를 출력합니다.")
+    arg_parser.add_argument("--dir", default=DEFAULT_DIR, help="풀이 기록 폴더")
+    arg_parser.add_argument("--top", type=int, default=10, help="어려운 문제 출력 개수")
+    arg_parser.add_argument("--days", type=int, help="최근 N일 기록만 집계")
+    arg_parser.add_argument("--group", help="응답 시간 백분위를 볼 그룹")
+    instrument.add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    if not os.path.isdir(args.dir):
+        sys.exit(f"풀이 기록 폴더가 없습니다: {args.dir}")
+    since = time.time() - args.days * DAY if args.days else None
+    instrument.run(lambda: print_report(AttemptStore(args.dir), args.top, since, args.group), args)
@@ -0,0 +1,137 @@
+# bank_cache.py
+import os
+import sys
+import json
+import time
+import gc
+import marshal
+import struct
+import hashlib
+import tempfile
+
+CACHE_SUFFIX = ".cache"
+CACHE_MAGIC = b"QBC1"
+HEADER_LEN = struct.Struct("<I")  # 캐시 구조: MAGIC | 헤더 길이 | 헤더(marshal) | 문서(marshal)
+# marshal 형식은 파이썬 버전마다 다를 수 있으므로 버전을 캐시 키에 포함합니다.
+CACHE_VERSION = (1, marshal.version, sys.version_info[:2])
+
+
+def cache_path(source_path):
+    """원본 파일 옆에 두는 캐시 파일 경로 (예: quiz.json → quiz.json.cache)"""
+    return source_path + CACHE_SUFFIX
+
+
+def _digest(raw: bytes):
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _read_header(f):
+    """캐시 파일 앞부분의 헤더만 읽습니다. 형식이 맞지 않으면 ValueError를 냅니다."""
+    prefix = f.read(len(CACHE_MAGIC) + HEADER_LEN.size)
+    if len(prefix) != len(CACHE_MAGIC) + HEADER_LEN.size or not prefix.startswith(CACHE_MAGIC):
+        raise ValueError("캐시 형식이 아닙니다.")
+    (length,) = HEADER_LEN.unpack(prefix[len(CACHE_MAGIC):])
+    return marshal.loads(f.read(length))
+
+
+def write_atomic(path, raw: bytes, fsync=True):
+    """
+    임시 파일에 먼저 쓰고 fsync 한 뒤 교체합니다. 중간에 중단되어도 기존 파일이 손상되지 않습니다.
+    기존 파일의 권한은 유지하며, 실패하면 임시 파일을 지우고 OSError를 그대로 냅니다.
+    다시 만들 수 있는 파일(캐시, 집계)은 fsync=False로 디스크 동기화를 생략합니다.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if os.path.exists(path): # 기존 파일 권한 유지
+            os.chmod(tmp_path, os.stat(path).st_mode)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def store(source_path, document, raw: bytes = None):
+    """
+    원본 파일에 해당하는 캐시를 저장합니다.
+    raw는 원본 파일의 바이트이며, 없으면 파일에서 다시 읽습니다.
+    """
+    try:
+        if raw is None:
+            with open(source_path, "rb") as f:
+                raw = f.read()
+        stat = os.stat(source_path)
+        header = {"version": CACHE_VERSION, "mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": _digest(raw)}
+        header_raw = marshal.dumps(header)
+        write_atomic(cache_path(source_path),
+                     CACHE_MAGIC + HEADER_LEN.pack(len(header_raw)) + header_raw + marshal.dumps(document), fsync=False)
+    except OSError:
+        pass  # 캐시는 없어도 동작에 문제가 없으므로 저장 실패는 무시합니다.
+
+
+def load_json(source_path):
+    """
+    JSON 파일을 캐시를 거쳐 불러옵니다.
+    - 수정 시각과 크기가 캐시와 같으면 JSON을 파싱하지 않고 캐시를 사용합니다.
+    - 수정 시각만 바뀌었으면 내용 해시를 비교해 같을 때 캐시를 재사용합니다.
+    - 원본이 바뀌었거나 캐시가 손상되었으면 JSON을 파싱하고 캐시를 다시 만듭니다.
+    원본 파일이 없거나 JSON 형식이 잘못된 경우의 예외는 json.load와 같습니다.
+    """
+    stat = os.stat(source_path)
+    raw = None
+    gc_enabled = gc.isenabled()
+    gc.disable()  # 작은 객체를 대량으로 만드는 동안 순환 GC가 도는 비용을 줄입니다.
+    try:
+        with open(cache_path(source_path), "rb") as f:
+            header = _read_header(f)
+            if header.get("version") == CACHE_VERSION and header.get("size") == stat.st_size:
+                if header.get("mtime") == stat.st_mtime_ns:
+                    return marshal.loads(f.read())
+                # 수정 시각만 바뀐 경우 내용이 같은지 해시로 확인합니다.
+                with open(source_path, "rb") as src:
+                    raw = src.read()
+                if header.get("hash") == _digest(raw):
+                    document = marshal.loads(f.read())
+                    store(source_path, document, raw)  # 새 수정 시각으로 갱신
+                    return document
+    except Exception:
+        pass  # 캐시가 없거나 손상된 경우 원본에서 다시 만듭니다.
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    if raw is None:
+        with open(source_path, "rb") as f:
+            raw = f.read()
+    document = json.loads(raw.decode("utf-8"))
+    store(source_path, document, raw)
+    return document
+
+
+def _measure(path, repeat=5):
+    """JSON 파싱(cold)과 캐시 로드(warm) 시간을 ms 단위로 측정합니다."""
+    cold = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)
+        cold.append((time.perf_counter() - start) * 1000)
+    load_json(path)  # 캐시 준비
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load_json(path)
+        warm.append((time.perf_counter() - start) * 1000)
+    return min(cold), min(warm)
+
+
+if __name__ == "__main__":
+    # python bank_cache.py quiz.json ../quiz_groups/*.json
+    for path in sys.argv[1:] or ["quiz.json"]:
+        cold, warm = _measure(path)
+        print(f"{path}: cold(JSON) {cold:.2f}ms / warm(cache) {warm:.2f}ms / {cold / max(warm, 1e-9):.1f}x")
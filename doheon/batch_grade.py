@@ -0,0 +1,194 @@
+# batch_grade.py
+"""
+답안지 일괄 채점
+
+여러 학생의 답안(JSONL 또는 CSV)을 한 번에 채점합니다.
+    JSONL: {"user": "홍길동", "id": "3224380af0611c67", "answer": "..."}   (id 대신 "question": 문제 본문도 가능)
+    CSV  : user,id,answer  또는  user,question,answer  (헤더 필수)
+
+- 채점 전에 선택한 은행의 정답을 모두 컴파일해 두고, 답안은 한 줄씩 읽어 바로 채점합니다.
+- 답안별 결과는 채점하는 대로 answers.csv에 쓰고, 학생별/문제별 집계는 마지막에 students.csv, questions.csv로 씁니다.
+- 채점이 모두 끝난 뒤 wrong_count와 풀이 이력을 한 번에 저장합니다. (--dry-run이면 저장하지 않음)
+- 그룹 파일(--group)은 손으로 작성해 관리하는 파일이므로 고쳐 쓰지 않고, 결과는 풀이 이력에만 남깁니다.
+"""
+import os
+import csv
+import sys
+import json
+import time
+import argparse
+import instrument
+from quiz_ids import question_id, item_id
+from quiz_item import to_items
+from answer_matcher import AnswerMatcher
+from attempt_store import AttemptStore, DEFAULT_DIR
+from file_manager import QuizFileManager, open_storage
+
+RESULT_LABELS = {True: "정답", False: "오답", None: "문제 없음"}
+
+
+def iter_sheet(path):
+    """답안지 파일에서 (줄 번호, 학생, 문제 키, 답안)을 차례로 내놓습니다. 문제 키는 ID 또는 본문입니다."""
+    if path.lower().endswith(".csv"):
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for line_no, row in enumerate(csv.DictReader(f), 2):
+                yield line_no, (row.get("user") or "").strip(), row.get("id") or row.get("question") or "", row.get("answer") or ""
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"[경고] {path}:{line_no} JSON 형식 오류 → 건너뜀")
+                continue
+            yield line_no, str(row.get("user", "")).strip(), row.get("id") or row.get("question") or "", str(row.get("answer", ""))
+
+
+class BatchGrader:
+    """은행 하나에 대한 답안 일괄 채점기"""
+
+    def __init__(self, items, group):
+        self.items = items
+        self.group = group
+        self.by_id = {}
+        for q_item in items:
+            self.by_id.setdefault(item_id(q_item), q_item)
+        self.matcher = AnswerMatcher()
+        for q_item in items:  # 정답 집합을 미리 컴파일
+            self.matcher.compile(q_item)
+        self.students = {}   # 학생 → [답안 수, 정답 수]
+        self.questions = {}  # 문제 ID → [답안 수, 정답 수]
+        self.wrong = {}      # 문제 ID → 이번 채점의 오답 수
+        self.graded = []     # (문제, 정답 여부) - 풀이 이력 저장용
+        self.unknown = 0
+
+    def resolve(self, key):
+        key = str(key)
+        q_item = self.by_id.get(key)
+        return q_item if q_item is not None else self.by_id.get(question_id(key))
+
+    def grade(self, user, key, answer):
+        """답안 하나를 채점하고 (문제, 정답 여부, 일치 방식)을 반환합니다. 문제를 찾지 못하면 (None, None, None)"""
+        q_item = self.resolve(key)
+        if q_item is None:
+            self.unknown += 1
+            return None, None, None
+        match = self.matcher.grade(q_item, answer.strip())
+        correct = bool(match)
+        qid = item_id(q_item)
+        for table, name in ((self.students, user), (self.questions, qid)):
+            count = table.setdefault(name, [0, 0])
+            count[0] += 1
+            count[1] += correct
+        if not correct:
+            self.wrong[qid] = self.wrong.get(qid, 0) + 1
+        self.graded.append((q_item, correct))
+        return q_item, correct, match
+
+    @instrument.timed("batch.grade")
+    def grade_sheets(self, paths, out_dir):
+        """답안지들을 채점하며 답안별 결과를 answers.csv에 바로 씁니다."""
+        with open(os.path.join(out_dir, "answers.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["user", "id", "answer", "result", "match", "source"])
+            for path in paths:
+                for line_no, user, key, answer in iter_sheet(path):
+                    q_item, correct, match = self.grade(user, key, answer)
+                    writer.writerow([user, item_id(q_item) if q_item else key, answer,
+                                     RESULT_LABELS[correct], match or "", f"{os.path.basename(path)}:{line_no}"])
+
+    def write_summaries(self, out_dir):
+        with open(os.path.join(out_dir, "students.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["user", "answered", "correct", "score"])
+            for user, (n, c) in sorted(self.students.items()):
+                writer.writerow([user, n, c, f"{c / n * 100:.1f}"])
+        with open(os.path.join(out_dir, "questions.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "question", "answered", "correct", "rate"])
+            for qid, (n, c) in sorted(self.questions.items(), key=lambda kv: kv[1][1] / kv[1][0]):
+                question = self.by_id[qid].get("question", "").strip().split("\n", 1)[0]
+                writer.writerow([qid, question, n, c, f"{c / n * 100:.1f}"])
+
+    @instrument.timed("batch.commit")
+    def commit(self, manager, attempts):
+        """
+        채점 결과를 한 번에 저장합니다.
+        - 오답이 나온 문제의 wrong_count를 더하고 은행을 한 번만 저장합니다. (manager가 None이면 은행은 저장하지 않음)
+        - 풀이 이력은 모아 두었다가 한 번의 flush로 기록합니다.
+        """
+        changed = []
+        for qid, delta in (self.wrong.items() if manager is not None else ()):
+            q_item = self.by_id[qid]
+            q_item["wrong_count"] = q_item.get("wrong_count", 0) + delta
+            changed.append(q_item)
+        if changed:
+            if hasattr(manager, "update_items"):
+                saved = manager.update_items(changed)
+            else:
+                saved = manager.save_file(self.items)
+            if not saved:
+                return False
+        now = time.time()
+        for q_item, correct in self.graded:
+            attempts.record(q_item, correct, 0, self.group, now)
+        attempts.flush()
+        return True
+
+
+def load_bank(quiz_file, groups_dir, group):
+    """
+    채점할 은행의 (저장소, 아이템 목록, 그룹 이름)을 반환합니다.
+    그룹 파일은 읽기만 하므로 저장소 자리에 None을 돌려줍니다.
+    """
+    if group:
+        path = os.path.join(groups_dir, group + ".json")
+        if not os.path.exists(path):
+            sys.exit(f"그룹 파일을 찾을 수 없습니다: {path}")
+        return None, to_items(QuizFileManager(path).load_file()), group
+    manager = open_storage(quiz_file)
+    group = os.path.splitext(os.path.basename(quiz_file))[0]
+    return manager, to_items(manager.load_file()), group
+
+
+def main(args):
+    manager, items, group = load_bank(args.quiz, args.groups, args.group)
+    if not items:
+        sys.exit("채점할 문제가 없습니다.")
+    os.makedirs(args.out, exist_ok=True)
+    started = time.perf_counter()
+    grader = BatchGrader(items, group)
+    grader.grade_sheets(args.sheets, args.out)
+    grader.write_summaries(args.out)
+
+    total = sum(n for n, _ in grader.students.values())
+    correct = sum(c for _, c in grader.students.values())
+    print(f"[채점] 학생 {len(grader.students)}명, 답안 {total}건, 정답 {correct}건"
+          + (f", 문제를 찾지 못한 답안 {grader.unknown}건" if grader.unknown else "")
+          + f" ({time.perf_counter() - started:.2f}초)")
+    print(f"[결과] '{args.out}' 폴더에 answers.csv, students.csv, questions.csv를 저장했습니다.")
+    if args.dry_run:
+        print("[알림] --dry-run: 오답 횟수와 풀이 이력은 저장하지 않았습니다.")
+    elif grader.commit(manager, AttemptStore(args.attempts, flush_rows=None)):
+        if manager is None:
+            print(f"[저장] 풀이 이력 {len(grader.graded)}건 (그룹 파일은 고치지 않으므로 오답 횟수는 풀이 이력에만 남습니다)")
+        else:
+            print(f"[저장] 오답 횟수 갱신 {len(grader.wrong)}문제, 풀이 이력 {len(grader.graded)}건")
+    else:
+        print("[오류] 오답 횟수를 저장하지 못했습니다. 풀이 이력도 기록하지 않았습니다.")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="답안지(JSONL/CSV)를 일괄 채점합니다.")
+    arg_parser.add_argument("sheets", nargs="+", help="답안지 파일 (.jsonl 또는 .csv)")
+    arg_parser.add_argument("--group", help="채점할 그룹 이름 (생략하면 기본 퀴즈 파일)")
+    arg_parser.add_argument("--quiz", default="quiz.json", help="기본 퀴즈 파일")
+    arg_parser.add_argument("--groups", default=os.path.join("..", "quiz_groups"), help="그룹 퀴즈 폴더")
+    arg_parser.add_argument("--out", default="grading_results", help="결과를 저장할 폴더")
+    arg_parser.add_argument("--attempts", default=DEFAULT_DIR, help="풀이 이력 폴더")
+    arg_parser.add_argument("--dry-run", action="store_true", help="채점 결과만 쓰고 은행/이력은 저장하지 않음")
+    instrument.add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    instrument.run(lambda: main(args), args)
@@ -0,0 +1,233 @@
+# benchmark.py
+"""
+퀴즈 앱 주요 경로의 성능 측정 스크립트
+
+합성 한국어 문제 은행과 가져오기 파일을 만들어 아래 경로를 비대화식으로 실행하고,
+실행 시간 / 최대 메모리(--memory) / 파일 쓰기 바이트를 JSON 보고서로 저장합니다.
+  - QuizFileManager.load_file (JSON 파싱, 캐시) / save_file
+  - QuizParser.iter_file_records
+  - add_quiz_from_file (중복 검사 + 저장)
+  - play_quizzes (답안당 저장 비용)
+  - export_wrong_note_markdown
+  - quiz.py load_quiz
+
+사용 예:
+  python benchmark.py --sizes 1000 10000 100000 --output report.json
+  python benchmark.py --sizes 1000 --compare report.json
+"""
+import os
+import io
+import sys
+import json
+import time
+import random
+import shutil
+import builtins
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+import importlib.util
+
+from file_manager import QuizFileManager
+from quiz_parser import QuizParser
+from quiz_core import QuizApp
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORDS = ("통신", "데이터", "표준", "프로토콜", "네트워크", "전송", "매체", "신호", "정보", "교류",
+         "설계", "요구사항", "분석", "특허", "기술", "회로", "구현", "검증", "시험", "품질",
+         "관리", "보안", "인증", "서비스", "시스템", "구조", "모델", "계층", "기능", "성능")
+PARTICLES = ("은", "는", "이", "가", "을", "를", "의", "에", "와", "로")
+
+
+def _phrase(rnd: random.Random, n_words: int):
+    return " ".join(rnd.choice(WORDS) + rnd.choice(PARTICLES) for _ in range(n_words))
+
+
+def make_items(size: int, seed=0):
+    """재현 가능한 합성 문제 목록을 만듭니다. (같은 seed → 같은 결과)"""
+    rnd = random.Random(seed)
+    items = []
+    for i in range(size):
+        item = {"question": f"{i}번. {_phrase(rnd, rnd.randint(4, 12))} 무엇인가?",
+                "answers": [_phrase(rnd, rnd.randint(1, 4)) for _ in range(rnd.randint(1, 2))],
+                "wrong_count": rnd.choice((0, 0, 0, 1, 2, 5))}
+        if rnd.random() < 0.2:
+            item["hint"] = _phrase(rnd, 2)
+        items.append(item)
+    return items
+
+
+def write_import_file(path, items):
+    """':=' / ':!' / ':+' 형식의 가져오기 파일을 만듭니다."""
+    with open(path, "w", encoding="utf-8") as f:
+        for item in items:
+            f.write(item["question"] + "\n")
+            f.write(":= " + " || ".join(item["answers"]) + "\n")
+            if item.get("hint"):
+                f.write(":! " + item["hint"] + "\n")
+            f.write(":+\n\n")
+
+
+def _written_bytes():
+    """지금까지 프로세스가 쓴 바이트 수 (리눅스 /proc 기준, 없으면 None)"""
+    try:
+        with open("/proc/self/io", "r") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+@contextlib.contextmanager
+def scripted_input(answers):
+    """input()을 미리 정한 답안으로 대체하고 화면 출력은 버립니다."""
+    it = iter(answers)
+    original = builtins.input
+    builtins.input = lambda prompt="": next(it)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original
+
+
+def measure(case: str, size: int, fn, track_memory=False):
+    """fn을 한 번 실행하여 결과 항목(dict)을 만듭니다. fn은 추가 지표(dict)를 돌려줄 수 있습니다."""
+    if track_memory:
+        tracemalloc.start()
+    before = _written_bytes()
+    start = time.perf_counter()
+    extra = fn() or {}
+    seconds = time.perf_counter() - start
+    after = _written_bytes()
+    peak = None
+    if track_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    result = {"case": case, "size": size, "seconds": round(seconds, 6), "peak_bytes": peak,
+              "bytes_written": after - before if before is not None and after is not None else None}
+    result.update(extra)
+    print(f"{case:<28} {size:>9,} {seconds * 1000:>12.2f}ms" +
+          (f"  peak {peak / 1024 / 1024:.1f}MiB" if peak is not None else ""), file=sys.stderr)
+    return result
+
+
+def _make_app(work_dir):
+    return QuizApp(quiz_file=os.path.join(work_dir, "quiz.json"),
+                   wrong_note_file=os.path.join(work_dir, "wrong_quiz_note.md"),
+                   last_failed_file=os.path.join(work_dir, "last_failed.json"),
+                   review_state_file=os.path.join(work_dir, "review_state.json"),
+                   groups_dir=os.path.join(work_dir, "quiz_groups"),
+                   attempts_dir=os.path.join(work_dir, "attempt_stats"))
+
+
+def _load_quiz_module():
+    spec = importlib.util.spec_from_file_location("quiz_cli", os.path.join(ROOT_DIR, "quiz.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_size(size: int, work_dir: str, track_memory=False, answers_per_session=200, groups=10):
+    results = []
+    items = make_items(size)
+    quiz_path = os.path.join(work_dir, "quiz.json")
+    manager = QuizFileManager(quiz_path)
+
+    def save():
+        manager.save_file(items)
+        return {"file_bytes": os.path.getsize(quiz_path)}
+
+    results.append(measure("file.save", size, save, track_memory))
+    os.remove(quiz_path + ".cache")
+    results.append(measure("file.load.cold", size, lambda: {"items": len(manager.load_file())}, track_memory))
+    results.append(measure("file.load.warm", size, lambda: {"items": len(manager.load_file())}, track_memory))
+
+    # 가져오기 파일: 절반은 새 문제, 나머지는 기존 문제(중복 또는 정답 추가)
+    import_items = make_items(size // 2, seed=1) + [
+        dict(item, answers=item["answers"] + ["추가 정답"]) if i % 2 else item
+        for i, item in enumerate(items[: size - size // 2])]
+    import_path = os.path.join(work_dir, "new_quiz.txt")
+    write_import_file(import_path, import_items)
+    parser = QuizParser()
+    results.append(measure("parser.iter_file_records", size,
+                           lambda: {"records": sum(1 for _ in parser.iter_file_records(import_path))}, track_memory))
+
+    app = _make_app(work_dir)
+    with scripted_input(()):
+        results.append(measure("import.add_quiz_from_file", size,
+                               lambda: app.add_quiz_from_file(import_path), track_memory))
+
+    # 답안 제출: 정답/오답을 번갈아 입력 (저널 기록 + 복습 일정 갱신)
+    n_answers = min(answers_per_session, len(app.quiz_data))
+    session = app.quiz_data[:n_answers]
+    answers = [q["answers"][0] if i % 2 else "오답" for i, q in enumerate(session)]
+    random.seed(0)
+    with scripted_input(answers):
+        result = measure("play.answers", size, lambda: app.play_quizzes(list(session)), track_memory)
+    result["answers"] = n_answers
+    result["seconds_per_answer"] = round(result["seconds"] / max(n_answers, 1), 6)
+    results.append(result)
+    results.append(measure("play.session_compaction", size, lambda: {"saved": app.save_bank()}, track_memory))
+
+    with scripted_input(()):
+        results.append(measure("export.wrong_note_markdown", size, app.export_wrong_note_markdown, track_memory))
+
+    # quiz.py: 그룹 파일 여러 개로 나누어 저장한 뒤 전체 로드
+    groups_dir = os.path.join(work_dir, "quiz_groups")
+    os.makedirs(groups_dir, exist_ok=True)
+    chunk = max(1, size // groups)
+    for g in range(0, size, chunk):
+        QuizFileManager(os.path.join(groups_dir, f"그룹{g // chunk:03d}.json")).save_file(items[g:g + chunk])
+    for name in os.listdir(groups_dir):
+        if name.endswith(".cache"):
+            os.remove(os.path.join(groups_dir, name))
+    quiz_module = _load_quiz_module()
+    results.append(measure("quiz_py.load_quiz.cold", size,
+                           lambda: {"groups": len(quiz_module.load_quiz(groups_dir))}, track_memory))
+    results.append(measure("quiz_py.load_quiz.warm", size,
+                           lambda: {"groups": len(quiz_module.load_quiz(groups_dir))}, track_memory))
+    return results
+
+
+def compare(report, baseline):
+    """이전 보고서 대비 시간 변화를 출력합니다."""
+    old = {(r["case"], r["size"]): r for r in baseline.get("results", [])}
+    print(f"{'case':<28} {'size':>9} {'before':>12} {'after':>12} {'ratio':>7}")
+    for r in report["results"]:
+        prev = old.get((r["case"], r["size"]))
+        if prev is None:
+            continue
+        ratio = r["seconds"] / prev["seconds"] if prev["seconds"] else float("inf")
+        print(f"{r['case']:<28} {r['size']:>9,} {prev['seconds'] * 1000:>10.2f}ms {r['seconds'] * 1000:>10.2f}ms {ratio:>6.2f}x")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="퀴즈 앱 성능 측정")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                            help="합성 문제 은행 크기 (1000 ~ 1000000)")
+    arg_parser.add_argument("--memory", action="store_true", help="tracemalloc으로 최대 메모리 측정 (느려짐)")
+    arg_parser.add_argument("--output", default="benchmark_report.json", help="결과 JSON 경로")
+    arg_parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = arg_parser.parse_args()
+
+    report = {"python": platform.python_version(), "platform": platform.platform(),
+              "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": []}
+    for size in args.sizes:
+        work_dir = tempfile.mkdtemp(prefix="quiz_bench_")
+        try:
+            report["results"].extend(run_size(size, work_dir, args.memory))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과를 '{args.output}'에 저장했습니다.", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
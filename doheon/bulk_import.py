@@ -0,0 +1,164 @@
+# bulk_import.py
+import os
+import sys
+import json
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from quiz_parser import QuizParser
+from quiz_ids import question_id
+
+SOURCE_EXTENSIONS = (".txt", ".json")
+
+
+def collect_sources(target: str):
+    """폴더이면 그 안의 .txt/.json 파일을, 아니면 glob 패턴에 맞는 파일을 이름순으로 반환합니다."""
+    if os.path.isdir(target):
+        paths = [os.path.join(target, name) for name in os.listdir(target)]
+    else:
+        paths = glob.glob(target)
+    return sorted(p for p in paths if os.path.isfile(p) and p.lower().endswith(SOURCE_EXTENSIONS))
+
+
+def parse_source(path: str):
+    """
+    파일 하나를 파싱합니다. (작업 프로세스에서 실행)
+    반환값: (경로, [(문제, 정답 목록, 힌트, 시작 줄, 끝 줄), ...], 오류 메시지 또는 None)
+    - 오류가 나면 그때까지 읽은 레코드도 함께 돌려주지만, 가져오기는 그 파일 전체를 건너뜁니다.
+    - .json의 항목 중 형식이 잘못된 것(문자열이 아닌 본문 등)은 빈 레코드로 바꿔 건너뜀으로 집계합니다.
+    """
+    records = []
+    try:
+        if path.lower().endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            items = data.get("quiz", []) if isinstance(data, dict) else None
+            if not isinstance(items, list):
+                return path, records, "\"quiz\" 목록이 없습니다."
+            for item in items:
+                records.append(_json_record(item))
+        else:
+            for record in QuizParser().iter_file_records(path):
+                if record.question or record.answers or record.hint:
+                    records.append(tuple(record))
+    except Exception as e:
+        return path, records, str(e)
+    return path, records, None
+
+
+def _json_record(item):
+    """그룹 .json 항목 하나를 레코드로 바꿉니다. 형식이 잘못되었으면 건너뛸 빈 레코드"""
+    if not isinstance(item, dict):
+        return "", [], None, None, None
+    question, answers, hint = item.get("question"), item.get("answers"), item.get("hint")
+    if not isinstance(question, str) or not isinstance(answers, list):
+        return "", [], None, None, None
+    return (question.strip(), [a for a in answers if isinstance(a, str)],
+            hint if isinstance(hint, str) else None, None, None)
+
+
+def parse_sources(paths, workers=None):
+    """
+    여러 파일을 프로세스 풀에서 병렬로 파싱하고 진행 상황을 출력합니다.
+    결과는 완료 순서와 관계없이 경로 이름순으로 돌려줍니다.
+    """
+    results = {}
+    if len(paths) <= 1 or workers == 1:
+        for done, path in enumerate(paths, 1):
+            results[path] = parse_source(path)
+            print(f"[{done}/{len(paths)}] {path} ({len(results[path][1])}문항)")
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(parse_source, path) for path in paths]
+            for done, future in enumerate(as_completed(futures), 1):
+                path, records, error = future.result()
+                results[path] = (path, records, error)
+                print(f"[{done}/{len(paths)}] {path} ({len(records)}문항)")
+    return [results[path] for path in paths]
+
+
+def bulk_import(app, target: str, workers=None):
+    """
+    폴더/패턴에 해당하는 모든 파일을 병렬로 파싱한 뒤 파일 이름순으로 문제 은행에 병합하고,
+    변경이 있으면 한 번만 저장합니다. 충돌 목록과 요약을 반환합니다.
+    - 병합 도중 예외가 나거나 저장에 실패하면 메모리에 반영한 변경을 모두 되돌립니다.
+    - 읽는 도중 오류가 난 파일은 앞부분만 가져오지 않고 파일 전체를 건너뜁니다.
+    - 같은 문제는 정답을 합집합으로 병합합니다.
+    - 같은 문제의 힌트가 서로 다르거나, 정답이 전혀 겹치지 않으면 충돌로 보고합니다.
+    - 본문이 조금 다른 유사 문제(MinHash/LSH)는 새 문제로 저장하되 따로 보고합니다.
+    """
+    paths = collect_sources(target)
+    if not paths:
+        print(f"[오류] 가져올 파일이 없습니다: {target}")
+        return {"summary": {}, "conflicts": []}
+    print(f"\n[알림] 파일 {len(paths)}개를 파싱합니다...")
+
+    app._begin_import()
+    summary = {"new": 0, "merged": 0, "duplicate": 0, "skip": 0, "error": 0}
+    conflicts = []
+    origins = {}  # 문제 ID → 처음 나온 위치 (충돌 보고용)
+    try:
+        for path, records, error in parse_sources(paths, workers):
+            if error:
+                summary["error"] += 1
+                print(f"[오류] {path}: {error}")
+                print(f"[알림] 이 파일에서 읽은 {len(records)}문항은 가져오지 않습니다.")
+                continue
+            for question, answers, hint, start, _ in records:
+                where = f"{path}:{start}" if start else path
+                existing = app.find_item(question) if question else None
+                if existing and answers:
+                    qid = question_id(question)
+                    first = origins.get(qid, "기존 은행")
+                    if hint and existing.get("hint") and existing["hint"] != hint:
+                        conflicts.append({"question": question, "type": "hint",
+                                          "first": first, "second": where,
+                                          "values": [existing["hint"], hint]})
+                    if not set(answers) & set(existing.get("answers", [])):
+                        conflicts.append({"question": question, "type": "answers",
+                                          "first": first, "second": where,
+                                          "values": [list(existing.get("answers", [])), answers]})
+                status, _ = app._merge_item(question, answers, hint)
+                summary[status] += 1
+                if status == "new":
+                    origins[question_id(question)] = where
+    except Exception as e:
+        app._rollback_import()
+        print(f"[오류] 가져오기 중 예외 발생: {e}")
+        print("[알림] 이번에 불러온 문제는 저장하지 않았습니다.")
+        summary["error"] += 1
+        return {"summary": summary, "conflicts": [], "similar": []}
+
+    if not app._commit_import():
+        print("[오류] 문제 은행을 저장하지 못해 이번 가져오기를 취소했습니다.")
+        summary["error"] += 1
+        return {"summary": summary, "conflicts": [], "similar": []}
+
+    for c in conflicts:
+        label = "힌트 충돌" if c["type"] == "hint" else "정답 불일치(합집합 병합)"
+        print(f"[충돌] {label}: {c['question'][:40]!r} ({c['first']} ↔ {c['second']})")
+    similar = [{"question": new["question"], "similar_to": other["question"], "similarity": round(sim, 3)}
+               for new, other, sim in app.similar_found]
+    for s in similar:
+        print(f"[유사] {s['question'][:40]!r} ↔ {s['similar_to'][:40]!r} (유사도 {s['similarity']:.2f})")
+    print(f"[요약] 파일 {len(paths)}개 - 새 문제 {summary['new']}개, 정답 추가 {summary['merged']}개, "
+          f"중복 {summary['duplicate']}개, 건너뜀 {summary['skip']}개, 충돌 {len(conflicts)}건, "
+          f"유사 문제 {len(similar)}건, 오류 {summary['error']}개")
+    return {"summary": summary, "conflicts": conflicts, "similar": similar}
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="여러 퀴즈 파일(:= 형식 .txt, 그룹 .json)을 한 번에 가져옵니다.")
+    arg_parser.add_argument("targets", nargs="+", help="폴더 또는 glob 패턴")
+    arg_parser.add_argument("--quiz", default="quiz.json", help="병합할 퀴즈 파일")
+    arg_parser.add_argument("--workers", type=int, help="작업 프로세스 수 (기본: CPU 수)")
+    arg_parser.add_argument("--report", help="충돌 보고서를 저장할 JSON 경로")
+    args = arg_parser.parse_args()
+
+    from quiz_core import QuizApp
+    app = QuizApp(quiz_file=args.quiz)
+    reports = [bulk_import(app, target, args.workers) for target in args.targets]
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+    sys.exit(0 if all(not r["summary"].get("error") for r in reports) else 1)
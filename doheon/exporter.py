@@ -0,0 +1,238 @@
+# exporter.py
+import os
+import io
+import csv
+import sys
+import html
+import json
+import glob
+import hashlib
+import tempfile
+import argparse
+import instrument
+from quiz_ids import item_id
+from file_manager import write_atomic
+
+INDEX_SUFFIX = ".exportidx"  # 증분 내보내기용 섹션 해시/위치 기록 파일
+INDEX_VERSION = 2
+
+
+class MarkdownRenderer:
+    """
+    기존 오답노트와 같은 형식의 마크다운
+    - 렌더러마다 섹션 번호 부분(number)과 나머지 본문(section)을 따로 만듭니다.
+      번호는 매번 새로 쓰고 본문만 증분 내보내기에서 재사용합니다.
+    """
+    ext = ".md"
+
+    def header(self, title):
+        return f"# {title}\n\n"
+
+    def number(self, idx, q_item):
+        return f"## {idx}. "
+
+    def section(self, q_item, group):
+        lines = [f"{f'[{group}] ' if group else ''}(오답 {q_item.get('wrong_count', 0)}회)"]
+        lines.append(f"**문제**\n\n```\n{q_item.get('question', '')}\n```")
+        if q_item.get("hint"):
+            lines.append(f"\n> 힌트: {q_item.get('hint')}")
+        lines.append("\n**정답**\n")
+        lines.extend(f"- {a}" for a in q_item.get("answers", []))
+        lines.append("\n---\n")
+        return "\n".join(lines) + "\n"
+
+    def footer(self):
+        return ""
+
+
+class HtmlRenderer:
+    """브라우저에서 바로 열 수 있는 단일 HTML 문서"""
+    ext = ".html"
+
+    def header(self, title):
+        return ("<!DOCTYPE html>\n<html lang=\"ko\">\n<head>\n<meta charset=\"utf-8\">\n"
+                f"<title>{html.escape(title)}</title>\n</head>\n<body>\n<h1>{html.escape(title)}</h1>\n")
+
+    def number(self, idx, q_item):
+        return f"<section id=\"q-{item_id(q_item)}\">\n<h2>{idx}. "
+
+    def section(self, q_item, group):
+        parts = [f"{html.escape(f'[{group}] ') if group else ''}(오답 {q_item.get('wrong_count', 0)}회)</h2>",
+                 f"<pre>{html.escape(q_item.get('question', ''))}</pre>"]
+        if q_item.get("hint"):
+            parts.append(f"<blockquote>힌트: {html.escape(q_item['hint'])}</blockquote>")
+        parts.append("<ul>")
+        parts.extend(f"<li>{html.escape(a)}</li>" for a in q_item.get("answers", []))
+        parts.append("</ul>\n</section>")
+        return "\n".join(parts) + "\n"
+
+    def footer(self):
+        return "</body>\n</html>\n"
+
+
+class CsvRenderer:
+    """스프레드시트용 CSV (섹션 = 한 행, 정답은 ' || '로 연결)"""
+    ext = ".csv"
+
+    def _row(self, values):
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerow(values)
+        return buf.getvalue()
+
+    def header(self, title):
+        return self._row(["no", "group", "id", "question", "answers", "hint", "wrong_count"])
+
+    def number(self, idx, q_item):
+        return f"{idx},"  # 정수 열은 따옴표 없이 쓰이므로 나머지 열과 이어 붙여도 같은 행이 됩니다.
+
+    def section(self, q_item, group):
+        return self._row([group or "", item_id(q_item), q_item.get("question", ""),
+                          " || ".join(q_item.get("answers", [])), q_item.get("hint", ""),
+                          q_item.get("wrong_count", 0)])
+
+    def footer(self):
+        return ""
+
+
+RENDERERS = {"md": MarkdownRenderer, "html": HtmlRenderer, "csv": CsvRenderer}
+
+
+def section_hash(q_item, group):
+    """
+    섹션 본문에 영향을 주는 값(그룹, 문제 내용)의 해시
+    - 번호는 넣지 않으므로 문제를 끼워 넣거나 순서를 바꿔도 뒤쪽 섹션 본문을 재사용합니다.
+    """
+    payload = json.dumps([group, q_item.get("question", ""), q_item.get("answers", []),
+                          q_item.get("hint", ""), q_item.get("wrong_count", 0)], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_index(out_path, fmt, title):
+    """이전 내보내기의 섹션 본문 기록 [(섹션 해시, 오프셋, 길이), ...]을 반환합니다. 쓸 수 없으면 빈 list"""
+    index_path = out_path + INDEX_SUFFIX
+    if not (os.path.exists(out_path) and os.path.exists(index_path)):
+        return []
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        st = os.stat(out_path)
+        if (index.get("version") != INDEX_VERSION or index.get("format") != fmt
+                or index.get("title") != title or index.get("size") != st.st_size
+                or index.get("mtime_ns") != st.st_mtime_ns):
+            return []  # 출력 파일이 밖에서 수정되었으면 재사용하지 않음
+        return [(h, offset, length) for h, offset, length in index["sections"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+
+
+@instrument.timed("export")
+def export_items(entries, out_path, fmt="md", title="문답 전체", incremental=True):
+    """
+    (그룹, 아이템) 목록을 번호를 붙여 스트리밍으로 내보냅니다.
+    - 섹션을 하나씩 렌더링해 임시 파일에 바로 쓰므로 문서 전체를 메모리에 만들지 않습니다.
+    - incremental이면 이전 출력에서 해시가 같은 섹션 본문의 바이트를 그대로 복사하고,
+      바뀐 섹션만 새로 렌더링합니다. 번호는 섹션마다 새로 씁니다.
+      섹션 순서까지 같으면 파일을 다시 쓰지 않습니다.
+    - 결과: {"sections": n, "rendered": n, "reused": n, "written": bool}
+    """
+    renderer = RENDERERS[fmt]()
+    previous_sections = _load_index(out_path, fmt, title) if incremental else []
+    previous = {h: (offset, length) for h, offset, length in previous_sections}
+    stats = {"sections": 0, "rendered": 0, "reused": 0, "written": False}
+    sections = []
+    dir_name = os.path.dirname(os.path.abspath(out_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=renderer.ext, dir=dir_name)
+    try:
+        old = open(out_path, "rb") if previous else None
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(renderer.header(title).encode("utf-8"))
+                for idx, (group, q_item) in enumerate(entries, 1):
+                    h = section_hash(q_item, group)
+                    out.write(renderer.number(idx, q_item).encode("utf-8"))
+                    offset = out.tell()
+                    if h in previous:
+                        old.seek(previous[h][0])
+                        out.write(old.read(previous[h][1]))
+                        stats["reused"] += 1
+                    else:
+                        out.write(renderer.section(q_item, group).encode("utf-8"))
+                        stats["rendered"] += 1
+                    sections.append((h, offset, out.tell() - offset))
+                out.write(renderer.footer().encode("utf-8"))
+                out.flush()
+                os.fsync(out.fileno())
+        finally:
+            if old:
+                old.close()
+        stats["sections"] = len(sections)
+
+        if previous and [s[0] for s in previous_sections] == [s[0] for s in sections]:
+            return stats  # 섹션 내용과 순서가 그대로이므로 기존 파일 유지
+        if os.path.exists(out_path):
+            os.chmod(tmp_path, os.stat(out_path).st_mode)
+        os.replace(tmp_path, out_path)
+        tmp_path = None
+        stats["written"] = True
+        st = os.stat(out_path)
+        index = {"version": INDEX_VERSION, "format": fmt, "title": title,
+                 "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sections": sections}
+        write_atomic(out_path + INDEX_SUFFIX, json.dumps(index).encode("utf-8"))
+        return stats
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def failed_entries(quiz_data):
+    """오답 횟수가 1 이상인 아이템을 오답 횟수 순으로"""
+    items = sorted((q for q in quiz_data if q.get("wrong_count", 0) >= 1),
+                   key=lambda x: x["wrong_count"], reverse=True)
+    return [(None, q) for q in items]
+
+
+def group_entries(groups_dir, names=None):
+    """quiz_groups 폴더의 그룹 파일을 하나씩 읽어 (그룹, 아이템)을 차례로 내놓습니다."""
+    from file_manager import QuizFileManager
+    for path in sorted(glob.glob(os.path.join(groups_dir, "*.json"))):
+        group = os.path.splitext(os.path.basename(path))[0]
+        if names and group not in names:
+            continue
+        for q_item in QuizFileManager(path).load_file():
+            yield group, q_item
+
+
+def print_stats(out_path, stats):
+    if stats["written"]:
+        print(f"'{out_path}' 파일로 내보냈습니다. "
+              f"(섹션 {stats['sections']}개 - 새로 생성 {stats['rendered']}개, 재사용 {stats['reused']}개)")
+    else:
+        print(f"'{out_path}' 파일이 이미 최신입니다. (섹션 {stats['sections']}개)")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="퀴즈 은행을 마크다운/HTML/CSV로 내보냅니다.")
+    arg_parser.add_argument("output", help="출력 파일 경로")
+    arg_parser.add_argument("--scope", choices=("all", "failed", "groups"), default="all",
+                            help="all: 기본 퀴즈 파일 전체, failed: 틀린 문제만, groups: 그룹 파일")
+    arg_parser.add_argument("--format", choices=sorted(RENDERERS), default=None,
+                            help="출력 형식 (생략하면 출력 파일 확장자로 판단)")
+    arg_parser.add_argument("--quiz", default="quiz.json", help="기본 퀴즈 파일")
+    arg_parser.add_argument("--groups", default=os.path.join("..", "quiz_groups"), help="그룹 퀴즈 폴더")
+    arg_parser.add_argument("--group", action="append", help="내보낼 그룹 이름 (여러 번 지정 가능)")
+    arg_parser.add_argument("--full", action="store_true", help="증분 기록을 무시하고 모두 다시 생성")
+    args = arg_parser.parse_args()
+
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if fmt not in RENDERERS:
+        sys.exit(f"지원하지 않는 형식입니다: {fmt}")
+    if args.scope == "groups":
+        entries, title = group_entries(args.groups, args.group), "그룹 문답"
+    else:
+        from file_manager import open_storage
+        quiz_data = open_storage(args.quiz).load_file()
+        if args.scope == "failed":
+            entries, title = failed_entries(quiz_data), "오답노트"
+        else:
+            entries, title = [(None, q) for q in quiz_data], "문답 전체"
+    print_stats(args.output, export_items(entries, args.output, fmt, title, incremental=not args.full))
@@ -1,20 +1,28 @@
 # file_manager.py
 import os
 import json
+import bank_cache
+from bank_cache import write_atomic  # 다른 모듈은 기존처럼 file_manager에서 가져다 씁니다.
+import instrument
+from quiz_item import to_plain
+
 
 class QuizFileManager:
     """퀴즈 데이터 파일을 관리하는 클래스"""
     KEY = "quiz"
+    GENERATION_KEY = "generation"  # 저널 재적용 판단용 저장 세대 (QuizApp.save_bank가 올림)
     def __init__(self, file_path):
         self.file_path = file_path
+        self.generation = None  # 파일에 세대가 없으면 None (저장할 때도 쓰지 않음)
         
+    @instrument.timed("file.load")
     def load_file(self):
         """파일에서 퀴즈 데이터를 불러옵니다."""
         if not os.path.exists(self.file_path): # 파일이 없으면 빈 리스트 반환
             return []
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                file_data = json.load(f)
+            file_data = bank_cache.load_json(self.file_path) # 변경이 없으면 컴파일된 캐시를 사용
+            self.generation = file_data.get(self.GENERATION_KEY)
             return file_data.get(self.KEY, []) # KEY가 없는 경우에도 빈 리스트 반환
         except json.JSONDecodeError: # JSON 파일 형식이 잘못되었을 경우
             print(f"경고: '{self.file_path}' 파일이 올바른 JSON 형식이 아닙니다. 빈 퀴즈 목록을 로드합니다.")
@@ -23,17 +31,42 @@ class QuizFileManager:
             print(f"파일 로드 중 오류 발생: {e}")
             return []
 
+    @instrument.timed("file.save")
     def save_file(self, file_data):
-        """퀴즈 데이터를 파일에 저장합니다."""
+        """
+        퀴즈 데이터를 파일에 저장하고 성공 여부를 반환합니다.
+        임시 파일에 먼저 쓴 뒤 교체하므로 저장 도중 중단되어도 기존 파일이 손상되지 않습니다.
+        """
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump({self.KEY: file_data}, f, indent=4, ensure_ascii=False)
+            document = {self.KEY: to_plain(file_data) if isinstance(file_data, list) else file_data}
+            if self.generation is not None:
+                document[self.GENERATION_KEY] = self.generation
+            raw = json.dumps(document, indent=4, ensure_ascii=False).encode("utf-8")
+            write_atomic(self.file_path, raw)
+            bank_cache.store(self.file_path, document, raw)
+            return True
         except Exception as e:
             print(f"파일 저장 중 오류 발생: {e}")
+            return False
 
 
 class LastFailedFileManager(QuizFileManager):
-    """최근 틀린 문제 파일을 관리하는 클래스"""
+    """최근 틀린 문제 파일을 관리하는 클래스 (문제 복사본 대신 아이템 ID 목록을 저장)"""
     KEY = "last_failed"
     def __init__(self, file_path):
         super().__init__(file_path)
+
+
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+def open_storage(file_path, manager_cls=QuizFileManager):
+    """
+    파일 확장자에 맞는 저장소를 생성합니다.
+    .db/.sqlite 파일이면 SQLite 저장소를, 그 외에는 JSON 파일 저장소를 사용합니다.
+    """
+    if os.path.splitext(file_path)[1].lower() in SQLITE_EXTENSIONS:
+        from sqlite_storage import SQLiteQuizFileManager, SQLiteLastFailedFileManager
+        if issubclass(manager_cls, LastFailedFileManager):
+            return SQLiteLastFailedFileManager(file_path)
+        return SQLiteQuizFileManager(file_path)
+    return manager_cls(file_path)
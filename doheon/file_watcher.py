@@ -0,0 +1,141 @@
+# file_watcher.py
+"""
+문제 은행 파일 변경 감지
+
+- Linux에서는 inotify(ctypes)로 폴더 단위 이벤트를 받고, 그 밖의 환경에서는 파일 정보(stat)를 비교합니다.
+- 어느 쪽이든 마지막으로 확인한 (수정 시각, 크기, inode)와 비교해 실제로 바뀐 파일만 돌려줍니다.
+  앱이 직접 저장한 파일은 acknowledge()로 알려 주면 변경으로 보지 않습니다.
+- changes()는 기다리지 않고 바로 반환하므로, 메뉴/문제 사이처럼 안전한 시점에 호출합니다.
+"""
+import os
+import sys
+import struct
+import ctypes
+import ctypes.util
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class _Inotify:
+    """inotify 파일 디스크립터를 감싼 클래스 (논블로킹 읽기)"""
+
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self.dirs = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch 실패: {directory}")
+            self.dirs[wd] = directory
+
+    def read(self):
+        """쌓인 이벤트의 파일 경로 집합. 이벤트가 넘쳤으면 None (전체 확인 필요)"""
+        paths = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return paths
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                if wd in self.dirs and name:
+                    paths.add(os.path.join(self.dirs[wd], os.fsdecode(name)))
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    지정한 파일들과 폴더 안의 *.json 파일 변경을 감지하는 클래스
+    - files: 개별 파일 (quiz.json 등), directories: 파일 추가/삭제까지 감지할 폴더 (quiz_groups 등)
+    """
+
+    def __init__(self, files=(), directories=(), suffix=".json", use_inotify=True):
+        self.files = {os.path.abspath(p) for p in files}
+        self.directories = {os.path.abspath(d) for d in directories if os.path.isdir(d)}
+        self.suffix = suffix
+        self._signatures = {path: _signature(path) for path in self._scan()}
+        self._inotify = None
+        if use_inotify and sys.platform.startswith("linux"):
+            watch_dirs = self.directories | {os.path.dirname(p) for p in self.files}
+            try:
+                self._inotify = _Inotify(sorted(d for d in watch_dirs if os.path.isdir(d)))
+            except (OSError, AttributeError):
+                self._inotify = None  # inotify를 쓸 수 없으면 stat 비교로 대신합니다.
+
+    @property
+    def backend(self):
+        return "inotify" if self._inotify else "polling"
+
+    def _watched(self, path):
+        if path in self.files:
+            return True
+        name = os.path.basename(path)
+        # 임시 파일(.tmp_*)과 숨김 파일(.manifest.json 등)은 제외
+        return (os.path.dirname(path) in self.directories and name.endswith(self.suffix)
+                and not name.startswith("."))
+
+    def _scan(self):
+        paths = set(self.files)
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as entries:
+                    paths.update(e.path for e in entries if self._watched(os.path.join(directory, e.name)))
+            except OSError:
+                pass
+        return paths
+
+    def acknowledge(self, path):
+        """앱이 직접 저장한 파일의 현재 상태를 기록해 변경으로 보지 않게 합니다."""
+        path = os.path.abspath(path)
+        self._signatures[path] = _signature(path)
+
+    def changes(self):
+        """마지막 확인 이후 내용이 바뀌었거나 추가/삭제된 파일 경로 목록"""
+        candidates = self._inotify.read() if self._inotify else None
+        if candidates is None:
+            candidates = self._scan() | set(self._signatures)
+        changed = []
+        for path in candidates:
+            if not self._watched(path):
+                continue
+            signature = _signature(path)
+            if signature == self._signatures.get(path):
+                continue
+            if signature is None:
+                self._signatures.pop(path, None)
+            else:
+                self._signatures[path] = signature
+            changed.append(path)
+        return sorted(changed)
+
+    def close(self):
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
@@ -0,0 +1,148 @@
+# instrument.py
+"""
+선택적으로 켜는 시간 측정/카운터 모듈
+
+환경 변수 QUIZ_PROFILE=1 또는 main.py/quiz.py의 --profile 옵션으로 켭니다.
+꺼져 있을 때는 함수 호출마다 전역 플래그 하나만 확인하므로 부담이 거의 없습니다.
+"""
+import os
+import sys
+import json
+import time
+import cProfile
+import functools
+from collections import defaultdict
+
+ENV_VAR = "QUIZ_PROFILE"
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_timers = defaultdict(lambda: [0, 0.0, 0.0])  # 이름 → [호출 횟수, 총 시간, 최대 시간]
+_counters = defaultdict(int)
+_trace = None  # 트레이스를 남길 때만 이벤트 목록
+_origin = time.perf_counter()
+
+
+def enable(trace=False):
+    """측정을 켭니다. trace=True면 이벤트별 시간 기록도 남깁니다."""
+    global _enabled, _trace
+    _enabled = True
+    if trace and _trace is None:
+        _trace = []
+
+
+def is_enabled():
+    return _enabled
+
+
+def _record(name, start, elapsed):
+    stat = _timers[name]
+    stat[0] += 1
+    stat[1] += elapsed
+    if elapsed > stat[2]:
+        stat[2] = elapsed
+    if _trace is not None:
+        _trace.append((name, start - _origin, elapsed))
+
+
+def timed(name):
+    """함수 실행 시간을 name으로 누적하는 데코레이터"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(name, start, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """with 블록의 실행 시간을 name으로 누적합니다. 꺼져 있으면 아무 일도 하지 않습니다."""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def count(name, n=1):
+    if _enabled:
+        _counters[name] += n
+
+
+def summary():
+    """세션 동안의 측정 결과를 표 형태의 문자열로 반환합니다."""
+    lines = ["", "--- 성능 측정 요약 ---",
+             f"{'항목':<24}{'횟수':>8}{'합계(ms)':>12}{'평균(ms)':>12}{'최대(ms)':>12}"]
+    for name, (calls, total, worst) in sorted(_timers.items(), key=lambda kv: kv[1][1], reverse=True):
+        lines.append(f"{name:<24}{calls:>8}{total * 1000:>12.2f}{total / calls * 1000:>12.3f}{worst * 1000:>12.2f}")
+    if _counters:
+        lines.append("카운터: " + ", ".join(f"{k}={v}" for k, v in sorted(_counters.items())))
+    return "\n".join(lines)
+
+
+def dump_trace(path):
+    """측정 결과를 JSON으로 저장합니다. (chrome://tracing 에서 열 수 있는 traceEvents 포함)"""
+    data = {
+        "timers": {name: {"calls": c, "total_ms": t * 1000, "max_ms": m * 1000} for name, (c, t, m) in _timers.items()},
+        "counters": dict(_counters),
+        "traceEvents": [{"name": name, "ph": "X", "pid": os.getpid(), "tid": 0,
+                         "ts": round(start * 1e6), "dur": round(elapsed * 1e6)}
+                        for name, start, elapsed in (_trace or ())],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def add_arguments(arg_parser):
+    """main.py/quiz.py 공용 명령행 옵션을 추가합니다."""
+    arg_parser.add_argument("--profile", action="store_true", help=f"성능 측정을 켭니다. (환경 변수 {ENV_VAR}=1 과 같음)")
+    arg_parser.add_argument("--trace", metavar="PATH", help="측정 결과를 JSON 트레이스로 저장")
+    arg_parser.add_argument("--cprofile", metavar="PATH", help="cProfile 결과(.prof)를 저장")
+
+
+def run(main, args):
+    """명령행 옵션에 따라 측정을 켜고 main()을 실행한 뒤 요약/트레이스를 남깁니다."""
+    if args.profile or args.trace or args.cprofile:
+        enable(trace=bool(args.trace))
+    profiler = cProfile.Profile() if args.cprofile else None
+    try:
+        if profiler:
+            profiler.runcall(main)
+        else:
+            main()
+    finally:
+        if profiler:
+            profiler.dump_stats(args.cprofile)
+        if _enabled:
+            print(summary(), file=sys.stderr)
+        if args.trace:
+            dump_trace(args.trace)
@@ -1,6 +1,23 @@
 # main.py
+import argparse
+import instrument
 from quiz_core import QuizApp
+from file_manager import SQLITE_EXTENSIONS
+
+def main(quiz_file=None):
+    if quiz_file:
+        # .db 파일을 주면 최근 틀린 문제도 같은 DB에 저장합니다.
+        if quiz_file.lower().endswith(SQLITE_EXTENSIONS):
+            app = QuizApp(quiz_file=quiz_file, last_failed_file=quiz_file)
+        else:
+            app = QuizApp(quiz_file=quiz_file)
+    else:
+        app = QuizApp()
+    app.run()
 
 if __name__ == "__main__":
-    app = QuizApp()
-    app.run()
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description="퀴즈 앱")
+    arg_parser.add_argument("quiz_file", nargs="?", help="퀴즈 파일 (.json 또는 .db, 기본: quiz.json)")
+    instrument.add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    instrument.run(lambda: main(args.quiz_file), args)
\ No newline at end of file
@@ -0,0 +1,253 @@
+# near_duplicates.py
+import os
+import re
+import sys
+import glob
+import zlib
+import random
+import argparse
+import unicodedata
+from collections import defaultdict
+
+SHINGLE_SIZE = 4
+# 빈칸 채우기 문제의 빈칸 "(    )", "[ ]", "____"은 위치가 곧 문제의 차이이므로 표식 한 글자로 남깁니다.
+BLANK_RE = re.compile(r"\(\s*\)|\[\s*\]|_{2,}")
+BLANK_MARK = "□"
+# 빈칸 문제끼리는 틀이 같고 빈칸 자리만 달라도 유사도가 0.7을 넘기 쉬우므로 더 높은 기준을 씁니다.
+CLOZE_THRESHOLD = 0.9
+
+
+def has_blank(text: str):
+    return BLANK_RE.search(text or "") is not None
+
+
+def shingles(text: str):
+    """
+    공백/구두점을 없앤 본문의 글자 4-gram 해시 집합 (띄어쓰기 차이에 영향받지 않음)
+    - 기호(⇨, ▽ 등)와 빈칸 위치는 남겨, 같은 틀에서 기호나 빈칸만 다른 문제를 중복으로 보지 않습니다.
+    """
+    text = BLANK_RE.sub(BLANK_MARK, unicodedata.normalize("NFKC", text or "").casefold())
+    text = "".join(ch for ch in text if ch.isalnum() or unicodedata.category(ch)[0] == "S")
+    if len(text) <= SHINGLE_SIZE:
+        return {zlib.crc32(text.encode("utf-8"))} if text else set()
+    return {zlib.crc32(text[i:i + SHINGLE_SIZE].encode("utf-8")) for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def jaccard(a: set, b: set):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """
+    MinHash 서명과 LSH 밴딩으로 비슷한 문제를 찾는 색인 클래스
+    - 서명은 one-permutation MinHash로 만듭니다: shingle을 해시값으로 bands*rows개 구간에 나누고
+      구간별 최솟값을 취하므로, 서명 길이와 관계없이 shingle을 한 번만 훑습니다.
+      빈 구간은 고정된 무작위 순서로 다른 구간의 값을 빌려 채웁니다(optimal densification).
+    - 같은 밴드(rows개 값)가 하나라도 일치하면 후보가 됩니다.
+    - 후보는 실제 자카드 유사도로 다시 확인하므로 threshold 미만은 보고하지 않습니다.
+      빈칸 문제가 낀 쌍은 CLOZE_THRESHOLD 이상이어야 보고합니다.
+    - 문서마다 서명을 한 번만 계산하므로 전체 비용은 문서 수에 거의 비례합니다.
+    """
+
+    def __init__(self, threshold=0.7, bands=16, rows=4, seed=1):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        rnd = random.Random(seed)
+        k = bands * rows
+        self._multiplier = rnd.getrandbits(32) | 1  # 해시를 섞는 홀수 곱수
+        # 빈 구간 i가 값을 빌려 올 구간 순서 (모든 문서에 같은 순서를 써야 서명이 비교 가능)
+        self._probes = [[rnd.randrange(k) for _ in range(4 * k)] + list(range(k)) for _ in range(k)]
+        self._buckets = defaultdict(list)
+        self._shingles = {}
+        self._cloze = set()
+
+    def __len__(self):
+        return len(self._shingles)
+
+    def signature(self, shingle_set):
+        k = self.bands * self.rows
+        bins = [None] * k
+        multiplier = self._multiplier
+        for h in shingle_set:
+            h = (h * multiplier) & 0xFFFFFFFF
+            b, v = h % k, h // k
+            cur = bins[b]
+            if cur is None or v < cur:
+                bins[b] = v
+        signature = bins[:]
+        for i, probes in enumerate(self._probes):
+            if bins[i] is None:
+                for j in probes:
+                    if bins[j] is not None:
+                        signature[i] = bins[j]
+                        break
+        return signature
+
+    def _band_keys(self, signature):
+        r = self.rows
+        return [(b, tuple(signature[b * r:(b + 1) * r])) for b in range(self.bands)]
+
+    def query(self, text: str, exclude=None):
+        """본문과 비슷한 문서 목록 [(키, 유사도), ...]을 유사도 내림차순으로 반환합니다."""
+        sh = shingles(text)
+        if not sh:
+            return []
+        return self._verify(sh, self._candidates(self._band_keys(self.signature(sh))), exclude, has_blank(text))
+
+    def _candidates(self, band_keys):
+        found = set()
+        for band_key in band_keys:
+            found.update(self._buckets.get(band_key, ()))
+        return found
+
+    def _verify(self, sh, candidates, exclude=None, cloze=False):
+        hits = []
+        cloze_threshold = max(self.threshold, CLOZE_THRESHOLD)
+        for key in candidates:
+            if key == exclude:
+                continue
+            sim = jaccard(sh, self._shingles[key])
+            if sim >= (cloze_threshold if cloze or key in self._cloze else self.threshold):
+                hits.append((key, sim))
+        hits.sort(key=lambda kv: kv[1], reverse=True)
+        return hits
+
+    def add(self, key, text: str):
+        """문서를 추가하고, 이미 색인된 문서 중 비슷한 것 [(키, 유사도), ...]을 반환합니다."""
+        sh = shingles(text)
+        if not sh:
+            return []
+        band_keys = self._band_keys(self.signature(sh))
+        cloze = has_blank(text)
+        hits = self._verify(sh, self._candidates(band_keys), key, cloze)
+        self._shingles[key] = sh
+        if cloze:
+            self._cloze.add(key)
+        for band_key in band_keys:
+            self._buckets[band_key].append(key)
+        return hits
+
+    def remove(self, key):
+        """문서를 색인에서 뺍니다. 그 문서가 들어 있던 버킷만 고칩니다."""
+        sh = self._shingles.pop(key, None)
+        if sh is None:
+            return
+        self._cloze.discard(key)
+        for band_key in self._band_keys(self.signature(sh)):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+
+def find_pairs(entries, threshold=0.7):
+    """
+    [(키, 본문), ...]에서 비슷한 쌍을 모두 찾습니다.
+    반환값: [(앞 키, 뒤 키, 유사도), ...] (앞 키가 먼저 추가된 문서)
+    """
+    index = NearDuplicateIndex(threshold)
+    pairs = []
+    for key, text in entries:
+        for other, sim in index.add(key, text):
+            pairs.append((other, key, sim))
+    return pairs
+
+
+def same_answers(a: dict, b: dict):
+    """두 문제의 정답 집합이 같은지 확인합니다. 정답이 다르면 본문이 비슷해도 다른 문제입니다."""
+    return {x.strip() for x in a.get("answers", [])} == {x.strip() for x in b.get("answers", [])}
+
+
+def merge_into(target: dict, source: dict):
+    """source 문제를 target에 합칩니다. 정답은 합집합, 오답 횟수는 합산합니다."""
+    target["answers"] = [*target["answers"], *(a for a in source.get("answers", []) if a not in target["answers"])]
+    target["wrong_count"] = target.get("wrong_count", 0) + source.get("wrong_count", 0)
+    if not target.get("hint") and source.get("hint"):
+        target["hint"] = source["hint"]
+
+
+def merge_pairs(items: list, pairs):
+    """
+    같은 목록 안의 유사 쌍을 하나로 합치고 남은 아이템 목록을 반환합니다.
+    A~B, B~C처럼 이어진 경우도 가장 앞의 아이템 하나로 합칩니다. pairs의 키는 목록 인덱스입니다.
+    """
+    parent = list(range(len(items)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for a, b, _ in pairs:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+    for i in range(len(items)):
+        root = find(i)
+        if root != i:
+            merge_into(items[root], items[i])
+    return [item for i, item in enumerate(items) if find(i) == i]
+
+
+def _first_line(q_item):
+    return q_item.get("question", "").strip().split("\n", 1)[0]
+
+
+def confirm_merges(banks: dict, pairs, ask=input):
+    """
+    같은 파일 안의 유사 쌍 중 정답이 같은 것만 하나씩 보여 주고 합칠지 묻습니다.
+    반환값: {파일 경로: [(앞 인덱스, 뒤 인덱스, 유사도), ...]} (사용자가 승인한 쌍만)
+    """
+    confirmed = {}
+    for (pa, ia), (pb, ib), sim in pairs:
+        if pa != pb or not same_answers(banks[pa][ia], banks[pb][ib]):
+            continue
+        a, b = banks[pa][ia], banks[pb][ib]
+        print(f"\n[{sim:.2f}] {os.path.basename(pa)}")
+        print(f"  #{ia + 1} {a['question'].strip()!r}")
+        print(f"  #{ib + 1} {b['question'].strip()!r}")
+        print(f"  정답: {' || '.join(a['answers'])}")
+        choice = ask("두 문제를 하나로 합칠까요? (y: 합치기 / n: 건너뛰기 / q: 그만) [n]: ").strip().lower()
+        if choice == "q":
+            break
+        if choice == "y":
+            confirmed.setdefault(pa, []).append((ia, ib, sim))
+    return confirmed
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="모든 퀴즈 은행에서 비슷한 문제를 찾습니다.")
+    arg_parser.add_argument("--quiz", default="quiz.json", help="기본 퀴즈 파일")
+    arg_parser.add_argument("--groups", default=os.path.join("..", "quiz_groups"), help="그룹 퀴즈 폴더")
+    arg_parser.add_argument("--threshold", type=float, default=0.7, help="자카드 유사도 기준 (0~1)")
+    arg_parser.add_argument("--merge", action="store_true",
+                            help="같은 파일 안에서 정답까지 같은 유사 문제를 한 쌍씩 확인받아 합쳐 저장 (기본은 보고만 함)")
+    args = arg_parser.parse_args()
+
+    from file_manager import QuizFileManager
+    paths = [p for p in [args.quiz] + sorted(glob.glob(os.path.join(args.groups, "*.json"))) if os.path.exists(p)]
+    banks = {path: QuizFileManager(path).load_file() for path in paths}
+    entries = [((path, i), item.get("question", "")) for path, items in banks.items() for i, item in enumerate(items)]
+    pairs = find_pairs(entries, args.threshold)
+
+    pairs.sort(key=lambda p: p[2], reverse=True)
+    for (pa, ia), (pb, ib), sim in pairs:
+        note = "" if same_answers(banks[pa][ia], banks[pb][ib]) else "  (정답 다름 → 합치지 않음)"
+        print(f"[{sim:.2f}] {os.path.basename(pa)}#{ia + 1} {_first_line(banks[pa][ia])!r}{note}\n"
+              f"       {os.path.basename(pb)}#{ib + 1} {_first_line(banks[pb][ib])!r}")
+    print(f"\n문제 {len(entries)}개 중 유사 쌍 {len(pairs)}건", file=sys.stderr)
+
+    if args.merge:
+        for path, local in confirm_merges(banks, pairs).items():
+            manager = QuizFileManager(path)
+            items = manager.load_file()
+            merged = merge_pairs(items, local)
+            if manager.save_file(merged):
+                print(f"{path}: {len(items) - len(merged)}개 문제를 합쳤습니다.", file=sys.stderr)
+    else:
+        print("보고만 했습니다. 합치려면 --merge로 실행해 한 쌍씩 확인하세요.", file=sys.stderr)
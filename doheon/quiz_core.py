@@ -1,58 +1,324 @@
 # quiz_core.py
-import random
-from file_manager import QuizFileManager, LastFailedFileManager
+import os
+import time
+import bank_cache
+from file_manager import QuizFileManager, LastFailedFileManager, open_storage
 from ui import QuizUI
 from quiz_parser import QuizParser
+from quiz_journal import QuizJournal
+from answer_matcher import AnswerMatcher
+from review_scheduler import ReviewScheduler
+from quiz_ids import question_id, item_id, to_ids
+from quiz_item import QuizItem, ShuffledView, to_items
+from search_index import SearchIndex, load_group_files, load_group_file, print_hits
+from file_watcher import FileWatcher
+from bulk_import import bulk_import
+from near_duplicates import NearDuplicateIndex
+from exporter import RENDERERS, export_items, failed_entries, group_entries, print_stats
+from attempt_store import AttemptStore, print_report
+import instrument
 
 class QuizApp:
     """퀴즈 애플리케이션의 핵심 로직을 담당하는 클래스"""
     def __init__(self,
                  quiz_file="quiz.json",
                  wrong_note_file="wrong_quiz_note.md",
-                 last_failed_file="last_failed.json"):
-        self.quiz_file_manager = QuizFileManager(quiz_file)
-        self.last_failed_file_manager = LastFailedFileManager(last_failed_file)
+                 last_failed_file="last_failed.json",
+                 journal_file=None,
+                 review_state_file="review_state.json",
+                 groups_dir=os.path.join("..", "quiz_groups"),
+                 attempts_dir="attempt_stats"):
+        self.quiz_file = quiz_file
+        self.quiz_file_manager = open_storage(quiz_file, QuizFileManager)
+        self.journal = QuizJournal(journal_file or os.path.splitext(quiz_file)[0] + ".journal")
+        self.last_failed_file_manager = open_storage(last_failed_file, LastFailedFileManager)
         self.ui = QuizUI()
         self.parser = QuizParser()
+        self.matcher = AnswerMatcher()
         
-        self.quiz_data = self.quiz_file_manager.load_file()
+        self.quiz_data = to_items(self.quiz_file_manager.load_file())
+        self.items_by_id = {}
+        self.search_index = None  # 첫 검색 때 만들고 이후에는 아이템 단위로 갱신
+        self.near_duplicates = None  # 첫 가져오기 때 만들고 이후에는 새 아이템만 추가
+        self.similar_found = []  # 가져오기 중 발견한 (새 아이템, 기존 아이템, 유사도)
+        self.groups_dir = groups_dir
+        self._dirty = {}  # 마지막 저장 이후 변경된 아이템 (아이템 단위 저장소용)
+        self._undo = None  # 가져오기 중에만 쓰는 되돌리기 기록 (_begin_import 참고)
+        # 실행 중 파일 변경 감지 (SQLite 저장소는 파일 단위로 비교할 수 없어 그룹 폴더만 감시)
+        self.watcher = FileWatcher(files=[quiz_file] if type(self.quiz_file_manager) is QuizFileManager else [],
+                                   directories=[groups_dir])
+        self._rebuild_index()
+        self._replay_journal()
+        self.scheduler = ReviewScheduler(review_state_file, self.item_key)
+        self.attempts = AttemptStore(attempts_dir)  # 풀이 이력 (정답 여부, 응답 시간)
+        self.group_name = os.path.splitext(os.path.basename(quiz_file))[0]
         self.wrong_note_file = wrong_note_file
         
         self.last_user_answer = None
         self.last_question = None
-        self.last_failed = []
-
-    def _save_one_item(self, question_text: str, answers: list, hint: str):
-        """하나의 퀴즈 아이템을 저장하거나 업데이트합니다."""
+        self.last_failed = set()  # 이번 세션에서 틀린 문제의 ID
+
+    def item_key(self, q_item: dict):
+        """세션 상태(최근 틀린 문제, 복습 일정, 저널)에서 아이템을 가리키는 ID"""
+        return item_id(q_item)
+
+    def _rebuild_index(self):
+        """아이템 ID → 아이템 인덱스를 처음부터 다시 만듭니다."""
+        self.items_by_id = {}
+        for item in self.quiz_data:
+            self._index_item(item)
+
+    def _index_item(self, item: dict):
+        """
+        아이템을 인덱스에 등록합니다. 새 아이템 추가와 정답 추가 때마다 호출합니다.
+        ID 인덱스는 정답이 바뀌어도 그대로이고, 검색 색인은 해당 아이템만 다시 색인합니다.
+        """
+        # 파일에 이미 중복이 있으면 기존 동작(첫 번째 아이템 우선)을 유지합니다.
+        self.items_by_id.setdefault(self.item_key(item), item)
+        if self.search_index is not None:
+            self.search_index.add(item)
+
+    def prepare_near_duplicate_check(self):
+        """가져오기 전에 유사 문제 색인을 준비합니다. (이미 있으면 그대로 사용)"""
+        if self.near_duplicates is None:
+            self.near_duplicates = NearDuplicateIndex()
+            for item in self.quiz_data:
+                self.near_duplicates.add(self.item_key(item), item.get("question", ""))
+        self.similar_found = []
+
+    def _check_near_duplicates(self, new_item: dict):
+        """새 아이템을 유사 문제 색인에 추가하고, 비슷한 기존 아이템 [(아이템, 유사도), ...]을 반환합니다."""
+        if self.near_duplicates is None:
+            return []
+        hits = self.near_duplicates.add(self.item_key(new_item), new_item["question"])
+        similar = [(self.items_by_id[key], sim) for key, sim in hits if key in self.items_by_id]
+        self.similar_found.extend((new_item, other, sim) for other, sim in similar)
+        return similar
+
+    def find_item(self, question_text: str):
+        """문제 본문으로 아이템을 O(1)에 찾습니다."""
+        return self.items_by_id.get(question_id(question_text))
+
+    def resolve_ids(self, ids):
+        """ID 목록을 현재 문제 은행의 아이템으로 바꿉니다. 은행에 없는 ID는 건너뜁니다."""
+        return [self.items_by_id[i] for i in ids if i in self.items_by_id]
+
+    def _replay_journal(self):
+        """
+        비정상 종료로 남은 저널 이벤트를 문제 은행에 다시 적용하고 저장합니다.
+        은행 저장 세대보다 앞선 이벤트는 이미 저장된 것이므로 건너뜁니다. (세대가 없는 예전 기록은 적용)
+        """
+        events = self.journal.load_events()
+        if not events:
+            return
+        generation = self.quiz_file_manager.generation or 0
+        stale = [e for e in events if e.get("gen", generation) < generation]
+        if stale:
+            events = [e for e in events if e.get("gen", generation) >= generation]
+            print(f"[알림] 이미 저장된 기록 {len(stale)}건은 다시 적용하지 않습니다.")
+            if not events:
+                self.journal.clear()
+                return
+        for event in events:
+            item = self.items_by_id.get(event.get("id"))
+            if item is None:
+                continue
+            if event.get("op") == "wrong":
+                item["wrong_count"] = max(0, item.get("wrong_count", 0) + event.get("delta", 0))
+            elif event.get("op") == "answer" and event.get("answer"):
+                item.add_answers([event["answer"]])
+            else:
+                continue
+            self._mark_dirty(item)  # 아이템 단위 저장소는 변경된 아이템만 저장하므로 반드시 표시
+        if self.save_bank():
+            print(f"[알림] 저장되지 않은 기록 {len(events)}건을 복구했습니다.")
+        else:
+            print("[경고] 복구한 기록을 저장하지 못했습니다. 저널은 다음 실행을 위해 그대로 둡니다.")
+
+    def _begin_import(self):
+        """
+        가져오기를 시작합니다. 이후 _merge_item이 메모리에 반영한 변경은 되돌리기 기록에 남아,
+        _commit_import로 한 번에 저장하거나 _rollback_import로 모두 취소할 수 있습니다.
+        """
+        self.prepare_near_duplicate_check()
+        self._undo = []
+
+    def _commit_import(self):
+        """가져온 변경을 한 번에 저장합니다. 저장에 실패하면 메모리의 변경도 되돌리고 False를 반환합니다."""
+        undo, self._undo = self._undo, None
+        if not undo:
+            return True
+        if self.save_bank():
+            return True
+        self._undo = undo
+        self._rollback_import()
+        return False
+
+    def _rollback_import(self):
+        """가져오기 중 메모리에 반영한 변경(새 문제, 정답/힌트 추가)을 역순으로 모두 되돌립니다."""
+        undo, self._undo = self._undo or [], None
+        for q_item, answers, hint, was_dirty in reversed(undo):
+            key = self.item_key(q_item)
+            if answers is None:  # 새 문제는 항상 끝에 추가되므로 역순으로 빼면 됩니다.
+                self.quiz_data.pop()
+                self.items_by_id.pop(key, None)
+                if self.search_index is not None:
+                    self.search_index.remove(("quiz", key))
+                if self.near_duplicates is not None:
+                    self.near_duplicates.remove(key)
+            else:
+                q_item.answers, q_item.hint = answers, hint
+                if self.search_index is not None:
+                    self.search_index.add(q_item)
+            if not was_dirty:
+                self._dirty.pop(key, None)
+        self.similar_found = []
+
+    def _record(self, op: str, q_item: dict, **fields):
+        """풀이 중 변경 사항을 저널에 기록하고, 저널이 커지면 문제 은행을 저장합니다."""
+        self._mark_dirty(q_item)
+        self.journal.append({"op": op, "id": self.item_key(q_item), "gen": self.quiz_file_manager.generation or 0, **fields})
+        if self.journal.needs_compaction():
+            self.save_bank()
+
+    def _mark_dirty(self, q_item: dict):
+        self._dirty[self.item_key(q_item)] = q_item
+
+    @instrument.timed("bank.save")
+    def save_bank(self):
+        """
+        문제 은행을 저장하고, 저장에 성공하면 저널을 비웁니다. 저장 성공 여부를 반환합니다.
+        저장소가 아이템 단위 갱신(update_items)을 지원하면 변경된 아이템만 저장합니다.
+        저장할 때마다 은행의 저장 세대를 올려, 저널을 비우기 전에 종료되어도 재적용되지 않게 합니다.
+        """
+        manager = self.quiz_file_manager
+        previous = manager.generation
+        manager.generation = (previous or 0) + 1
+        if hasattr(manager, "update_items"):
+            saved = manager.update_items(list(self._dirty.values()))
+        else:
+            saved = manager.save_file(self.quiz_data)
+        if saved:
+            self._dirty = {}
+            self.journal.clear()
+            self.watcher.acknowledge(self.quiz_file)  # 직접 저장한 내용은 변경으로 보지 않음
+        else:
+            manager.generation = previous
+        return saved
+
+    def check_for_updates(self):
+        """
+        quiz.json이나 그룹 파일이 밖에서 바뀌었으면 바뀐 파일만 다시 읽어 반영합니다.
+        메뉴와 문제 사이에서 호출하며, 진행 중인 풀이(출제 순서, 점수, 최근 틀린 문제)는 그대로 유지됩니다.
+        """
+        for path in self.watcher.changes():
+            if path == os.path.abspath(self.quiz_file):
+                self._reload_bank()
+            else:
+                if self.search_index is not None:
+                    load_group_file(self.search_index, path)
+                print(f"[알림] 그룹 파일 '{os.path.basename(path)}' 변경을 반영했습니다.")
+
+    @instrument.timed("bank.reload")
+    def _reload_bank(self):
+        """
+        quiz.json을 다시 읽어 바뀐 아이템만 반영합니다.
+        - 기존 아이템 객체는 그대로 두고 내용만 갱신하므로 진행 중인 풀이와 복습 큐가 계속 유효합니다.
+        - 저장되지 않은 로컬 변경이 있는 아이템은 로컬 값을 유지하고 정답만 합칩니다.
+        """
+        try:
+            fresh = to_items(bank_cache.load_json(self.quiz_file).get(QuizFileManager.KEY, []))
+        except (OSError, ValueError) as e:
+            print(f"[경고] '{self.quiz_file}' 파일을 다시 읽지 못해 이전 내용을 유지합니다: {e}")
+            return
+        quiz_data, seen, added, updated = [], set(), [], []
+        for item in fresh:
+            key = self.item_key(item)
+            current = self.items_by_id.get(key) if key not in seen else None
+            seen.add(key)
+            if current is None:
+                quiz_data.append(item)
+                added.append(item)
+                continue
+            if key in self._dirty:
+                if current.add_answers(item.answers):
+                    updated.append(current)
+            elif current.to_dict() != item.to_dict():
+                current.answers, current.hint = item.answers, item.hint
+                current.wrong_count, current.extra = item.wrong_count, item.extra
+                updated.append(current)
+            quiz_data.append(current)
+        removed = [key for key in self.items_by_id if key not in seen]
+
+        # 색인은 처음부터 다시 만들지 않고 바뀐 ID만 고칩니다.
+        self.quiz_data = quiz_data
+        for key in removed:
+            self._dirty.pop(key, None)
+            del self.items_by_id[key]
+            if self.search_index is not None:
+                self.search_index.remove(("quiz", key))
+            if self.near_duplicates is not None:
+                self.near_duplicates.remove(key)
+        for item in added:
+            key = self.item_key(item)
+            if key not in self.items_by_id and self.near_duplicates is not None:
+                self.near_duplicates.add(key, item.get("question", ""))
+            self._index_item(item)
+        if self.search_index is not None:
+            for item in updated:
+                self.search_index.add(item)  # 본문(ID)은 같고 정답/힌트만 바뀐 아이템
+        print(f"[알림] '{os.path.basename(self.quiz_file)}' 변경 반영: "
+              f"추가 {len(added)}개, 수정 {len(updated)}개, 삭제 {len(removed)}개")
+
+    def _merge_item(self, question_text: str, answers: list, hint: str):
+        """
+        퀴즈 아이템 하나를 메모리 상의 문제 은행에 반영합니다. (저장은 하지 않음)
+        반환값: (상태, 메시지) - 상태는 'skip', 'duplicate', 'merged', 'new' 중 하나
+        """
         if not question_text or not answers:
-            return "본문 또는 정답 없음 → 건너뜀"
+            return "skip", "본문 또는 정답 없음 → 건너뜀"
 
-        existing = next((item for item in self.quiz_data if item.get("question", "").strip() == question_text), None)
+        existing = self.find_item(question_text)
 
         if existing:
-            to_add = [a for a in answers if a not in existing.get("answers", [])]
+            undo = (existing, existing.answers, existing.hint, self.item_key(existing) in self._dirty)
+            to_add = existing.add_answers(answers)
             if to_add:
-                existing["answers"].extend(to_add)
+                if self._undo is not None:
+                    self._undo.append(undo)
                 if hint: existing["hint"] = hint
-                self.quiz_file_manager.save_file(self.quiz_data)
-                return f"• 기존 문제에 정답 추가: {to_add}"
-            return "• 중복(변경 없음)"
+                self._index_item(existing)
+                self._mark_dirty(existing)
+                return "merged", f"• 기존 문제에 정답 추가: {to_add}"
+            return "duplicate", "• 중복(변경 없음)"
         else:
-            new_item = {"question": question_text, "answers": answers, "wrong_count": 0}
-            if hint:
-                new_item["hint"] = hint
+            new_item = QuizItem(question_text, answers, hint or None, 0)
+            if self._undo is not None:
+                self._undo.append((new_item, None, None, False))
+            similar = self._check_near_duplicates(new_item)
             self.quiz_data.append(new_item)
-            self.quiz_file_manager.save_file(self.quiz_data)
-            return "• 새 문제 저장"
+            self._index_item(new_item)
+            self._mark_dirty(new_item)
+            if similar:
+                other, sim = similar[0]
+                return "new", f"• 새 문제 저장 (유사 문제 확인 필요: {other['question'].strip()[:30]!r}, 유사도 {sim:.2f})"
+            return "new", "• 새 문제 저장"
+
+    def _save_one_item(self, question_text: str, answers: list, hint: str):
+        """하나의 퀴즈 아이템을 저장하거나 업데이트합니다."""
+        status, message = self._merge_item(question_text, answers, hint)
+        if status in ("merged", "new"):
+            self.save_bank()
+        return message
 
     def decrease_wrong_count(self, q_item):
         """문제의 오답 횟수를 1 감소시킵니다."""
         if q_item["wrong_count"] > 0:
             q_item["wrong_count"] -= 1
+            self._record("wrong", q_item, delta=-1)
             print(f"오답 횟수 1 감소. 현재 오답 횟수: {q_item['wrong_count']}")
         else:
             print("오답 횟수가 이미 0입니다.")
-        self.quiz_file_manager.save_file(self.quiz_data)
 
     def handle_command(self, cmd: str, q_item: dict):
         """퀴즈 풀이 중 입력된 명령어를 처리합니다."""
@@ -61,8 +327,10 @@ class QuizApp:
             return True, False
             
         elif cmd in ('add', '추가') and self.last_user_answer and self.last_question:
-            if self.last_user_answer not in self.last_question["answers"]:
-                self.last_question["answers"].append(self.last_user_answer)
+            if self.last_question.add_answers([self.last_user_answer]):
+                self._record("answer", self.last_question, answer=self.last_user_answer)
+                self._index_item(self.last_question)
+                self.scheduler.record(self.last_question, True)
                 print("이전 답안이 정답으로 추가되었습니다.")
                 self.decrease_wrong_count(self.last_question)
                 self.last_user_answer = None
@@ -72,6 +340,7 @@ class QuizApp:
         elif cmd in ('typo', '오타') and self.last_user_answer and self.last_question:
             print("오타로 처리하여 오답 횟수를 조정합니다.")
             self.decrease_wrong_count(self.last_question)
+            self.scheduler.record(self.last_question, True)
             self.last_user_answer = None
             return False, True
         
@@ -87,6 +356,7 @@ class QuizApp:
         """하나의 문제를 출제하고 사용자의 답변을 처리합니다."""
         print(q_item["question"])
         bonus = 0
+        asked_at = time.perf_counter()
 
         while True:
             user_input = input("정답을 입력하세요: ").strip()
@@ -96,18 +366,28 @@ class QuizApp:
                 if should_quit: return bonus, True
                 if prev_fixed:
                     bonus += 1
-                    if self.last_failed: self.last_failed.pop()
+                    self.last_failed.discard(self.item_key(self.last_question))
                 continue
 
             self.last_user_answer = user_input
-            if user_input in q_item["answers"]:
+            instrument.count("answers")
+            match = self.matcher.grade(q_item, user_input)
+            if match:
                 print("정답입니다!")
+                if match != "exact":
+                    print(f"(표기 차이를 허용했습니다. 등록된 정답: {' || '.join(q_item['answers'])})")
+                self._record("attempt", q_item, correct=True)
+                self.attempts.record(q_item, True, (time.perf_counter() - asked_at) * 1000, self.group_name)
+                self.scheduler.record(q_item, True)
                 return bonus + 1, False
 
             print(f"틀렸습니다. 정답: {' || '.join(q_item['answers'])}")
             q_item["wrong_count"] += 1
-            if q_item not in self.last_failed:
-                self.last_failed.append(q_item)
+            self._record("attempt", q_item, correct=False)
+            self.attempts.record(q_item, False, (time.perf_counter() - asked_at) * 1000, self.group_name)
+            self._record("wrong", q_item, delta=1)
+            self.scheduler.record(q_item, False)
+            self.last_failed.add(self.item_key(q_item))
             return bonus, False
 
     def play_quizzes(self, q_data: list, quiz_type="모든"):
@@ -116,37 +396,78 @@ class QuizApp:
             print(f"{quiz_type} 퀴즈 데이터가 없습니다.")
             return
         
-        self.last_failed = []
-        random.shuffle(q_data)
+        self.last_failed = set()
 
         print(f"\n--- {quiz_type} 문제 풀어보기 시작 ---")
         print("  - 특수 명령: !quit, !add, !typo, !hint")
         print("------------------------------")
         
         score, attempted = 0, 0
-        quiz_list = list(q_data)
+        quiz_list = ShuffledView(q_data)  # 목록을 복사하거나 원본 순서를 바꾸지 않고 인덱스만 섞음
 
         for i, q_item in enumerate(quiz_list):
+            self.check_for_updates()
             attempted += 1
             print(f"\n--- 문제 {i + 1}/{len(quiz_list)} ---")
             
             correct_count, should_quit = self.ask_single_question(q_item)
             score += correct_count
-            self.quiz_file_manager.save_file(self.quiz_data)
             
             if should_quit:
                 attempted -= 1
                 break
             
             self.last_question = q_item
-            
+
+        self._finish_session(attempted, score)
+
+    def play_scheduled(self, queue, quiz_type="복습"):
+        """복습 큐에서 우선순위가 높은 문제부터 하나씩 꺼내 진행합니다."""
+        if not len(queue):
+            print(f"{quiz_type} 퀴즈 데이터가 없습니다.")
+            return
+
+        self.last_failed = set()
+
+        print(f"\n--- {quiz_type} 문제 풀어보기 시작 ---")
+        print("  - 특수 명령: !quit, !add, !typo, !hint")
+        print("------------------------------")
+
+        score, attempted = 0, 0
+        while True:
+            self.check_for_updates()
+            q_item = queue.pop()
+            if q_item is None:
+                print("\n지금 풀어야 할 문제를 모두 풀었습니다.")
+                break
+
+            attempted += 1
+            print(f"\n--- 문제 {attempted} (오답 {q_item.get('wrong_count', 0)}회) ---")
+
+            correct_count, should_quit = self.ask_single_question(q_item)
+            score += correct_count
+
+            if should_quit:
+                attempted -= 1
+                break
+
+            if queue.respect_due:
+                queue.push(q_item)  # 새 복습 시각으로 다시 넣음 (틀리면 잠시 후 재출제)
+            self.last_question = q_item
+
+        self._finish_session(attempted, score)
+
+    def _finish_session(self, attempted: int, score: int):
+        """풀이 결과를 출력하고 세션 상태를 저장합니다."""
         print("\n--- 퀴즈 풀이 결과 ---")
         if attempted > 0:
             print(f"총 {attempted} 문제 중 {score} 문제 정답! ({score/attempted*100:.2f}%)")
         else:
             print("풀이한 문제가 없습니다.")
 
-        self.last_failed_file_manager.save_file(self.last_failed)
+        self.last_failed_file_manager.save_file(sorted(self.last_failed))
+        self.scheduler.save()
+        self.attempts.flush()
 
     def play_all_quizzes(self):
         if not self.quiz_data:
@@ -155,16 +476,30 @@ class QuizApp:
         self.play_quizzes(self.quiz_data, quiz_type="모든")
 
     def play_last_failed(self):
-        last_failed_data = self.last_failed_file_manager.load_file()
+        # 저장된 ID를 현재 은행의 아이템으로 바꾸므로 오답 횟수 변경이 원본에 반영됩니다.
+        last_failed_data = self.resolve_ids(to_ids(self.last_failed_file_manager.load_file()))
         if not last_failed_data:
             print("최근에 틀린 문제가 없습니다.")
             return
         self.play_quizzes(last_failed_data, quiz_type="최근에 틀린")
 
     def play_all_failed(self):
-        failed_list = self.get_failed_quizzes()
-        if failed_list:
-            self.play_quizzes(failed_list, quiz_type="틀렸던 모든")
+        """틀린 적 있는 문제를 복습 시각과 난이도(많이 틀린 것 우선) 순으로 모두 풀어봅니다."""
+        if not self.quiz_data:
+            print("퀴즈 데이터가 없습니다.")
+            return
+        failed = [q for q in self.quiz_data if q.get("wrong_count", 0) >= 1]
+        if not failed:
+            print("틀린 문제가 없습니다!")
+            return
+        self.play_scheduled(self.scheduler.queue(failed, respect_due=False), quiz_type="틀렸던 모든")
+
+    def play_due_reviews(self):
+        """복습 시각이 된 문제(처음 보는 문제 포함)를 간격 반복 방식으로 풀어봅니다."""
+        if not self.quiz_data:
+            print("등록된 퀴즈가 없습니다. 먼저 문제를 추가해주세요.")
+            return
+        self.play_scheduled(self.scheduler.queue(self.quiz_data), quiz_type="복습 일정")
 
     def correct_last_question(self):
         if not self.last_user_answer or not self.last_question:
@@ -180,7 +515,7 @@ class QuizApp:
     def add_quiz_interactive(self):
         """대화형으로 퀴즈를 추가하는 모드입니다."""
         print("\n--- [문제 추가 모드] ---")
-        print("명령: :+ (저장), :* (종료), :$ (파일에서 불러오기)")
+        print("명령: :+ (저장), :* (종료), :$ (파일에서 불러오기), :@ (폴더/패턴의 여러 파일 한꺼번에 불러오기)")
         
         question_lines, answers, hint = [], [], None
 
@@ -196,6 +531,11 @@ class QuizApp:
                 question_lines, answers, hint = [], [], None
                 continue
 
+            elif line.startswith(":@"):
+                bulk_import(self, line[2:].strip() or ".")
+                question_lines, answers, hint = [], [], None
+                continue
+
             elif line.startswith(":+"):
                 question_text = "\n".join(question_lines).strip()
                 result = self._save_one_item(question_text, answers, hint)
@@ -217,25 +557,41 @@ class QuizApp:
             else:
                 question_lines.append(line)
 
+    @instrument.timed("import.file")
     def add_quiz_from_file(self, path: str):
-        """파일로부터 여러 퀴즈를 한 번에 추가합니다."""
+        """
+        파일로부터 여러 퀴즈를 한 번에 추가합니다.
+        파일을 한 줄씩 읽으며 문항을 바로 반영하고, 변경이 있을 때만 마지막에 한 번 저장합니다.
+        읽는 도중 오류가 나거나 저장에 실패하면 이번 파일에서 반영한 변경을 모두 되돌립니다.
+        """
+        print(f"\n[알림] '{path}'에서 문제를 불러오는 중...")
+        self._begin_import()
+        summary = {"new": 0, "merged": 0, "duplicate": 0, "skip": 0}
+        idx, line_range = 0, "-"
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                full_text = f.read()
-            
-            blocks = self.parser.parse_file_into_blocks(full_text)
-            print(f"\n[알림] '{path}'에서 {len(blocks)}개 블록 감지. 처리 중...")
-
-            for idx, blk in enumerate(blocks, 1):
-                q_text, ans, h = self.parser.parse_quiz_block(blk)
-                if not q_text and not ans and not h: continue
-                result = self._save_one_item(q_text, ans, h)
-                print(f"[{idx:02d}] {result}")
-
+            for record in self.parser.iter_file_records(path):
+                idx += 1
+                line_range = f"{record.start_line}~{record.end_line}행"
+                if not record.question and not record.answers and not record.hint: continue
+                status, result = self._merge_item(record.question, record.answers, record.hint)
+                summary[status] += 1
+                print(f"[{idx:02d}] ({line_range}) {result}")
         except FileNotFoundError:
+            self._rollback_import()
             print(f"[오류] 파일을 찾을 수 없습니다: {path}")
+            return
         except Exception as e:
-            print(f"[오류] 파일 처리 중 예외 발생: {e}")
+            # 일부만 반영된 상태로 저장하지 않도록, 이번 파일에서 반영한 문항을 모두 되돌립니다.
+            self._rollback_import()
+            print(f"[오류] 파일 처리 중 예외 발생 (마지막 처리 위치: {line_range}): {e}")
+            print("[알림] 이 파일에서 불러온 문제는 저장하지 않았습니다.")
+            return
+
+        if not self._commit_import():
+            print("[오류] 문제 은행을 저장하지 못해 이번 가져오기를 취소했습니다.")
+            return
+        print(f"[요약] 블록 {idx}개 - 새 문제 {summary['new']}개, 정답 추가 {summary['merged']}개, "
+              f"중복 {summary['duplicate']}개, 건너뜀 {summary['skip']}개, 유사 문제 {len(self.similar_found)}건")
 
     def get_failed_quizzes(self):
         """오답 횟수가 1 이상인 모든 퀴즈를 오답 횟수 순으로 정렬하여 반환합니다."""
@@ -253,27 +609,60 @@ class QuizApp:
             return None
         return items
 
+    @instrument.timed("search")
+    def search_quizzes(self):
+        """문제/정답/힌트에서 검색어와 관련된 문제를 모든 그룹에 걸쳐 찾습니다."""
+        if self.search_index is None:
+            self.search_index = SearchIndex()
+            self.search_index.add_all(self.quiz_data)
+            if os.path.isdir(self.groups_dir):
+                load_group_files(self.search_index, self.groups_dir)
+        query = input("검색어를 입력하세요: ").strip()
+        if query:
+            print_hits(self.search_index.search(query))
+
+    def show_statistics(self):
+        """풀이 이력으로 그룹별 정답률, 어려운 문제, 응답 시간, 최근 추이를 보여줍니다."""
+        self.attempts.flush()
+        print_report(self.attempts)
+
     def export_wrong_note_markdown(self):
-        """오답 노트를 마크다운 파일로 생성합니다."""
-        items = self.get_failed_quizzes()
-        if not items: return
-        
-        lines = ["# 오답노트\n"]
-        for idx, q in enumerate(items, 1):
-            lines.append(f"## {idx}. (오답 {q.get('wrong_count', 0)}회)")
-            lines.append(f"**문제**\n\n```\n{q.get('question', '')}\n```")
-            if q.get("hint"):
-                lines.append(f"\n> 힌트: {q.get('hint')}")
-            lines.append("\n**정답**\n")
-            lines.extend([f"- {a}" for a in q.get("answers", [])])
-            lines.append("\n---\n")
+        """오답 노트를 마크다운 파일로 생성합니다. (바뀐 문제만 다시 렌더링)"""
+        if not self.get_failed_quizzes(): return
+        self._export(failed_entries(self.quiz_data), self.wrong_note_file, "md", "오답노트")
+
+    def export_quizzes(self):
+        """문답 전체/오답/그룹을 마크다운, HTML, CSV 중 하나로 내보냅니다."""
+        scope = input("범위를 선택하세요 (1: 문답 전체, 2: 오답만, 3: 그룹 파일) [1]: ").strip() or "1"
+        fmt = input(f"형식을 선택하세요 ({'/'.join(RENDERERS)}) [md]: ").strip().lower() or "md"
+        if fmt not in RENDERERS:
+            print(f"[오류] 지원하지 않는 형식입니다: {fmt}")
+            return
+        ext = RENDERERS[fmt].ext
+        if scope == "1":
+            if not self.quiz_data:
+                print("퀴즈 데이터가 없습니다.")
+                return
+            out_path = os.path.splitext(self.quiz_file)[0] + "_전체" + ext
+            self._export([(None, q) for q in self.quiz_data], out_path, fmt, "문답 전체")
+        elif scope == "2":
+            if not self.get_failed_quizzes(): return
+            self._export(failed_entries(self.quiz_data), os.path.splitext(self.wrong_note_file)[0] + ext, fmt, "오답노트")
+        elif scope == "3":
+            if not os.path.isdir(self.groups_dir):
+                print(f"[오류] 그룹 폴더를 찾을 수 없습니다: {self.groups_dir}")
+                return
+            name = input("그룹 이름 (비우면 전체 그룹): ").strip()
+            out_path = (name or "그룹_전체") + ext
+            self._export(group_entries(self.groups_dir, [name] if name else None), out_path, fmt, name or "그룹 문답")
+        else:
+            print("[오류] 잘못된 선택입니다.")
 
+    def _export(self, entries, out_path, fmt, title):
         try:
-            with open(self.wrong_note_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            print(f"오답노트를 '{self.wrong_note_file}' 파일로 생성했습니다.")
+            print_stats(out_path, export_items(entries, out_path, fmt, title))
         except Exception as e:
-            print(f"오답노트 생성 중 오류 발생: {e}")
+            print(f"내보내기 중 오류 발생: {e}")
 
     def run(self):
         """애플리케이션의 메인 루프를 실행합니다."""
@@ -282,20 +671,31 @@ class QuizApp:
             '2': self.play_last_failed,
             '3': self.play_all_failed,
             '4': self.add_quiz_interactive,
-            '5': self.export_wrong_note_markdown,
+            '5': self.export_quizzes,
             '6': self.correct_last_question,
+            '7': self.play_due_reviews,
+            '8': self.search_quizzes,
+            '9': self.show_statistics,
         }
         
-        while True:
-            self.ui.show_menu()
-            choice = self.ui.get_menu_choice()
-
-            if choice == '0':
-                print("\n퀴즈 앱을 종료합니다.")
-                break
-            
-            action = menu_actions.get(choice)
-            if action:
-                action()
-            
-            self.ui.wait_for_enter()
+        try:
+            while True:
+                self.check_for_updates()
+                self.ui.show_menu()
+                choice = self.ui.get_menu_choice()
+
+                if choice == '0':
+                    print("\n퀴즈 앱을 종료합니다.")
+                    break
+
+                action = menu_actions.get(choice)
+                if action:
+                    action()
+
+                self.ui.wait_for_enter()
+        finally:
+            # 세션 종료 시 저널을 문제 은행에 합칩니다.
+            if self.journal.size():
+                self.save_bank()
+            self.attempts.flush()
+            self.watcher.close()
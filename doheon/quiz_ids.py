@@ -0,0 +1,24 @@
+# quiz_ids.py
+import hashlib
+
+
+def normalize_question(text: str):
+    """중복 판정과 ID 계산에 사용하는 문제 본문 키 (앞뒤 공백 제거)"""
+    return (text or "").strip()
+
+
+def question_id(question_text: str):
+    """
+    문제 본문으로부터 안정적인 ID(16자리 16진수)를 계산합니다.
+    정답을 추가하거나 오답 횟수가 바뀌어도 ID는 그대로입니다.
+    """
+    return hashlib.blake2b(normalize_question(question_text).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def item_id(q_item: dict):
+    return question_id(q_item.get("question", ""))
+
+
+def to_ids(entries):
+    """ID 목록으로 바꿉니다. 예전 형식(아이템 복사본)이 섞여 있어도 ID로 변환합니다."""
+    return [entry if isinstance(entry, str) else item_id(entry) for entry in entries]
@@ -0,0 +1,141 @@
+# quiz_item.py
+import sys
+import random
+from array import array
+from collections.abc import MutableMapping, Sequence
+
+_intern = sys.intern
+
+
+def _intern_str(value):
+    return _intern(value) if type(value) is str else value
+
+
+class QuizItem(MutableMapping):
+    """
+    문제 하나를 담는 가벼운 객체
+    - dict 대신 __slots__를 써서 아이템마다 해시 테이블을 만들지 않습니다.
+    - 정답은 튜플로 보관하고, 정답/힌트 문자열은 intern 해서 은행 전체에서 같은 문자열을 공유합니다.
+    - 기존 코드가 그대로 동작하도록 q["question"], q.get("hint") 같은 dict 방식 접근을 지원합니다.
+    """
+    __slots__ = ("question", "answers", "hint", "wrong_count", "extra")
+    BASE_KEYS = ("question", "answers", "hint", "wrong_count")
+
+    def __init__(self, question, answers=(), hint=None, wrong_count=None, extra=None):
+        self.question = question
+        self.answers = tuple(map(_intern_str, answers))
+        self.hint = _intern_str(hint)
+        self.wrong_count = wrong_count  # None이면 파일에 키가 없던 아이템 (그룹 파일 등)
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, cls):
+            return data
+        extra = {k: v for k, v in data.items() if k not in cls.BASE_KEYS}
+        return cls(data.get("question", ""), data.get("answers") or (), data.get("hint"),
+                   data.get("wrong_count"), extra)
+
+    def to_dict(self):
+        """JSON 저장용 dict (원래 파일에 있던 키만, 정답은 JSON과 같게 list로)"""
+        data = dict(self.items())
+        data["answers"] = list(self.answers)
+        return data
+
+    def add_answers(self, answers):
+        """새 정답을 덧붙이고 실제로 추가된 정답 목록을 반환합니다."""
+        added = [a for a in dict.fromkeys(answers) if a not in self.answers]
+        if added:
+            self.answers += tuple(map(_intern_str, added))
+        return added
+
+    # ----- dict 방식 접근 -----
+    def get(self, key, default=None):
+        if key in self.BASE_KEYS:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def __contains__(self, key):
+        if key in self.BASE_KEYS:
+            return getattr(self, key) is not None
+        return bool(self.extra) and key in self.extra
+
+    def __getitem__(self, key):
+        if key in self.BASE_KEYS:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == "answers":
+            self.answers = tuple(map(_intern_str, value))
+        elif key == "hint":
+            self.hint = _intern_str(value)
+        elif key in self.BASE_KEYS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in ("hint", "wrong_count") and getattr(self, key) is not None:
+            setattr(self, key, None)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.BASE_KEYS:
+            if getattr(self, key) is not None:
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"QuizItem({self.question[:30]!r}, answers={self.answers!r})"
+
+
+def to_items(data):
+    """dict 목록을 QuizItem 목록으로 바꿉니다."""
+    return [QuizItem.from_dict(q) for q in data]
+
+
+def to_plain(data):
+    """저장용: QuizItem은 dict로 바꾸고, 그 밖의 값(ID 문자열 등)은 그대로 둡니다."""
+    return [q.to_dict() if isinstance(q, QuizItem) else q for q in data]
+
+
+class ShuffledView(Sequence):
+    """
+    목록을 복사하지 않고 섞인 순서로 보여주는 뷰
+    아이템 대신 인덱스 배열(4바이트/문제)만 섞습니다.
+    """
+    __slots__ = ("_items", "_order")
+
+    def __init__(self, items, rng=random):
+        self._items = items
+        self._order = array("I", range(len(items)))
+        rng.shuffle(self._order)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._items[i] for i in self._order[index]]
+        return self._items[self._order[index]]
+
+    def __iter__(self):
+        items = self._items
+        for i in self._order:
+            yield items[i]
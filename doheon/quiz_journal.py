@@ -0,0 +1,73 @@
+# quiz_journal.py
+import os
+import json
+import instrument
+
+class QuizJournal:
+    """
+    퀴즈 풀이 중 발생한 변경 사항을 한 줄씩 덧붙여 기록하는 저널 클래스
+    - 이벤트마다 fsync 하므로 비정상 종료 후에도 다음 실행 시 재적용할 수 있습니다.
+    - 문제 은행 전체 저장(압축)이 끝나면 저널을 비웁니다.
+    - 이벤트에는 기록 당시 은행의 저장 세대("gen")를 남깁니다. 은행 저장은 세대를 올리므로,
+      저장 직후 저널을 비우기 전에 종료되어도 이미 반영된 이벤트를 구분해 다시 적용하지 않습니다.
+    """
+    DEFAULT_THRESHOLD = 256 * 1024  # 이 크기(byte)를 넘으면 압축을 권장
+
+    def __init__(self, file_path, compact_threshold=DEFAULT_THRESHOLD):
+        self.file_path = file_path
+        self.compact_threshold = compact_threshold
+        self._fp = None
+
+    @instrument.timed("journal.append")
+    def append(self, event: dict):
+        """이벤트 하나를 기록하고 디스크에 반영될 때까지 기다립니다."""
+        if self._fp is None:
+            self._fp = open(self.file_path, "a", encoding="utf-8")
+        self._fp.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+
+    @instrument.timed("journal.append_many")
+    def append_many(self, events):
+        """여러 이벤트를 한 번의 쓰기와 fsync로 기록합니다. (서버 모드의 일괄 기록용)"""
+        if not events:
+            return
+        if self._fp is None:
+            self._fp = open(self.file_path, "a", encoding="utf-8")
+        self._fp.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events))
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+
+    def load_events(self):
+        """저널에 기록된 이벤트 목록을 불러옵니다. 기록 도중 끊긴 마지막 줄은 무시합니다."""
+        if not os.path.exists(self.file_path):
+            return []
+        events = []
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"경고: '{self.file_path}'의 손상된 기록을 건너뜁니다.")
+        return events
+
+    def size(self):
+        """현재 저널 파일 크기(byte)를 반환합니다."""
+        try:
+            return os.path.getsize(self.file_path)
+        except OSError:
+            return 0
+
+    def needs_compaction(self):
+        return self.size() >= self.compact_threshold
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def clear(self):
+        """문제 은행이 저장된 뒤 저널을 비웁니다."""
+        self.close()
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
@@ -1,4 +1,9 @@
 # quiz_parser.py
+from collections import namedtuple
+import instrument
+
+# 파싱된 문항 하나 (start_line/end_line은 원본 파일의 1부터 시작하는 줄 번호)
+QuizRecord = namedtuple("QuizRecord", "question answers hint start_line end_line")
 
 class QuizParser:
     """텍스트를 퀴즈 데이터로 변환하는 클래스"""
@@ -25,8 +30,11 @@ class QuizParser:
         - ':!' 줄  → 힌트 (마지막 값으로 갱신)
         - ':=' 줄  → 정답 ('||' 로 다중 정답)
         """
-        lines = text_block.splitlines()
+        return self._parse_lines(text_block.splitlines())
 
+    @instrument.timed("parse.block")
+    def _parse_lines(self, lines: list):
+        """블록을 이루는 줄 목록에서 문제, 정답, 힌트를 추출합니다."""
         # 선행/후행 빈 줄 제거
         i = 0
         while i < len(lines) and not lines[i].strip():
@@ -61,3 +69,30 @@ class QuizParser:
 
         question_text = "\n".join(q_lines).strip()
         return question_text, answers, hint
+
+    def iter_records(self, lines):
+        """
+        줄 단위 이터러블(파일 객체 등)을 한 번만 훑으며 문항을 하나씩 만들어 냅니다.
+        전체 텍스트를 메모리에 올리지 않으므로 큰 파일도 읽는 즉시 처리할 수 있습니다.
+        빈 줄만 있는 블록은 건너뜁니다.
+        """
+        cur, start, end = [], None, None
+        for line_no, raw in enumerate(lines, 1):
+            raw = raw.rstrip("\r\n")
+            if raw.strip().startswith(":+"):
+                if start is not None:
+                    yield QuizRecord(*self._parse_lines(cur), start, end)
+                cur, start, end = [], None, None
+                continue
+            cur.append(raw)
+            if raw.strip():
+                if start is None:
+                    start = line_no
+                end = line_no
+        if start is not None:
+            yield QuizRecord(*self._parse_lines(cur), start, end)
+
+    def iter_file_records(self, path: str):
+        """파일을 열어 iter_records로 문항을 하나씩 읽어 냅니다."""
+        with open(path, "r", encoding="utf-8") as f:
+            yield from self.iter_records(f)
@@ -0,0 +1,486 @@
+# quiz_server.py
+"""
+여러 학습자가 동시에 접속해 퀴즈를 푸는 로컬 HTTP 서버 모드
+
+- 문제 은행(quiz.json + quiz_groups)은 시작할 때 한 번만 읽어 모든 세션이 읽기 전용으로 공유합니다.
+- 세션은 출제 순서(공유 문제 목록의 인덱스 배열), 점수, 이번에 틀린 문제 ID만 가집니다.
+- 풀이 기록은 메모리에 모았다가 주기적으로 한 번의 쓰기/fsync로 저장합니다.
+  기본 퀴즈 파일 문제의 오답은 quiz.journal에 기록되어 다음 QuizApp 실행 때 wrong_count에 반영되므로,
+  같은 퀴즈 파일로 서버와 QuizApp을 동시에 실행하지 마세요.
+- quiz.json이나 그룹 파일이 바뀌면 해당 은행만 다시 읽어 새 세션부터 반영합니다.
+
+사용법: python quiz_server.py [--port 8765]  →  브라우저에서 http://127.0.0.1:8765/
+"""
+import os
+import sys
+import json
+import time
+import glob
+import random
+import signal
+import asyncio
+import secrets
+import argparse
+import traceback
+from array import array
+from http import HTTPStatus
+from urllib.parse import urlsplit
+import instrument
+import bank_cache
+from quiz_ids import item_id
+from quiz_journal import QuizJournal
+from answer_matcher import AnswerMatcher
+from file_manager import QuizFileManager, SQLITE_EXTENSIONS, open_storage
+from file_watcher import FileWatcher
+from attempt_store import AttemptStore
+from quiz_item import QuizItem
+
+MAIN_BANK = "quiz"            # 기본 퀴즈 파일의 은행 이름
+FLUSH_INTERVAL = 0.5          # 풀이 기록을 모아 저장하는 주기(초)
+FLUSH_BATCH = 512             # 이만큼 쌓이면 주기를 기다리지 않고 저장
+SESSION_TTL = 2 * 60 * 60     # 이 시간(초) 동안 요청이 없는 세션은 정리
+MAX_BODY = 64 * 1024
+
+
+class UserStateFileManager(QuizFileManager):
+    """학습자별 상태(최근 틀린 문제 ID 목록)를 저장하는 파일 관리 클래스"""
+    KEY = "users"
+
+
+class QuizBank:
+    """모든 세션이 공유하는 읽기 전용 문제 은행"""
+
+    def __init__(self, quiz_file, groups_dir):
+        self.quiz_file = quiz_file
+        self.banks = {}  # 은행 이름 → 문제 목록 (세션은 이 목록의 인덱스만 가짐)
+        storage = open_storage(quiz_file)
+        self._add(MAIN_BANK, storage.load_file())
+        self.generation = storage.generation or 0  # 저널 이벤트에 남기는 기본 퀴즈 파일의 저장 세대
+        if os.path.isdir(groups_dir):
+            for path in sorted(glob.glob(os.path.join(groups_dir, "*.json"))):
+                name = os.path.splitext(os.path.basename(path))[0]
+                self._add(name, QuizFileManager(path).load_file())
+        self.matcher = AnswerMatcher()  # 정답 컴파일 결과도 세션 간에 공유
+        self._pools = {}
+        watch_files = [] if quiz_file.lower().endswith(SQLITE_EXTENSIONS) else [quiz_file]
+        self.watcher = FileWatcher(files=watch_files, directories=[groups_dir])
+
+    def _add(self, name, items):
+        items = [QuizItem.from_dict(q) for q in items if q.get("question") and q.get("answers")]
+        if not items:
+            return
+        self.banks[name] = items
+
+    def bank_name(self, path):
+        if path == os.path.abspath(self.quiz_file):
+            return MAIN_BANK
+        return os.path.splitext(os.path.basename(path))[0]
+
+    @staticmethod
+    def read_file(path):
+        """(실행기 스레드) 은행 파일 문서를 읽습니다. 삭제되었으면 빈 dict, 읽을 수 없으면 None"""
+        if not os.path.exists(path):
+            return {}
+        try:
+            return bank_cache.load_json(path)
+        except (OSError, ValueError):
+            return None
+
+    def replace(self, name, document):
+        """은행 하나를 새로 읽은 문서로 교체합니다. 진행 중인 세션은 이전 목록을 그대로 사용합니다."""
+        items = document.get(QuizFileManager.KEY, [])
+        if name == MAIN_BANK:
+            self.generation = document.get(QuizFileManager.GENERATION_KEY) or 0
+        self.banks.pop(name, None)
+        self._pools = {key: pool for key, pool in self._pools.items() if name not in key}
+        self._add(name, items)
+
+    def pool(self, names):
+        """
+        선택한 은행들을 이어 붙인 공유 문제 목록과, 같은 인덱스에 놓인 문제의 은행 이름 목록
+        (같은 조합이면 같은 목록을 재사용. 같은 ID의 문제가 여러 은행에 있어도 출제한 은행으로 기록하기 위함)
+        """
+        key = tuple(sorted(names))
+        if key not in self._pools:
+            self._pools[key] = ([q for name in key for q in self.banks[name]],
+                                [name for name in key for _ in self.banks[name]])
+        return self._pools[key]
+
+
+class LearnerSession:
+    """학습자 한 명의 가벼운 풀이 상태"""
+    __slots__ = ("sid", "user", "pool", "pool_banks", "order", "pos", "score", "failed", "last_seen", "asked_at")
+
+    def __init__(self, user, pool, pool_banks, order):
+        self.sid = secrets.token_urlsafe(12)
+        self.user = user
+        self.pool = pool
+        self.pool_banks = pool_banks
+        self.order = order
+        self.pos = 0
+        self.score = 0
+        self.failed = set()
+        self.last_seen = time.monotonic()
+        self.asked_at = None
+
+    def current(self):
+        return self.pool[self.order[self.pos]] if self.pos < len(self.order) else None
+
+    def current_bank(self):
+        return self.pool_banks[self.order[self.pos]]
+
+    def status(self):
+        return {"session": self.sid, "user": self.user, "index": self.pos, "total": len(self.order),
+                "score": self.score, "failed": len(self.failed)}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class QuizServer:
+    """asyncio 기반 JSON API 서버"""
+
+    def __init__(self, bank, quiz_file="quiz.json", attempts_file="server_attempts.jsonl",
+                 users_file="server_users.json", attempts_dir="attempt_stats"):
+        self.bank = bank
+        self.sessions = {}
+        self.bank_journal = QuizJournal(os.path.splitext(quiz_file)[0] + ".journal")
+        self.attempt_log = QuizJournal(attempts_file)
+        self.attempts = AttemptStore(attempts_dir)  # 실행기 스레드의 _write_batch에서만 사용
+        self.users_file_manager = UserStateFileManager(users_file)
+        self.users = self.users_file_manager.load_file() or {}
+        self._pending = []         # 저장 대기 중인 풀이 기록 [(기록, 문제), ...]
+        self._retry = []           # 저장에 실패해 다시 시도할 묶음 [(기록 목록, 끝난 단계 집합), ...]
+        self._users_dirty = False
+        self._flush_lock = asyncio.Lock()
+        self._flush_wanted = asyncio.Event()
+
+    # ----- 요청 처리 -----
+    def route(self, method, path, body):
+        parts = [p for p in path.split("/") if p]
+        if method == "GET" and not parts:
+            return "text/html; charset=utf-8", INDEX_HTML
+        if parts == ["banks"] and method == "GET":
+            return {"banks": [{"name": name, "count": len(items)} for name, items in self.bank.banks.items()]}
+        if parts == ["sessions"] and method == "POST":
+            return self.create_session(body)
+        if len(parts) >= 2 and parts[0] == "sessions":
+            session = self.sessions.get(parts[1])
+            if session is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, "세션이 없습니다.")
+            session.last_seen = time.monotonic()
+            action = parts[2] if len(parts) > 2 else ""
+            if action == "" and method == "GET":
+                return session.status()
+            if action == "" and method == "DELETE":
+                return self.close_session(session)
+            if action == "question" and method == "GET":
+                return self.question(session)
+            if action == "answer" and method == "POST":
+                return self.answer(session, body)
+        raise HttpError(HTTPStatus.NOT_FOUND, "알 수 없는 요청입니다.")
+
+    def create_session(self, body):
+        user, names, mode = body.get("user"), body.get("banks"), body.get("mode")
+        if not (user is None or isinstance(user, str)):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "user는 문자열이어야 합니다.")
+        if not (names is None or isinstance(names, list) and all(isinstance(name, str) for name in names)):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "banks는 그룹 이름(문자열) 목록이어야 합니다.")
+        if not (mode is None or isinstance(mode, str)):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "mode는 문자열이어야 합니다.")
+        user = (user or "guest")[:64]
+        names = names or list(self.bank.banks)
+        unknown = [name for name in names if name not in self.bank.banks]
+        if unknown:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"없는 그룹입니다: {', '.join(unknown)}")
+        pool, pool_banks = self.bank.pool(names)
+        if mode == "failed":
+            # 이 학습자가 최근에 틀린 문제만 출제
+            failed_ids = set(self.users.get(user, {}).get("last_failed", []))
+            order = array("I", (i for i, q in enumerate(pool) if item_id(q) in failed_ids))
+        else:
+            order = array("I", range(len(pool)))
+        random.shuffle(order)
+        session = LearnerSession(user, pool, pool_banks, order)
+        self.sessions[session.sid] = session
+        return session.status()
+
+    def question(self, session):
+        q_item = session.current()
+        if q_item is None:
+            return {"done": True, **session.status()}
+        session.asked_at = time.monotonic()
+        result = {"id": item_id(q_item), "question": q_item["question"], **session.status()}
+        if q_item.get("hint"):
+            result["hint"] = q_item["hint"]
+        return result
+
+    @instrument.timed("server.answer")
+    def answer(self, session, body):
+        q_item = session.current()
+        if q_item is None:
+            raise HttpError(HTTPStatus.CONFLICT, "모든 문제를 풀었습니다.")
+        qid = item_id(q_item)
+        answer = body.get("answer", "")
+        if not isinstance(answer, str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "answer는 문자열이어야 합니다.")
+        match = self.bank.matcher.grade(q_item, answer.strip())
+        if match:
+            session.score += 1
+            session.failed.discard(qid)
+        else:
+            session.failed.add(qid)
+        ms = round((time.monotonic() - session.asked_at) * 1000) if session.asked_at else 0
+        session.asked_at = None
+        self._pending.append(({"user": session.user, "bank": session.current_bank(), "id": qid, "correct": bool(match),
+                               "ts": round(time.time(), 3), "ms": ms}, q_item))
+        if len(self._pending) >= FLUSH_BATCH:
+            self._flush_wanted.set()
+        session.pos += 1
+        return {"correct": bool(match), "match": match, "answers": q_item["answers"], **session.status()}
+
+    def close_session(self, session):
+        """세션을 끝내고, 이번에 틀린 문제를 학습자의 최근 틀린 문제로 저장합니다."""
+        del self.sessions[session.sid]
+        self.users.setdefault(session.user, {})["last_failed"] = sorted(session.failed)
+        self._users_dirty = True
+        self._flush_wanted.set()
+        return {"done": True, **session.status()}
+
+    # ----- 일괄 저장 -----
+    def _write_batch(self, attempts, done):
+        """
+        (실행기 스레드) 모아 둔 기록을 파일마다 한 번씩 씁니다.
+        끝난 단계는 done에 남기므로, 실패한 묶음을 다시 쓸 때 이미 쓴 파일에 두 번 기록하지 않습니다.
+        """
+        if "log" not in done:
+            self.attempt_log.append_many([a for a, _ in attempts])
+            done.add("log")
+        if "journal" not in done:
+            # 기본 퀴즈 파일 문제의 오답은 QuizApp이 다음 실행 때 반영하도록 저널에 남깁니다.
+            self.bank_journal.append_many([{"op": "wrong", "id": a["id"], "gen": self.bank.generation, "delta": 1}
+                                           for a, _ in attempts if not a["correct"] and a["bank"] == MAIN_BANK])
+            done.add("journal")
+        if "recorded" not in done:
+            for a, q_item in attempts:
+                self.attempts.record(q_item, a["correct"], a["ms"], a["bank"], a["ts"])
+            done.add("recorded")
+        self.attempts.flush()  # 실패하면 버퍼가 남아 있으므로 다시 시도할 때 flush만 합니다.
+
+    async def flush(self):
+        async with self._flush_lock:
+            loop = asyncio.get_running_loop()
+            batches, self._retry = self._retry, []
+            if self._pending:
+                batches.append((self._pending, set()))
+                self._pending = []
+            for attempts, done in batches:
+                try:
+                    await loop.run_in_executor(None, self._write_batch, attempts, done)
+                except Exception as e:
+                    print(f"[경고] 풀이 기록 {len(attempts)}건을 저장하지 못해 다음에 다시 시도합니다: {e}", file=sys.stderr)
+                    self._retry.append((attempts, done))
+            if self._users_dirty:
+                users = json.loads(json.dumps(self.users))
+                self._users_dirty = False
+                if not await loop.run_in_executor(None, self.users_file_manager.save_file, users):
+                    self._users_dirty = True  # 다음 주기에 다시 저장
+
+    async def flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_wanted.wait(), FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wanted.clear()
+            try:
+                self._expire_sessions()
+                await self.reload_changes()
+                await self.flush()
+            except Exception:
+                # 한 번의 실패로 저장 작업이 멈추지 않도록 기록만 남기고 다음 주기에 계속합니다.
+                traceback.print_exc()
+
+    async def reload_changes(self):
+        """은행 파일이 바뀌었으면 바뀐 파일만 다시 읽어 교체합니다."""
+        loop = asyncio.get_running_loop()
+        for path in self.bank.watcher.changes():
+            document = await loop.run_in_executor(None, QuizBank.read_file, path)
+            if document is None:
+                print(f"[경고] '{path}' 파일을 읽지 못해 이전 내용을 유지합니다.", file=sys.stderr)
+                continue
+            name = self.bank.bank_name(path)
+            self.bank.replace(name, document)
+            print(f"[알림] '{name}' 은행 갱신: 문제 {len(self.bank.banks.get(name, ()))}개")
+
+    def _expire_sessions(self):
+        now = time.monotonic()
+        for session in [s for s in self.sessions.values() if now - s.last_seen > SESSION_TTL]:
+            self.close_session(session)
+
+    # ----- HTTP -----
+    async def handle_client(self, reader, writer):
+        """HTTP/1.1 연결 하나를 처리합니다. (keep-alive 지원)"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "Content-Length가 올바르지 않습니다."}, False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "요청이 너무 큽니다."}, False)
+                    break
+                raw_body = await reader.readexactly(length) if length else b""
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version.upper() == "HTTP/1.1")
+                try:
+                    body = json.loads(raw_body) if raw_body else {}
+                    if not isinstance(body, dict):
+                        raise HttpError(HTTPStatus.BAD_REQUEST, "JSON 객체가 필요합니다.")
+                    status, result = HTTPStatus.OK, self.route(method.upper(), urlsplit(target).path, body)
+                except json.JSONDecodeError:
+                    status, result = HTTPStatus.BAD_REQUEST, {"error": "JSON 형식이 올바르지 않습니다."}
+                except HttpError as e:
+                    status, result = e.status, {"error": str(e)}
+                except Exception:
+                    traceback.print_exc()
+                    status, result = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "서버 내부 오류입니다."}
+                await self._respond(writer, status, result, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, result, keep_alive):
+        if isinstance(result, tuple):
+            content_type, payload = result[0], result[1].encode("utf-8")
+        else:
+            content_type, payload = "application/json; charset=utf-8", json.dumps(result, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        flusher = asyncio.create_task(self.flush_loop())
+        total = sum(len(items) for items in self.bank.banks.values())
+        print(f"퀴즈 서버 시작: http://{host}:{port}/ (은행 {len(self.bank.banks)}개, 문제 {total}개)")
+        try:
+            # SIGTERM(kill)으로도 기록을 저장하고 정상 종료합니다. (Windows는 Ctrl+C만 지원)
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, server.close)
+        except (NotImplementedError, AttributeError):
+            pass
+        try:
+            async with server:
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            flusher.cancel()
+            for session in list(self.sessions.values()):
+                self.close_session(session)
+            await self.flush()
+            self.attempt_log.close()
+            self.bank_journal.close()
+            self.bank.watcher.close()
+
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>퀴즈</title></head>
+<body>
+<h1>퀴즈</h1>
+<div id="start">
+  이름 <input id="user"> <label><input type="checkbox" id="failed"> 최근 틀린 문제만</label>
+  <button onclick="start()">시작</button>
+</div>
+<div id="quiz" hidden>
+  <p id="status"></p>
+  <pre id="question"></pre>
+  <p id="hint"></p>
+  <input id="answer" size="60" onkeydown="if (event.key === 'Enter') send()">
+  <button onclick="send()">제출</button> <button onclick="finish()">종료</button>
+  <p id="result"></p>
+</div>
+<script>
+let sid = null;
+async function call(method, path, body) {
+  const r = await fetch(path, {method, body: body ? JSON.stringify(body) : undefined});
+  return r.json();
+}
+async function start() {
+  const s = await call("POST", "/sessions", {user: document.getElementById("user").value,
+                                             mode: document.getElementById("failed").checked ? "failed" : "all"});
+  if (s.error) { alert(s.error); return; }
+  sid = s.session;
+  document.getElementById("start").hidden = true;
+  document.getElementById("quiz").hidden = false;
+  next();
+}
+async function next() {
+  const q = await call("GET", `/sessions/${sid}/question`);
+  document.getElementById("status").textContent = `${q.index + 1}/${q.total} · 점수 ${q.score}`;
+  if (q.done) { finish(); return; }
+  document.getElementById("question").textContent = q.question;
+  document.getElementById("hint").textContent = q.hint ? `힌트: ${q.hint}` : "";
+  document.getElementById("answer").value = "";
+  document.getElementById("answer").focus();
+}
+async function send() {
+  const a = await call("POST", `/sessions/${sid}/answer`, {answer: document.getElementById("answer").value});
+  document.getElementById("result").textContent =
+    (a.correct ? "정답입니다! " : "틀렸습니다. ") + "정답: " + a.answers.join(" || ");
+  next();
+}
+async function finish() {
+  const s = await call("DELETE", `/sessions/${sid}`);
+  document.getElementById("quiz").hidden = true;
+  document.body.insertAdjacentHTML("beforeend", `<p>총 ${s.index}문제 중 ${s.score}문제 정답</p>`);
+}
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="여러 학습자용 로컬 퀴즈 서버")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--quiz", default="quiz.json", help="기본 퀴즈 파일")
+    arg_parser.add_argument("--groups", default=os.path.join("..", "quiz_groups"), help="그룹 퀴즈 폴더")
+    instrument.add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    def main():
+        try:
+            asyncio.run(QuizServer(QuizBank(args.quiz, args.groups), args.quiz).serve(args.host, args.port))
+        except KeyboardInterrupt:
+            print("\n퀴즈 서버를 종료합니다.", file=sys.stderr)
+
+    instrument.run(main, args)
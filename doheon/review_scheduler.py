@@ -0,0 +1,121 @@
+# review_scheduler.py
+import os
+import json
+import time
+import heapq
+from file_manager import write_atomic
+
+MINUTE = 60
+DAY = 24 * 60 * MINUTE
+
+
+class ReviewScheduler:
+    """
+    간격 반복(spaced repetition) 복습 일정을 관리하는 클래스
+    - 문제별 상태(다음 복습 시각, 간격, 연속 정답, 오답 누적)를 파일에 저장합니다.
+    - 복습 순서는 ReviewQueue(우선순위 큐)로 뽑습니다.
+    """
+    RETRY_DELAY = 10 * MINUTE   # 틀린 문제를 다시 내기까지의 시간
+    FIRST_INTERVAL = DAY        # 처음 맞힌 뒤의 복습 간격
+    GROWTH = 2.5                # 연속으로 맞힐 때마다 간격을 늘리는 비율
+
+    def __init__(self, file_path, key_fn):
+        self.file_path = file_path
+        self.key_fn = key_fn
+        self.state = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"복습 일정 파일을 읽지 못했습니다. 새로 시작합니다: {e}")
+            return {}
+
+    def save(self):
+        """복습 일정을 임시 파일에 쓴 뒤 교체합니다. (저장 도중 종료되어도 이전 일정이 남음)"""
+        try:
+            write_atomic(self.file_path, json.dumps(self.state, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            print(f"복습 일정 저장 중 오류 발생: {e}")
+
+    def difficulty(self, q_item: dict):
+        """오답 횟수와 복습 중 틀린 횟수를 합친 난이도 (클수록 먼저 출제)"""
+        st = self.state.get(self.key_fn(q_item), {})
+        return q_item.get("wrong_count", 0) + st.get("lapses", 0) - 0.5 * st.get("streak", 0)
+
+    def due(self, q_item: dict):
+        """다음 복습 시각. 한 번도 풀지 않은 문제는 0(즉시)입니다."""
+        return self.state.get(self.key_fn(q_item), {}).get("due", 0)
+
+    def record(self, q_item: dict, correct: bool, now=None):
+        """풀이 결과를 반영해 다음 복습 시각을 계산합니다."""
+        now = time.time() if now is None else now
+        st = self.state.setdefault(self.key_fn(q_item), {"interval": 0, "streak": 0, "lapses": 0, "attempts": 0})
+        st["attempts"] += 1
+        if correct:
+            st["streak"] += 1
+            st["interval"] = self.FIRST_INTERVAL if st["interval"] < self.FIRST_INTERVAL else st["interval"] * self.GROWTH
+            # 자주 틀렸던 문제는 간격을 덜 늘립니다.
+            interval = st["interval"] / (1 + 0.5 * min(q_item.get("wrong_count", 0), 6))
+        else:
+            st["streak"] = 0
+            st["lapses"] += 1
+            st["interval"] = 0
+            interval = self.RETRY_DELAY
+        st["due"] = now + interval
+
+    def queue(self, items, respect_due=True):
+        return ReviewQueue(self, items, respect_due)
+
+
+class ReviewQueue:
+    """
+    (복습 시각, -난이도) 순으로 문제를 꺼내는 우선순위 큐
+    - 꺼내기/다시 넣기는 O(log n)이며, 같은 문제가 다시 들어오면 이전 항목은 꺼낼 때 버립니다.
+    - respect_due가 False면 복습 시각은 보지 않고 난이도(많이 틀린 것)가 높은 순으로 모두 꺼냅니다.
+    """
+
+    def __init__(self, scheduler: ReviewScheduler, items, respect_due=True):
+        self.scheduler = scheduler
+        self.respect_due = respect_due
+        self._items = {}
+        self._version = {}
+        self._heap = []
+        self._seq = 0
+        for q_item in items:
+            self._heap.append(self._entry(q_item))
+        heapq.heapify(self._heap)
+
+    def _entry(self, q_item):
+        key = self.scheduler.key_fn(q_item)
+        self._seq += 1
+        self._items[key] = q_item
+        self._version[key] = self._seq
+        if not self.respect_due:
+            return (-self.scheduler.difficulty(q_item), self._seq, key)
+        return (self.scheduler.due(q_item), -self.scheduler.difficulty(q_item), self._seq, key)
+
+    def push(self, q_item):
+        heapq.heappush(self._heap, self._entry(q_item))
+
+    def pop(self, now=None):
+        """다음 문제를 꺼냅니다. 복습할 문제가 없으면 None을 반환합니다."""
+        now = time.time() if now is None else now
+        while self._heap:
+            entry = self._heap[0]
+            seq, key = entry[-2:]
+            if self._version.get(key) != seq:
+                heapq.heappop(self._heap)  # 다시 넣으면서 무효가 된 항목
+                continue
+            if self.respect_due and entry[0] > now:
+                return None
+            heapq.heappop(self._heap)
+            del self._version[key]
+            return self._items.pop(key)
+        return None
+
+    def __len__(self):
+        return len(self._version)
@@ -0,0 +1,173 @@
+# search_index.py
+import os
+import re
+import sys
+import glob
+import math
+import time
+import unicodedata
+import argparse
+from collections import defaultdict
+from quiz_ids import item_id
+
+FIELD_WEIGHTS = (("question", 3.0), ("answers", 2.0), ("hint", 1.0))
+
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _tokens(text: str):
+    """공백/구두점 기준으로 나눈 토큰 목록 (한글 음절은 분해하지 않음)"""
+    return TOKEN_RE.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def text_grams(text: str):
+    """
+    검색 단위(n-gram) 목록을 만듭니다.
+    한국어는 조사가 붙어 띄어쓰기 단위가 일정하지 않으므로 토큰 안의 음절 2-gram을 쓰고,
+    한 글자 검색을 위해 1-gram도 함께 만듭니다.
+    """
+    grams = []
+    for token in _tokens(text):
+        grams.extend(token)
+        grams.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+class SearchIndex:
+    """
+    문제/정답/힌트 전체를 대상으로 하는 역색인 클래스
+    - gram → {문서 키: 가중치} 형태로 저장하며, 아이템 단위로 추가/갱신/삭제할 수 있습니다.
+    - 문서 키는 (그룹 이름, 아이템 ID)입니다.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(dict)
+        self.docs = {}        # 문서 키 → (그룹 이름, 아이템)
+        self._doc_grams = {}  # 문서 키 → gram 목록 (갱신/삭제용)
+        self._doc_len = {}    # 문서 키 → gram 가중치 합 (길이 보정용)
+        self._total_len = 0.0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, q_item: dict, group="quiz"):
+        """아이템을 색인합니다. 이미 있으면 현재 내용으로 다시 색인합니다."""
+        key = (group, item_id(q_item))
+        if key in self.docs:
+            self.remove(key)
+        weights = {}
+        for field, weight in FIELD_WEIGHTS:
+            value = q_item.get(field)
+            if not value:
+                continue
+            text = " ".join(value) if isinstance(value, (list, tuple)) else value
+            for gram in text_grams(text):
+                weights[gram] = weights.get(gram, 0.0) + weight
+        postings = self.postings
+        for gram, w in weights.items():
+            postings[gram][key] = w
+        self.docs[key] = (group, q_item)
+        self._doc_grams[key] = list(weights)
+        self._doc_len[key] = sum(weights.values())
+        self._total_len += self._doc_len[key]
+
+    def add_all(self, items, group="quiz"):
+        for q_item in items:
+            self.add(q_item, group)
+
+    def remove_group(self, group):
+        """그룹에 속한 문서를 모두 색인에서 뺍니다."""
+        for key in [key for key in self.docs if key[0] == group]:
+            self.remove(key)
+
+    def remove(self, key):
+        for gram in self._doc_grams.pop(key, ()):
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self.postings[gram]
+        self.docs.pop(key, None)
+        self._total_len -= self._doc_len.pop(key, 0.0)
+
+    def search(self, query: str, limit=10):
+        """
+        검색어와 겹치는 gram이 많고 드문 gram일수록 높은 점수를 줍니다. (BM25 방식, 긴 문서는 보정)
+        반환값: [(점수, 그룹 이름, 아이템), ...] 점수 내림차순
+        """
+        grams = set(text_grams(query))
+        # 두 글자 이상 검색어는 2-gram만 사용해 흔한 1-gram 목록을 훑지 않습니다.
+        if any(len(g) > 1 for g in grams):
+            grams = {g for g in grams if len(g) > 1}
+        postings = sorted((self.postings[g] for g in grams if g in self.postings), key=len)
+        if not postings:
+            return []
+
+        n_docs = len(self.docs)
+        avg_len = self._total_len / n_docs
+        doc_len = self._doc_len
+        scores = defaultdict(float)
+        for i, posting in enumerate(postings):
+            # 문서 절반 이상에 나오는 gram은 다른 gram이 있으면 후보를 늘리지 않고 점수만 더합니다.
+            common = i > 0 and len(posting) * 2 > n_docs
+            idf = math.log(1 + n_docs / len(posting))
+            if common:
+                for key in scores:
+                    w = posting.get(key)
+                    if w:
+                        scores[key] += idf * w / (w + 0.5 + 0.5 * doc_len[key] / avg_len)
+                continue
+            for key, w in posting.items():
+                scores[key] += idf * w / (w + 0.5 + 0.5 * doc_len[key] / avg_len)
+
+        best = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        return [(score, *self.docs[key]) for key, score in best]
+
+
+def load_group_files(index: SearchIndex, groups_dir: str):
+    """quiz_groups 폴더의 모든 그룹 파일을 색인에 추가합니다."""
+    from file_manager import QuizFileManager
+    for path in sorted(glob.glob(os.path.join(groups_dir, "*.json"))):
+        group = os.path.splitext(os.path.basename(path))[0]
+        index.add_all(QuizFileManager(path).load_file(), group)
+
+
+def load_group_file(index: SearchIndex, path: str):
+    """그룹 파일 하나를 다시 색인합니다. 파일이 삭제되었으면 해당 그룹을 색인에서 뺍니다."""
+    from file_manager import QuizFileManager
+    group = os.path.splitext(os.path.basename(path))[0]
+    index.remove_group(group)
+    if os.path.exists(path):
+        index.add_all(QuizFileManager(path).load_file(), group)
+
+
+def print_hits(hits):
+    if not hits:
+        print("검색 결과가 없습니다.")
+        return
+    for rank, (score, group, q_item) in enumerate(hits, 1):
+        first_line = q_item.get("question", "").strip().split("\n", 1)[0]
+        print(f"{rank:2d}. [{group}] {first_line}  (점수 {score:.2f})")
+        print(f"    정답: {' || '.join(q_item.get('answers', []))}")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="모든 퀴즈 은행에서 문제를 검색합니다.")
+    arg_parser.add_argument("query", nargs="+", help="검색어")
+    arg_parser.add_argument("--quiz", default="quiz.json", help="기본 퀴즈 파일")
+    arg_parser.add_argument("--groups", default=os.path.join("..", "quiz_groups"), help="그룹 퀴즈 폴더")
+    arg_parser.add_argument("--limit", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    from file_manager import QuizFileManager
+    start = time.perf_counter()
+    index = SearchIndex()
+    index.add_all(QuizFileManager(args.quiz).load_file())
+    if os.path.isdir(args.groups):
+        load_group_files(index, args.groups)
+    built = time.perf_counter()
+    hits = index.search(" ".join(args.query), args.limit)
+    done = time.perf_counter()
+    print_hits(hits)
+    print(f"\n문서 {len(index)}개 색인 {(built - start) * 1000:.1f}ms, 검색 {(done - built) * 1000:.2f}ms", file=sys.stderr)
@@ -0,0 +1,236 @@
+# sqlite_storage.py
+import os
+import json
+import glob
+import sqlite3
+import argparse
+from quiz_ids import question_id
+import instrument
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id          INTEGER PRIMARY KEY,
+    grp         TEXT    NOT NULL,
+    position    INTEGER NOT NULL,
+    qhash       TEXT    NOT NULL,
+    question    TEXT    NOT NULL,
+    answers     TEXT    NOT NULL,   -- JSON 배열
+    hint        TEXT,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    extra       TEXT                -- 그 밖의 키 (JSON 객체)
+);
+CREATE INDEX IF NOT EXISTS idx_items_grp_pos ON items(grp, position);
+CREATE INDEX IF NOT EXISTS idx_items_grp_wrong ON items(grp, wrong_count);
+CREATE INDEX IF NOT EXISTS idx_items_qhash ON items(qhash, grp);
+CREATE TABLE IF NOT EXISTS refs (       -- 세션 상태(최근 틀린 문제 등)의 아이템 ID 목록
+    grp      TEXT    NOT NULL,
+    position INTEGER NOT NULL,
+    ref      TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_refs_grp ON refs(grp, position);
+CREATE TABLE IF NOT EXISTS meta (       -- 그룹별 저장 세대 (저널 재적용 판단용)
+    grp        TEXT    PRIMARY KEY,
+    generation INTEGER NOT NULL
+);
+"""
+
+BASE_KEYS = ("question", "answers", "hint", "wrong_count")
+
+
+def _item_to_row(grp, position, item):
+    extra = {k: v for k, v in item.items() if k not in BASE_KEYS}
+    return (grp, position, question_id(item.get("question", "")), item.get("question", ""),
+            json.dumps(item.get("answers", []), ensure_ascii=False), item.get("hint"),
+            item.get("wrong_count", 0), json.dumps(extra, ensure_ascii=False) if extra else None)
+
+
+def _row_to_item(row):
+    question, answers, hint, wrong_count, extra = row
+    item = {"question": question, "answers": json.loads(answers), "wrong_count": wrong_count}
+    if hint:
+        item["hint"] = hint
+    if extra:
+        item.update(json.loads(extra))
+    return item
+
+
+class SQLiteQuizFileManager:
+    """
+    QuizFileManager와 같은 load_file/save_file 인터페이스를 가진 SQLite 저장소 클래스
+    - 하나의 DB 파일에 여러 그룹(quiz, last_failed, quiz_groups의 각 파일)을 저장합니다.
+    - 아이템 단위 갱신과 그룹/오답 횟수/문제 해시 기반 조회를 지원합니다.
+    """
+    KEY = "quiz"
+    SELECT_COLUMNS = "question, answers, hint, wrong_count, extra"
+
+    def __init__(self, file_path, group=None):
+        self.file_path = file_path
+        self.group = group or self.KEY
+        self.generation = None  # QuizFileManager.generation과 같은 의미
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.file_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _save_generation(self, conn):
+        """저장 세대를 아이템 변경과 같은 트랜잭션에서 기록합니다."""
+        if self.generation is not None:
+            conn.execute("INSERT OR REPLACE INTO meta (grp, generation) VALUES (?, ?)", (self.group, self.generation))
+
+    @instrument.timed("file.load")
+    def load_file(self):
+        """그룹에 속한 퀴즈 데이터를 저장 순서대로 불러옵니다."""
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT generation FROM meta WHERE grp = ?", (self.group,)).fetchone()
+            self.generation = row[0] if row else None
+            rows = conn.execute(
+                f"SELECT {self.SELECT_COLUMNS} FROM items WHERE grp = ? ORDER BY position", (self.group,))
+            return [_row_to_item(row) for row in rows]
+        except sqlite3.Error as e:
+            print(f"파일 로드 중 오류 발생: {e}")
+            return []
+
+    @instrument.timed("file.save")
+    def save_file(self, file_data):
+        """그룹 전체를 주어진 데이터로 교체하고 성공 여부를 반환합니다."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM items WHERE grp = ?", (self.group,))
+                conn.executemany(
+                    "INSERT INTO items (grp, position, qhash, question, answers, hint, wrong_count, extra) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (_item_to_row(self.group, pos, item) for pos, item in enumerate(file_data)))
+                self._save_generation(conn)
+            return True
+        except sqlite3.Error as e:
+            print(f"파일 저장 중 오류 발생: {e}")
+            return False
+
+    @instrument.timed("file.update_items")
+    def update_items(self, items):
+        """변경된 아이템만 갱신합니다. 그룹에 없는 아이템은 끝에 추가합니다."""
+        try:
+            conn = self._connect()
+            with conn:
+                next_pos = conn.execute(
+                    "SELECT COALESCE(MAX(position), -1) + 1 FROM items WHERE grp = ?", (self.group,)).fetchone()[0]
+                for item in items:
+                    row = _item_to_row(self.group, next_pos, item)
+                    cur = conn.execute(
+                        "UPDATE items SET question = ?, answers = ?, hint = ?, wrong_count = ?, extra = ? "
+                        "WHERE grp = ? AND qhash = ?", row[3:] + (self.group, row[2]))
+                    if cur.rowcount == 0:
+                        conn.execute(
+                            "INSERT INTO items (grp, position, qhash, question, answers, hint, wrong_count, extra) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+                        next_pos += 1
+                self._save_generation(conn)
+            return True
+        except sqlite3.Error as e:
+            print(f"파일 저장 중 오류 발생: {e}")
+            return False
+
+    def update_item(self, item):
+        return self.update_items([item])
+
+    def find_by_hash(self, qhash, group=None):
+        """문제 해시(아이템 ID)로 아이템을 찾습니다. group을 생략하면 현재 그룹에서 찾습니다."""
+        row = self._connect().execute(
+            f"SELECT {self.SELECT_COLUMNS} FROM items WHERE qhash = ? AND grp = ?",
+            (qhash, group or self.group)).fetchone()
+        return _row_to_item(row) if row else None
+
+    def query(self, group=None, min_wrong_count=None, order_by_wrong=False, limit=None):
+        """
+        조건에 맞는 아이템 목록을 반환합니다.
+        - group: 그룹 이름 (None이면 현재 그룹, '*'이면 전체)
+        - min_wrong_count: 오답 횟수 하한
+        - order_by_wrong: 오답 횟수 내림차순 정렬 여부
+        """
+        sql = f"SELECT {self.SELECT_COLUMNS} FROM items WHERE 1 = 1"
+        params = []
+        group = group or self.group
+        if group != "*":
+            sql += " AND grp = ?"
+            params.append(group)
+        if min_wrong_count is not None:
+            sql += " AND wrong_count >= ?"
+            params.append(min_wrong_count)
+        sql += " ORDER BY wrong_count DESC, position" if order_by_wrong else " ORDER BY grp, position"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_row_to_item(row) for row in self._connect().execute(sql, params)]
+
+    def groups(self):
+        """DB에 저장된 그룹 이름과 문제 수를 반환합니다."""
+        return self._connect().execute("SELECT grp, COUNT(*) FROM items GROUP BY grp ORDER BY grp").fetchall()
+
+
+class SQLiteLastFailedFileManager(SQLiteQuizFileManager):
+    """최근 틀린 문제의 ID 목록을 SQLite에 저장하는 클래스"""
+    KEY = "last_failed"
+
+    def load_file(self):
+        try:
+            rows = self._connect().execute(
+                "SELECT ref FROM refs WHERE grp = ? ORDER BY position", (self.group,))
+            return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            print(f"파일 로드 중 오류 발생: {e}")
+            return []
+
+    def save_file(self, file_data):
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM refs WHERE grp = ?", (self.group,))
+                conn.executemany("INSERT INTO refs (grp, position, ref) VALUES (?, ?, ?)",
+                                 ((self.group, pos, ref) for pos, ref in enumerate(file_data)))
+            return True
+        except sqlite3.Error as e:
+            print(f"파일 저장 중 오류 발생: {e}")
+            return False
+
+
+def migrate_json_to_sqlite(db_path, quiz_file=None, groups_dir=None):
+    """quiz.json과 quiz_groups/*.json을 하나의 SQLite 파일로 옮기고 그룹별 문제 수를 반환합니다."""
+    from file_manager import QuizFileManager
+
+    sources = []
+    if quiz_file and os.path.exists(quiz_file):
+        sources.append((SQLiteQuizFileManager.KEY, quiz_file))
+    if groups_dir:
+        for path in sorted(glob.glob(os.path.join(groups_dir, "*.json"))):
+            sources.append((os.path.splitext(os.path.basename(path))[0], path))
+
+    migrated = {}
+    for group, path in sources:
+        items = QuizFileManager(path).load_file()
+        storage = SQLiteQuizFileManager(db_path, group=group)
+        if storage.save_file(items):
+            migrated[group] = len(items)
+        storage.close()
+    return migrated
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="JSON 퀴즈 파일을 SQLite DB로 옮깁니다.")
+    arg_parser.add_argument("db", help="생성할 SQLite 파일 경로 (예: quiz.db)")
+    arg_parser.add_argument("--quiz", default="quiz.json", help="기본 퀴즈 파일 (그룹 이름 'quiz')")
+    arg_parser.add_argument("--groups", default=os.path.join("..", "quiz_groups"), help="그룹 퀴즈 폴더")
+    args = arg_parser.parse_args()
+
+    for group, count in migrate_json_to_sqlite(args.db, args.quiz, args.groups).items():
+        print(f"{group}: {count}문제")
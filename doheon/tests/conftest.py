@@ -0,0 +1,39 @@
+# conftest.py
+import os
+import sys
+import pytest
+
+# 모듈들이 doheon 폴더 기준으로 서로를 import 하므로 테스트도 같은 경로에서 불러옵니다.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_manager import open_storage  # noqa: E402
+
+
+def write_bank(path, items):
+    """테스트용 문제 은행 파일(.json 또는 .db)을 만듭니다."""
+    storage = open_storage(str(path))
+    assert storage.save_file(items)
+    if hasattr(storage, "close"):
+        storage.close()
+
+
+@pytest.fixture
+def make_app(tmp_path, monkeypatch):
+    """임시 폴더에서 QuizApp을 만드는 함수. 테스트가 끝나면 감시/저널을 닫습니다."""
+    from quiz_core import QuizApp
+
+    monkeypatch.chdir(tmp_path)
+    apps = []
+
+    def factory(items=None, quiz_file="quiz.json", **kwargs):
+        if items is not None and not os.path.exists(quiz_file):
+            write_bank(quiz_file, items)
+        kwargs.setdefault("groups_dir", "quiz_groups")
+        app = QuizApp(quiz_file=quiz_file, **kwargs)
+        apps.append(app)
+        return app
+
+    yield factory
+    for app in apps:
+        app.watcher.close()
+        app.journal.close()
@@ -0,0 +1,86 @@
+# test_answer_matcher.py
+import pytest
+from answer_matcher import AnswerMatcher, bounded_edit_distance, syllable_edit_distance, syllables, normalize_answer
+from quiz_item import QuizItem
+
+
+def grade(answers, user_answer):
+    return AnswerMatcher().grade(QuizItem("문제", answers), user_answer)
+
+
+@pytest.mark.parametrize("answers, user_answer, expected", [
+    (["데이터 링크 계층"], "데이터 링크 계층", "exact"),
+    (["데이터 링크 계층"], "데이터링크계층", "normal"),
+    (["TCP/IP"], "tcp/ip", "normal"),
+    (["서면으로 제출된 기고서"], "“서면으로 제출된 기고서”.", "normal"),
+    (["ＡＢＣ"], "abc", "normal"),
+    (["기밀성, 무결성, 가용성"], "가용성, 기밀성, 무결성", "tokens"),
+    (["통신 프로토콜의 기본 요소"], "통신 프로토컬의 기본 요소", "fuzzy"),
+    (["데이터베이스 관리 시스템"], "데이타베이스 관리 시스템", "fuzzy"),
+    (["요구사항 명세서를 작성한다"], "요구사항 명세서을 작성한다", "fuzzy"),
+    (["interrupt service routine"], "interupt service routine", "fuzzy"),
+])
+def test_accepted_variants(answers, user_answer, expected):
+    assert grade(answers, user_answer) == expected
+
+
+@pytest.mark.parametrize("answer, user_answer", [
+    ("C", "C++"),
+    ("C", "C#"),
+    ("1", "-1"),
+    ("25", "2.5"),
+    ("a>b", "a<b"),
+    ("103", "10^3"),
+    ("km/h", "h/km"),
+    ("3계층 스위치", "2계층 스위치"),
+    ("포트 번호 8080번을 사용", "포트 번호 8081번을 사용"),
+])
+def test_symbols_and_digits_change_meaning(answer, user_answer):
+    assert grade([answer], user_answer) is None
+
+
+@pytest.mark.parametrize("answer, user_answer", [
+    ("내부 인터럽트가 발생하면 현재 작업을 중단한다", "외부 인터럽트가 발생하면 현재 작업을 중단한다"),
+    ("전이중 방식은 양방향으로 동시에 전송한다", "반이중 방식은 양방향으로 동시에 전송한다"),
+    ("정적 바인딩은 컴파일 시점에 결정된다", "동적 바인딩은 컴파일 시점에 결정된다"),
+    ("요구사항을 상향식으로 분석", "요구사항을 하향식으로 분석"),
+    ("비동기 전송 방식을 사용한다", "동기 전송 방식을 사용한다"),
+])
+def test_syllable_swaps_are_not_typos(answer, user_answer):
+    assert grade([answer], user_answer) is None
+
+
+def test_syllable_edit_distance():
+    def dist(a, b, limit=3):
+        return syllable_edit_distance(syllables(normalize_answer(a)), syllables(normalize_answer(b)), limit)
+    assert dist("프로토콜", "프로토컬") == 1
+    assert dist("간", "가") == 1      # 받침 하나
+    assert dist("외부", "내부") == 4  # 초성과 중성을 함께 바꿀 수 없음
+    assert dist("비동기", "동기") == 4  # 음절을 통째로 뺄 수 없음
+    assert dist("abc", "ab") == 1
+
+
+def test_short_answers_allow_no_typos():
+    assert grade(["간"], "감") is None
+    assert grade(["IP"], "IQ") is None
+
+
+def test_compiled_answers_follow_content_id_and_answer_changes():
+    matcher = AnswerMatcher()
+    q_item = QuizItem("OSI 1계층은?", ["물리 계층"])
+    first = matcher.compile(q_item)
+    reloaded = QuizItem("OSI 1계층은?", ["물리 계층"])  # 다시 읽은 같은 문제 (다른 객체)
+    assert matcher.compile(reloaded) is first
+    reloaded.add_answers(["physical"])
+    assert matcher.grade(reloaded, "Physical") == "normal"
+    assert matcher.grade(QuizItem("OSI 2계층은?", ["데이터 링크"]), "물리 계층") is None
+
+
+@pytest.mark.parametrize("a, b, limit, expected", [
+    ("kitten", "sitting", 3, 3),
+    ("kitten", "sitting", 2, 3),
+    ("same", "same", 1, 0),
+    ("abc", "", 2, 3),
+])
+def test_bounded_edit_distance(a, b, limit, expected):
+    assert bounded_edit_distance(a, b, limit) == expected
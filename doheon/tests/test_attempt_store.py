@@ -0,0 +1,89 @@
+# test_attempt_store.py
+import os
+import attempt_store
+from attempt_store import DAY, AttemptStore
+
+
+def item(n):
+    return {"question": f"문제 {n}", "answers": ["답"]}
+
+
+def fill(store, rows):
+    """rows: [(문제 번호, 시각, 정답 여부), ...]"""
+    for n, ts, ok in rows:
+        store.record(item(n), ok, 100, "그룹", ts)
+    store.flush()
+
+
+def brute_force(rows, since):
+    counts = {}
+    for n, ts, ok in rows:
+        if since is None or ts >= since:
+            count = counts.setdefault(n, [0, 0])
+            count[0] += 1
+            count[1] += ok
+    return counts
+
+
+def test_torn_tail_is_ignored_and_trimmed(tmp_path):
+    store = AttemptStore(str(tmp_path / "stats"), flush_rows=None)
+    fill(store, [(1, 10 * DAY, True), (2, 10 * DAY, False)])
+    item_path = store.column_path("item", ".u64")
+    ts_path = store.column_path("ts", ".u32")
+    with open(item_path, "ab") as f:
+        f.write(b"\x01\x02\x03")  # 8바이트 중 3바이트만 쓰고 끊긴 행
+    with open(ts_path, "ab") as f:
+        f.write(b"\x00" * 4)      # 다른 열에는 없는 한 행
+    with store.columns() as cols:
+        assert cols.rows == 2
+        assert list(cols.views["correct"]) == [1, 0]
+    assert os.path.getsize(item_path) == 2 * 8 and os.path.getsize(ts_path) == 2 * 4
+    assert store.total() == (2, 1)
+
+
+def test_columns_tolerate_partial_row_without_trim(tmp_path):
+    store = AttemptStore(str(tmp_path / "stats"), flush_rows=None)
+    fill(store, [(1, 10 * DAY, True)])
+    with open(store.column_path("ms", ".u32"), "ab") as f:
+        f.write(b"\x07")
+    with attempt_store._Columns(store) as cols:  # 잘라 내기 전의 뷰도 cast에 실패하지 않음
+        assert cols.rows == 1 and list(cols.views["ms"]) == [100]
+
+
+def test_summary_since_counts_unsorted_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(attempt_store, "SEGMENT_ROWS", 4)
+    store = AttemptStore(str(tmp_path / "stats"), flush_rows=None)
+    # 앱(버퍼 기록)과 서버가 함께 쓰면 시각이 뒤섞여 덧붙여집니다.
+    days = [20, 12, 19, 11, 15, 20, 10, 18, 13, 14, 20, 16, 17, 12]
+    rows = [(i % 5, day * DAY + i, i % 3 == 0) for i, day in enumerate(days)]
+    fill(store, rows)
+    for since in (None, 10 * DAY, 15 * DAY, 15 * DAY + 100, 20 * DAY, 21 * DAY):
+        stats = store.item_stats(since)
+        expected = {f"{int(attempt_store.item_id(item(n)), 16):016x}": tuple(c) for n, c in brute_force(rows, since).items()}
+        assert stats == expected, since
+    # 구간 집계를 저장한 뒤 다시 조회해도 같아야 함
+    assert store.item_stats(15 * DAY) == AttemptStore(store.directory).item_stats(15 * DAY)
+
+
+def test_trend_uses_only_days_in_range(tmp_path):
+    store = AttemptStore(str(tmp_path / "stats"), flush_rows=None)
+    fill(store, [(1, 30 * DAY, True), (1, 5 * DAY, False), (2, 29 * DAY, False)])
+    assert store.trend(days=3, now=30 * DAY) == [(29, 1, 0), (30, 1, 1)]
+
+
+def test_reading_missing_store_creates_nothing(tmp_path):
+    store = AttemptStore(str(tmp_path / "stats"))
+    assert store.total() == (0, 0)
+    assert not os.path.exists(store.directory)
+
+
+def test_failed_rollup_save_leaves_no_temp_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(attempt_store, "SEGMENT_ROWS", 2)
+    store = AttemptStore(str(tmp_path / "stats"), flush_rows=None)
+    fill(store, [(1, 10 * DAY, True), (2, 10 * DAY, False), (3, 10 * DAY, True)])
+
+    def fail(src, dst):
+        raise OSError("디스크 가득 참")
+    monkeypatch.setattr(os, "replace", fail)
+    assert len(store.item_stats()) == 3
+    assert not [name for name in os.listdir(store.directory) if name.startswith(".tmp_")]
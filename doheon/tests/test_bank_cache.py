@@ -0,0 +1,57 @@
+# test_bank_cache.py
+import os
+import json
+import bank_cache
+
+DOCUMENT = {"quiz": [{"question": "캐시 문제", "answers": ["답"], "wrong_count": 0}]}
+
+
+def write_json(path, document=DOCUMENT):
+    path.write_text(json.dumps(document, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+def test_first_load_builds_cache_and_second_load_uses_it(tmp_path, monkeypatch):
+    path = write_json(tmp_path / "quiz.json")
+    assert bank_cache.load_json(path) == DOCUMENT
+    assert os.path.exists(bank_cache.cache_path(path))
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("캐시가 있는데 JSON을 다시 파싱했습니다.")
+    monkeypatch.setattr(json, "loads", no_parse)
+    assert bank_cache.load_json(path) == DOCUMENT
+
+
+def test_changed_source_is_parsed_again(tmp_path):
+    path = write_json(tmp_path / "quiz.json")
+    bank_cache.load_json(path)
+    changed = {"quiz": DOCUMENT["quiz"] + [{"question": "추가", "answers": ["x"]}]}
+    write_json(tmp_path / "quiz.json", changed)
+    assert bank_cache.load_json(path) == changed
+
+
+def test_touched_source_with_same_content_reuses_cache(tmp_path, monkeypatch):
+    path = write_json(tmp_path / "quiz.json")
+    bank_cache.load_json(path)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    monkeypatch.setattr(json, "loads", lambda *a, **k: (_ for _ in ()).throw(AssertionError("다시 파싱함")))
+    assert bank_cache.load_json(path) == DOCUMENT
+
+
+def test_corrupt_cache_falls_back_to_json(tmp_path):
+    path = write_json(tmp_path / "quiz.json")
+    bank_cache.load_json(path)
+    with open(bank_cache.cache_path(path), "wb") as f:
+        f.write(b"QBC1\xff\xff")
+    assert bank_cache.load_json(path) == DOCUMENT
+
+
+def test_failed_cache_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    path = write_json(tmp_path / "quiz.json")
+
+    def fail(src, dst):
+        raise OSError("디스크 가득 참")
+    monkeypatch.setattr(os, "replace", fail)
+    assert bank_cache.load_json(path) == DOCUMENT  # 캐시 저장 실패는 무시
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["quiz.json"]
@@ -0,0 +1,76 @@
+# test_batch_grade.py
+import os
+import json
+import argparse
+import batch_grade
+from conftest import write_bank
+from attempt_store import AttemptStore
+from file_manager import open_storage
+from quiz_ids import item_id
+
+ITEMS = [{"question": "C 계열 언어 중 객체지향을 처음 더한 것은?", "answers": ["C++"], "wrong_count": 0},
+         {"question": "10의 세제곱은?", "answers": ["10^3"], "wrong_count": 1}]
+
+
+def write_sheet(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return str(path)
+
+
+def run(tmp_path, sheet, group=None, dry_run=False):
+    args = argparse.Namespace(sheets=[sheet], group=group, quiz=str(tmp_path / "quiz.json"),
+                              groups=str(tmp_path / "groups"), out=str(tmp_path / "out"),
+                              attempts=str(tmp_path / "stats"), dry_run=dry_run)
+    batch_grade.main(args)
+
+
+def test_grading_updates_main_bank_and_attempts(tmp_path):
+    write_bank(tmp_path / "quiz.json", ITEMS)
+    sheet = write_sheet(tmp_path / "sheet.jsonl", [
+        {"user": "가", "id": item_id(ITEMS[0]), "answer": "c++"},
+        {"user": "나", "id": item_id(ITEMS[0]), "answer": "C"},       # C++ → C 오인 채점 방지
+        {"user": "가", "question": ITEMS[1]["question"], "answer": "103"},
+        {"user": "나", "id": "없는 문제", "answer": "x"}])
+    run(tmp_path, sheet)
+    saved = open_storage(str(tmp_path / "quiz.json")).load_file()
+    assert [q["wrong_count"] for q in saved] == [1, 2]
+    assert AttemptStore(str(tmp_path / "stats")).total() == (3, 1)
+    with open(tmp_path / "out" / "students.csv", encoding="utf-8") as f:
+        assert f.read().splitlines()[1:] == ["가,2,1,50.0", "나,1,0,0.0"]
+
+
+def test_group_file_is_never_rewritten(tmp_path):
+    groups = tmp_path / "groups"
+    groups.mkdir()
+    raw = json.dumps({"quiz": [{"question": "그룹 문제", "answers": ["답"]}]}, ensure_ascii=False, indent=2)
+    (groups / "요구설계.json").write_text(raw, encoding="utf-8")
+    before = os.stat(groups / "요구설계.json").st_mtime_ns
+    sheet = write_sheet(tmp_path / "sheet.jsonl", [{"user": "가", "question": "그룹 문제", "answer": "오답"}])
+    run(tmp_path, sheet, group="요구설계")
+    assert (groups / "요구설계.json").read_text(encoding="utf-8") == raw
+    assert os.stat(groups / "요구설계.json").st_mtime_ns == before
+    store = AttemptStore(str(tmp_path / "stats"))
+    assert store.total() == (1, 0)
+    assert [g for g, *_ in store.group_accuracy()] == ["요구설계"]
+
+
+def test_dry_run_saves_nothing(tmp_path):
+    write_bank(tmp_path / "quiz.json", ITEMS)
+    before = (tmp_path / "quiz.json").read_bytes()
+    sheet = write_sheet(tmp_path / "sheet.jsonl", [{"user": "가", "id": item_id(ITEMS[0]), "answer": "틀림"}])
+    run(tmp_path, sheet, dry_run=True)
+    assert (tmp_path / "quiz.json").read_bytes() == before
+    assert not os.path.exists(tmp_path / "stats")
+
+
+def test_main_bank_save_keeps_generation(tmp_path):
+    manager = open_storage(str(tmp_path / "quiz.json"))
+    manager.generation = 4
+    manager.save_file(ITEMS)
+    sheet = write_sheet(tmp_path / "sheet.jsonl", [{"user": "가", "id": item_id(ITEMS[0]), "answer": "틀림"}])
+    run(tmp_path, sheet)
+    reloaded = open_storage(str(tmp_path / "quiz.json"))
+    reloaded.load_file()
+    assert reloaded.generation == 4
@@ -0,0 +1,31 @@
+# test_benchmark.py
+import benchmark
+
+
+def test_synthetic_banks_are_reproducible():
+    assert benchmark.make_items(30, seed=3) == benchmark.make_items(30, seed=3)
+    assert benchmark.make_items(30, seed=3) != benchmark.make_items(30, seed=4)
+    assert len({q["question"] for q in benchmark.make_items(500)}) == 500
+
+
+def test_run_size_measures_every_case(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    results = benchmark.run_size(40, str(work_dir), answers_per_session=10, groups=4)
+    cases = [r["case"] for r in results]
+    assert cases == ["file.save", "file.load.cold", "file.load.warm", "parser.iter_file_records",
+                     "import.add_quiz_from_file", "play.answers", "play.session_compaction",
+                     "export.wrong_note_markdown", "quiz_py.load_quiz.cold", "quiz_py.load_quiz.warm"]
+    assert all(r["size"] == 40 and r["seconds"] >= 0 for r in results)
+    assert results[cases.index("parser.iter_file_records")]["records"] == 40
+    assert results[cases.index("play.answers")]["answers"] == 10
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["work"]  # 실행한 폴더에 풀이 기록 등을 남기지 않음
+    assert (work_dir / "attempt_stats").is_dir()
+
+
+def test_compare_prints_ratio(capsys):
+    report = {"results": [{"case": "file.save", "size": 10, "seconds": 0.2}]}
+    baseline = {"results": [{"case": "file.save", "size": 10, "seconds": 0.1}]}
+    benchmark.compare(report, baseline)
+    assert "2.00x" in capsys.readouterr().out
@@ -0,0 +1,100 @@
+# test_bulk_import.py
+import json
+import pytest
+import bulk_import as bulk
+
+BANK = [{"question": "HTTP 기본 포트는?", "answers": ["80"], "wrong_count": 0, "hint": "웹"}]
+
+
+@pytest.fixture
+def sources(tmp_path):
+    folder = tmp_path / "sources"
+    folder.mkdir()
+    (folder / "a.txt").write_text("HTTP 기본 포트는?\n:= 80 || 8080\n:+\nFTP 기본 포트는?\n:= 21\n:+\n", encoding="utf-8")
+    (folder / "b.txt").write_text("HTTP 기본 포트는?\n:= 443\n:! 보안\n:+\n", encoding="utf-8")
+    (folder / "c.json").write_text(json.dumps({"quiz": [{"question": "FTP 기본 포트는?", "answers": ["20"]}]},
+                                              ensure_ascii=False), encoding="utf-8")
+    (folder / "notes.md").write_text("무시", encoding="utf-8")
+    return str(folder)
+
+
+def test_collect_sources_filters_and_sorts(sources):
+    assert [p.rsplit("/", 1)[-1] for p in bulk.collect_sources(sources)] == ["a.txt", "b.txt", "c.json"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bulk_import_merges_in_file_order_and_saves_once(make_app, sources, tmp_path, monkeypatch, workers):
+    app = make_app(BANK)
+    saves = []
+    original = app.save_bank
+    monkeypatch.setattr(app, "save_bank", lambda: saves.append(1) or original())
+
+    report = bulk.bulk_import(app, sources, workers=workers)
+
+    assert saves == [1]
+    assert report["summary"] == {"new": 1, "merged": 3, "duplicate": 0, "skip": 0, "error": 0}
+    saved = json.loads((tmp_path / "quiz.json").read_text(encoding="utf-8"))["quiz"]
+    assert [(q["question"], q["answers"]) for q in saved] == [
+        ("HTTP 기본 포트는?", ["80", "8080", "443"]), ("FTP 기본 포트는?", ["21", "20"])]
+    assert sorted(c["type"] for c in report["conflicts"]) == ["answers", "answers", "hint"]
+
+
+def test_failed_save_rolls_back_bulk_import(make_app, sources, tmp_path, monkeypatch):
+    app = make_app(BANK)
+    before = (tmp_path / "quiz.json").read_bytes()
+    monkeypatch.setattr(app.quiz_file_manager, "save_file", lambda data: False)
+
+    report = bulk.bulk_import(app, sources, workers=1)
+
+    assert report["summary"]["error"] == 1
+    assert [q.to_dict() for q in app.quiz_data] == BANK
+    assert (tmp_path / "quiz.json").read_bytes() == before
+
+
+def test_exception_while_merging_rolls_back(make_app, sources, monkeypatch):
+    app = make_app(BANK)
+    original = app._merge_item
+    calls = []
+
+    def flaky_merge(*args):
+        calls.append(1)
+        if len(calls) == 3:
+            raise RuntimeError("중단")
+        return original(*args)
+    monkeypatch.setattr(app, "_merge_item", flaky_merge)
+
+    report = bulk.bulk_import(app, sources, workers=1)
+
+    assert report["summary"]["error"] == 1
+    assert [q.to_dict() for q in app.quiz_data] == BANK
+    assert app._dirty == {}
+
+
+def test_file_with_decode_error_imports_nothing(make_app, tmp_path):
+    app = make_app(BANK)
+    folder = tmp_path / "broken"
+    folder.mkdir()
+    blocks = "".join(f"문제 {i}\n:= 답 {i}\n:+\n" for i in range(2000))
+    (folder / "a.txt").write_bytes(blocks.encode("utf-8") + b"\xff\xfe \xc3\n:= x\n:+\n")
+    (folder / "b.json").write_text(json.dumps({"quiz": [{"question": "DNS 포트는?", "answers": ["53"]}]},
+                                              ensure_ascii=False), encoding="utf-8")
+
+    report = bulk.bulk_import(app, str(folder), workers=1)
+
+    assert report["summary"]["error"] == 1 and report["summary"]["new"] == 1
+    saved = json.loads((tmp_path / "quiz.json").read_text(encoding="utf-8"))["quiz"]
+    assert [q["question"] for q in saved] == ["HTTP 기본 포트는?", "DNS 포트는?"]
+
+
+def test_malformed_json_entries_are_skipped(make_app, tmp_path):
+    app = make_app(BANK)
+    folder = tmp_path / "json"
+    folder.mkdir()
+    entries = [{"question": None, "answers": ["x"]}, "문자열 항목", {"question": "답 없음"},
+               {"question": 5, "answers": ["x"]}, {"question": "DNS 포트는?", "answers": ["53", 53], "hint": 1}]
+    (folder / "a.json").write_text(json.dumps({"quiz": entries}, ensure_ascii=False), encoding="utf-8")
+
+    report = bulk.bulk_import(app, str(folder), workers=1)
+
+    assert report["summary"] == {"new": 1, "merged": 0, "duplicate": 0, "skip": 4, "error": 0}
+    assert app.find_item("DNS 포트는?").to_dict() == {"question": "DNS 포트는?", "answers": ["53"], "wrong_count": 0}
@@ -0,0 +1,90 @@
+# test_exporter.py
+import os
+import json
+import pytest
+import exporter
+from exporter import export_items
+
+
+def make_items(n):
+    return [{"question": f"문제 {i}", "answers": [f"답 {i}"], "wrong_count": i % 3} for i in range(n)]
+
+
+def entries(items):
+    return [(None, q) for q in items]
+
+
+@pytest.mark.parametrize("fmt", sorted(exporter.RENDERERS))
+def test_incremental_output_matches_full_render(tmp_path, fmt):
+    items = make_items(5)
+    out = str(tmp_path / f"out.{fmt}")
+    export_items(entries(items), out, fmt)
+    items.insert(1, {"question": "끼워 넣은 문제", "answers": ["새 답"]})
+    items[4]["wrong_count"] = 7
+    stats = export_items(entries(items), out, fmt)
+    assert stats["rendered"] == 2 and stats["reused"] == 4
+
+    full = str(tmp_path / f"full.{fmt}")
+    export_items(entries(items), full, fmt, incremental=False)
+    with open(out, "rb") as a, open(full, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_inserting_one_item_renders_only_that_section(tmp_path):
+    items = make_items(20)
+    out = str(tmp_path / "out.md")
+    export_items(entries(items), out)
+    stats = export_items(entries([{"question": "맨 앞", "answers": ["x"]}] + items), out)
+    assert (stats["rendered"], stats["reused"], stats["written"]) == (1, 20, True)
+    with open(out, encoding="utf-8") as f:
+        text = f.read()
+    assert "## 1. (오답 0회)" in text and "## 21. " in text
+
+
+def test_reordering_rewrites_numbers_without_rendering(tmp_path):
+    items = make_items(3)
+    out = str(tmp_path / "out.md")
+    export_items(entries(items), out)
+    stats = export_items(entries(items[::-1]), out)
+    assert (stats["rendered"], stats["written"]) == (0, True)
+    with open(out, encoding="utf-8") as f:
+        text = f.read()
+    assert text.index("문제 2") < text.index("문제 0")
+
+
+def test_unchanged_export_keeps_file(tmp_path):
+    items = make_items(3)
+    out = str(tmp_path / "out.csv")
+    export_items(entries(items), out, "csv")
+    mtime = os.stat(out).st_mtime_ns
+    stats = export_items(entries(items), out, "csv")
+    assert stats["written"] is False and os.stat(out).st_mtime_ns == mtime
+
+
+def test_index_is_written_atomically(tmp_path, monkeypatch):
+    items = make_items(3)
+    out = str(tmp_path / "out.md")
+    export_items(entries(items), out)
+    with open(out + exporter.INDEX_SUFFIX, encoding="utf-8") as f:
+        before = f.read()
+
+    def fail(path, raw):
+        raise OSError("디스크 가득 참")
+    monkeypatch.setattr(exporter, "write_atomic", fail)
+    with pytest.raises(OSError):
+        export_items(entries(make_items(4)), out)
+    with open(out + exporter.INDEX_SUFFIX, encoding="utf-8") as f:
+        assert f.read() == before
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(".tmp_")]
+
+
+def test_edited_output_is_not_reused(tmp_path):
+    items = make_items(3)
+    out = str(tmp_path / "out.md")
+    export_items(entries(items), out)
+    with open(out, "a", encoding="utf-8") as f:
+        f.write("손으로 덧붙인 줄\n")
+    stats = export_items(entries(items), out)
+    assert stats["reused"] == 0 and stats["rendered"] == 3
+    with open(out + exporter.INDEX_SUFFIX, encoding="utf-8") as f:
+        assert json.load(f)["version"] == exporter.INDEX_VERSION
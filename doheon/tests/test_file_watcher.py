@@ -0,0 +1,48 @@
+# test_file_watcher.py
+import os
+import pytest
+from file_watcher import FileWatcher
+
+
+@pytest.fixture(params=[False, True], ids=["polling", "inotify"])
+def watched(tmp_path, request):
+    groups = tmp_path / "groups"
+    groups.mkdir()
+    quiz = tmp_path / "quiz.json"
+    quiz.write_text("{}", encoding="utf-8")
+    watcher = FileWatcher(files=[str(quiz)], directories=[str(groups)], use_inotify=request.param)
+    yield watcher, quiz, groups
+    watcher.close()
+
+
+def test_reports_only_changed_files(watched):
+    watcher, quiz, groups = watched
+    assert watcher.changes() == []
+    quiz.write_text('{"quiz": []}', encoding="utf-8")
+    (groups / "새 그룹.json").write_text("{}", encoding="utf-8")
+    assert watcher.changes() == sorted([str(quiz), str(groups / "새 그룹.json")])
+    assert watcher.changes() == []
+
+
+def test_deleted_group_file_is_reported(watched):
+    watcher, quiz, groups = watched
+    path = groups / "그룹.json"
+    path.write_text("{}", encoding="utf-8")
+    watcher.changes()
+    os.remove(path)
+    assert watcher.changes() == [str(path)]
+
+
+def test_acknowledged_save_is_not_a_change(watched):
+    watcher, quiz, groups = watched
+    quiz.write_text('{"quiz": [1]}', encoding="utf-8")
+    watcher.acknowledge(str(quiz))
+    assert watcher.changes() == []
+
+
+def test_temp_hidden_and_other_files_are_ignored(watched):
+    watcher, quiz, groups = watched
+    (groups / ".tmp_abc.tmp").write_text("x", encoding="utf-8")
+    (groups / ".manifest.json").write_text("{}", encoding="utf-8")
+    (groups / "memo.txt").write_text("x", encoding="utf-8")
+    assert watcher.changes() == []
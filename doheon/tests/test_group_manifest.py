@@ -0,0 +1,55 @@
+# test_group_manifest.py
+import os
+import sys
+import json
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import quiz  # noqa: E402  (저장소 최상위의 그룹 퀴즈 스크립트)
+
+
+@pytest.fixture
+def groups(tmp_path):
+    folder = tmp_path / "quiz_groups"
+    folder.mkdir()
+    for name, count in (("네트워크", 2), ("보안", 1)):
+        items = [{"question": f"{name} {i}", "answers": ["답"]} for i in range(count)]
+        (folder / f"{name}.json").write_text(json.dumps({"quiz": items}, ensure_ascii=False), encoding="utf-8")
+    return str(folder)
+
+
+def test_manifest_lists_groups_without_reading_them(groups):
+    manifest = quiz.load_manifest(groups)
+    assert list(manifest) == ["네트워크", "보안"]
+    assert all(info["count"] is None for info in manifest.values())
+
+
+def test_loading_a_group_caches_its_count(groups):
+    manifest = quiz.load_manifest(groups)
+    assert len(quiz.load_group(manifest, "네트워크", groups)) == 2
+    assert quiz.load_manifest(groups)["네트워크"]["count"] == 2
+    assert quiz.load_manifest(groups)["보안"]["count"] is None
+
+
+def test_changed_group_file_invalidates_cached_count(groups):
+    manifest = quiz.load_manifest(groups)
+    quiz.load_group(manifest, "보안", groups)
+    path = os.path.join(groups, "보안.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"quiz": [{"question": "새 문제", "answers": ["답"]}] * 3}, f)
+    assert quiz.load_manifest(groups)["보안"]["count"] is None
+
+
+def test_manifest_save_is_atomic(groups, monkeypatch):
+    manifest = quiz.load_manifest(groups)
+    quiz.load_group(manifest, "보안", groups)
+    before = open(os.path.join(groups, quiz.MANIFEST_NAME), "rb").read()
+
+    def failing_replace(src, dst):
+        raise OSError("디스크 가득 참")
+    monkeypatch.setattr(os, "replace", failing_replace)
+    manifest["네트워크"]["count"] = 2
+    quiz.save_manifest(manifest, groups)
+
+    assert open(os.path.join(groups, quiz.MANIFEST_NAME), "rb").read() == before
+    assert not [name for name in os.listdir(groups) if name.startswith(".tmp_")]
@@ -0,0 +1,53 @@
+# test_instrument.py
+import json
+import argparse
+from collections import defaultdict
+import pytest
+import instrument
+
+
+@pytest.fixture
+def fresh(monkeypatch):
+    """전역 측정 상태를 테스트마다 새로 만듭니다."""
+    monkeypatch.setattr(instrument, "_enabled", False)
+    monkeypatch.setattr(instrument, "_timers", defaultdict(lambda: [0, 0.0, 0.0]))
+    monkeypatch.setattr(instrument, "_counters", defaultdict(int))
+    monkeypatch.setattr(instrument, "_trace", None)
+    return instrument
+
+
+@instrument.timed("sample.work")
+def work(x):
+    return x * 2
+
+
+def test_disabled_records_nothing(fresh):
+    assert work(2) == 4
+    with fresh.span("sample.span"):
+        pass
+    fresh.count("answers")
+    assert not fresh._timers and not fresh._counters
+
+
+def test_enabled_records_calls_spans_and_counters(fresh):
+    fresh.enable()
+    work(1)
+    work(2)
+    with fresh.span("sample.span"):
+        pass
+    fresh.count("answers", 3)
+    assert fresh._timers["sample.work"][0] == 2
+    assert fresh._timers["sample.span"][0] == 1
+    assert fresh._counters["answers"] == 3
+    assert "sample.work" in fresh.summary() and "answers=3" in fresh.summary()
+
+
+def test_run_with_trace_writes_trace_events(fresh, tmp_path, capsys):
+    arg_parser = argparse.ArgumentParser()
+    fresh.add_arguments(arg_parser)
+    trace_path = tmp_path / "trace.json"
+    fresh.run(lambda: work(5), arg_parser.parse_args(["--trace", str(trace_path)]))
+    data = json.loads(trace_path.read_text(encoding="utf-8"))
+    assert data["timers"]["sample.work"]["calls"] == 1
+    assert [e["name"] for e in data["traceEvents"]] == ["sample.work"]
+    assert "성능 측정 요약" in capsys.readouterr().err
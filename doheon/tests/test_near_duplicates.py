@@ -0,0 +1,64 @@
+# test_near_duplicates.py
+import near_duplicates
+from near_duplicates import NearDuplicateIndex, confirm_merges, find_pairs, merge_pairs, same_answers
+
+STEPS = ["절연체인 얇은 기판에 구리박 접착", "레지스트 인쇄", "식각액에 담구기", "레지스트 제거", "Holl 뚫기", "납레지스트 도포"]
+
+
+def cloze(blank):
+    """하드웨어회로구현설계.json처럼 같은 순서에서 빈칸 위치만 다른 문제"""
+    steps = ["(      )" if i == blank else step for i, step in enumerate(STEPS)]
+    return {"question": "인쇄회로가 만들어지는 순서는?\n" + "-".join(steps), "answers": [STEPS[blank]]}
+
+
+def test_cloze_templates_with_different_blanks_are_not_flagged():
+    entries = [(i, cloze(i)["question"]) for i in range(1, len(STEPS))]
+    assert find_pairs(entries, 0.7) == []
+
+
+def test_symbol_only_difference_is_not_flagged():
+    index = NearDuplicateIndex()
+    index.add(0, "공정도에서 '⇨' 기호가 뜻하는 것은?")
+    assert index.query("공정도에서 '▽' 기호가 뜻하는 것은?") == []
+
+
+def test_spacing_and_punctuation_variants_are_still_found():
+    index = NearDuplicateIndex()
+    index.add(0, "TCP와 UDP의 차이를 설명하시오.")
+    assert [key for key, _ in index.query("TCP 와 UDP 의 차이를 설명 하시오")] == [0]
+
+
+def test_same_answers_ignores_order_and_surrounding_spaces():
+    assert same_answers({"answers": ["가", " 나"]}, {"answers": ["나", "가 "]})
+    assert not same_answers(cloze(1), cloze(2))
+
+
+def test_pairs_with_different_answers_are_never_offered(capsys):
+    banks = {"bank.json": [cloze(1), cloze(2)]}
+
+    def ask(prompt):
+        raise AssertionError("정답이 다른 쌍을 물어봤습니다.")
+    assert confirm_merges(banks, [(("bank.json", 0), ("bank.json", 1), 0.9)], ask=ask) == {}
+
+
+def test_merge_requires_confirmation_per_pair():
+    item = {"question": "같은 문제", "answers": ["답"], "wrong_count": 1}
+    banks = {"bank.json": [dict(item), dict(item), dict(item), dict(item)]}
+    pairs = [(("bank.json", 0), ("bank.json", 1), 1.0), (("bank.json", 2), ("bank.json", 3), 1.0)]
+    answers = iter(["n", "y"])
+    confirmed = confirm_merges(banks, pairs, ask=lambda prompt: next(answers))
+    assert confirmed == {"bank.json": [(2, 3, 1.0)]}
+    assert len(merge_pairs(banks["bank.json"], confirmed["bank.json"])) == 3
+
+
+def test_quit_stops_asking():
+    item = {"question": "같은 문제", "answers": ["답"]}
+    banks = {"bank.json": [dict(item) for _ in range(4)]}
+    pairs = [(("bank.json", 0), ("bank.json", 1), 1.0), (("bank.json", 2), ("bank.json", 3), 1.0)]
+    asked = []
+    assert confirm_merges(banks, pairs, ask=lambda prompt: asked.append(prompt) or "q") == {}
+    assert len(asked) == 1
+
+
+def test_shingles_keep_blank_position():
+    assert near_duplicates.shingles(cloze(1)["question"]) != near_duplicates.shingles(cloze(2)["question"])
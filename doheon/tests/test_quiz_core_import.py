@@ -0,0 +1,59 @@
+# test_quiz_core_import.py
+import json
+from search_index import SearchIndex
+
+BANK = [{"question": "OSI 2계층은?", "answers": ["데이터 링크"], "wrong_count": 1}]
+SOURCE = """OSI 2계층은?
+:= 데이터 링크 || 링크 계층
+:! 프레임 단위
+:+
+HTTP 기본 포트는?
+:= 80
+:+
+"""
+
+
+def write_source(tmp_path, text=SOURCE):
+    path = tmp_path / "new_quiz.txt"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_import_merges_in_memory_and_saves_once(make_app, tmp_path, monkeypatch):
+    app = make_app(BANK)
+    saves = []
+    original = app.quiz_file_manager.save_file
+    monkeypatch.setattr(app.quiz_file_manager, "save_file", lambda data: saves.append(1) or original(data))
+
+    app.add_quiz_from_file(write_source(tmp_path))
+
+    assert len(saves) == 1
+    saved = json.loads((tmp_path / "quiz.json").read_text(encoding="utf-8"))["quiz"]
+    assert [q["question"] for q in saved] == ["OSI 2계층은?", "HTTP 기본 포트는?"]
+    assert saved[0]["answers"] == ["데이터 링크", "링크 계층"]
+    assert saved[0]["hint"] == "프레임 단위"
+
+
+def test_failed_save_rolls_back_every_in_memory_merge(make_app, tmp_path, monkeypatch):
+    app = make_app(BANK)
+    app.search_index = SearchIndex()
+    app.search_index.add_all(app.quiz_data)
+    before = (tmp_path / "quiz.json").read_bytes()
+    monkeypatch.setattr(app.quiz_file_manager, "save_file", lambda data: False)
+
+    app.add_quiz_from_file(write_source(tmp_path))
+
+    assert [q.to_dict() for q in app.quiz_data] == BANK
+    assert list(app.items_by_id) == [app.item_key(app.quiz_data[0])]
+    assert app._dirty == {} and app._undo is None
+    assert len(app.search_index) == 1
+    assert app.search_index.search("포트") == []
+    assert (tmp_path / "quiz.json").read_bytes() == before
+
+
+def test_same_question_twice_in_one_file_rolls_back_cleanly(make_app, tmp_path, monkeypatch):
+    app = make_app([])
+    monkeypatch.setattr(app.quiz_file_manager, "save_file", lambda data: False)
+    app.add_quiz_from_file(write_source(tmp_path, "Q1\n:= a\n:+\nQ1\n:= b\n:+\n"))
+    assert app.quiz_data == [] and app.items_by_id == {}
+    assert len(app.near_duplicates) == 0
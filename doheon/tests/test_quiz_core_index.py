@@ -0,0 +1,26 @@
+# test_quiz_core_index.py
+from quiz_ids import question_id
+
+
+def test_find_item_ignores_surrounding_whitespace(make_app):
+    app = make_app([{"question": "OSI 7계층 중 2계층은?", "answers": ["데이터 링크"], "wrong_count": 0}])
+    assert app.find_item("  OSI 7계층 중 2계층은?\n") is app.quiz_data[0]
+    assert app.find_item("OSI 7계층 중 3계층은?") is None
+
+
+def test_duplicate_save_merges_answers_instead_of_appending(make_app):
+    app = make_app([{"question": "TCP의 특징은?", "answers": ["연결 지향"], "wrong_count": 0}])
+    message = app._save_one_item("TCP의 특징은?", ["신뢰성", "연결 지향"], None)
+    assert "정답 추가" in message
+    assert len(app.quiz_data) == 1
+    assert app.quiz_data[0]["answers"] == ("연결 지향", "신뢰성")
+    assert "중복" in app._save_one_item("TCP의 특징은?", ["신뢰성"], None)
+
+
+def test_new_item_is_indexed_immediately(make_app):
+    app = make_app([])
+    app._save_one_item("UDP의 특징은?", ["비연결"], None)
+    assert set(app.items_by_id) == {question_id("UDP의 특징은?")}
+    app._save_one_item("UDP의 특징은?", ["빠름"], None)
+    assert len(app.quiz_data) == 1
+    assert app.quiz_data[0]["answers"] == ("비연결", "빠름")
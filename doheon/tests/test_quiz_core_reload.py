@@ -0,0 +1,61 @@
+# test_quiz_core_reload.py
+from conftest import write_bank
+from search_index import SearchIndex
+
+
+def bank(*items):
+    return [{"question": q, "answers": list(a), "wrong_count": 0} for q, *a in items]
+
+
+def test_reload_updates_only_changed_items(make_app):
+    app = make_app(bank(("가나다 문제", "답1"), ("라마바 문제", "답2"), ("사아자 문제", "답3")))
+    app.search_index = SearchIndex()
+    app.search_index.add_all(app.quiz_data)
+    app.prepare_near_duplicate_check()
+    near = app.near_duplicates
+    kept = app.find_item("가나다 문제")
+
+    indexed = []
+    original_add = app.search_index.add
+    app.search_index.add = lambda item, group="quiz": indexed.append(item["question"]) or original_add(item, group)
+
+    write_bank("quiz.json", bank(("가나다 문제", "답1"), ("라마바 문제", "답2", "새 답"), ("차카타 문제", "답4")))
+    app._reload_bank()
+
+    assert sorted(indexed) == ["라마바 문제", "차카타 문제"]
+    assert app.find_item("가나다 문제") is kept
+    assert app.find_item("라마바 문제")["answers"] == ("답2", "새 답")
+    assert app.find_item("사아자 문제") is None
+    assert [q["question"] for q in app.quiz_data] == ["가나다 문제", "라마바 문제", "차카타 문제"]
+    assert [q_item["question"] for _, _, q_item in app.search_index.search("차카타")][:1] == ["차카타 문제"]
+    assert app.search_index.search("사아자") == []
+
+    # 유사 문제 색인도 버리지 않고 바뀐 문제만 고침
+    assert app.near_duplicates is near and len(near) == 3
+    assert [k for k, _ in near.query("차카타 문제")] == [app.item_key(app.find_item("차카타 문제"))]
+    assert near.query("사아자 문제") == []
+
+
+def test_reload_keeps_first_of_duplicate_questions(make_app):
+    app = make_app(bank(("같은 문제", "첫 답")))
+    first = app.find_item("같은 문제")
+    write_bank("quiz.json", bank(("같은 문제", "첫 답"), ("같은 문제", "둘째 답")))
+    app._reload_bank()
+    assert app.find_item("같은 문제") is first and len(app.quiz_data) == 2
+
+
+def test_reload_keeps_unsaved_local_changes(make_app):
+    app = make_app(bank(("문제", "답")))
+    item = app.find_item("문제")
+    item["wrong_count"] = 3
+    app._mark_dirty(item)
+    write_bank("quiz.json", bank(("문제", "답", "밖에서 추가한 답")))
+    app._reload_bank()
+    assert item["wrong_count"] == 3 and item["answers"] == ("답", "밖에서 추가한 답")
+
+
+def test_check_for_updates_reloads_changed_bank(make_app):
+    app = make_app(bank(("문제", "답")))
+    write_bank("quiz.json", bank(("문제", "답"), ("추가 문제", "답")))
+    app.check_for_updates()
+    assert app.find_item("추가 문제") is not None
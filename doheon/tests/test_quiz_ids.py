@@ -0,0 +1,33 @@
+# test_quiz_ids.py
+import json
+from quiz_ids import question_id, item_id, to_ids
+
+BANK = [
+    {"question": "DNS의 기본 포트는?", "answers": ["53"], "wrong_count": 0},
+    {"question": "SSH의 기본 포트는?", "answers": ["22"], "wrong_count": 0},
+]
+
+
+def test_id_is_stable_across_answers_and_whitespace():
+    q_item = {"question": "DNS의 기본 포트는?", "answers": ["53"], "wrong_count": 3}
+    assert item_id(q_item) == question_id("  DNS의 기본 포트는?\n")
+    assert item_id(dict(q_item, answers=["53", "UDP 53"])) == item_id(q_item)
+    assert len(item_id(q_item)) == 16
+    assert question_id("DNS의 기본 포트는?") != question_id("SSH의 기본 포트는?")
+
+
+def test_to_ids_accepts_old_item_copies():
+    assert to_ids([BANK[0], question_id("x")]) == [item_id(BANK[0]), question_id("x")]
+
+
+def test_last_failed_stores_ids_and_resolves_to_bank_items(make_app, tmp_path):
+    app = make_app(BANK)
+    app.last_failed = {app.item_key(app.quiz_data[1])}
+    app._finish_session(1, 0)
+    stored = json.loads((tmp_path / "last_failed.json").read_text(encoding="utf-8"))["last_failed"]
+    assert stored == [item_id(BANK[1])]
+
+    restarted = make_app()
+    resolved = restarted.resolve_ids(to_ids(restarted.last_failed_file_manager.load_file()))
+    assert resolved == [restarted.quiz_data[1]]
+    assert resolved[0] is restarted.quiz_data[1]
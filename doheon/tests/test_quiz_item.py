@@ -0,0 +1,56 @@
+# test_quiz_item.py
+import json
+import random
+from quiz_ids import item_id
+from quiz_item import QuizItem, ShuffledView, to_items, to_plain
+
+
+def test_round_trip_keeps_original_keys():
+    group_item = {"question": "그룹 문제", "answers": ["가", "나"], "source": "p.12"}
+    main_item = {"question": "기본 문제", "answers": ["다"], "hint": "힌트", "wrong_count": 0}
+    assert to_plain(to_items([group_item, main_item])) == [group_item, main_item]
+
+
+def test_dict_style_access():
+    q = QuizItem.from_dict({"question": "문제", "answers": ["답"]})
+    assert "wrong_count" not in q and q.get("wrong_count", 0) == 0
+    q["wrong_count"] = q.get("wrong_count", 0) + 1
+    q["memo"] = "메모"
+    assert q["wrong_count"] == 1 and q["memo"] == "메모"
+    assert list(q) == ["question", "answers", "wrong_count", "memo"]
+    del q["memo"]
+    assert "memo" not in q and len(q) == 3
+
+
+def test_answers_are_interned_tuples():
+    a = QuizItem("문제 1", ["".join(["정", "답"])])
+    b = QuizItem("문제 2", ["".join(["정", "답"])])
+    assert isinstance(a.answers, tuple) and a.answers[0] is b.answers[0]
+    assert a.add_answers(["정답", "새 답", "새 답"]) == ["새 답"]
+    assert a.answers == ("정답", "새 답")
+
+
+def test_item_id_matches_plain_dict():
+    data = {"question": "문제", "answers": ["답"], "hint": "힌트"}
+    assert item_id(QuizItem.from_dict(data)) == item_id(data)
+
+
+def test_saved_json_is_unchanged():
+    data = [{"question": "문제", "answers": ["답"], "wrong_count": 2}]
+    assert json.dumps(to_plain(to_items(data)), ensure_ascii=False) == json.dumps(data, ensure_ascii=False)
+
+
+def test_shuffled_view_does_not_touch_source():
+    items = list(range(50))
+    view = ShuffledView(items, random.Random(1))
+    assert items == list(range(50))
+    assert sorted(view) == items and len(view) == 50
+    assert list(view) != items  # 섞인 순서
+    assert view[:3] == [view[0], view[1], view[2]]
+    assert view[-1] == list(view)[-1]
+
+
+def test_shuffled_view_is_reproducible_with_seeded_rng():
+    items = ["a", "b", "c", "d", "e"]
+    assert list(ShuffledView(items, random.Random(7))) == list(ShuffledView(items, random.Random(7)))
+    assert list(ShuffledView([], random.Random(7))) == []
@@ -0,0 +1,68 @@
+# test_quiz_journal.py
+import json
+from quiz_journal import QuizJournal
+
+BANK = [{"question": "IPv4 주소 길이는?", "answers": ["32비트"], "wrong_count": 1}]
+
+
+def load_bank(tmp_path):
+    return json.loads((tmp_path / "quiz.json").read_text(encoding="utf-8"))
+
+
+def answer_wrong(app, times=1):
+    q_item = app.quiz_data[0]
+    for _ in range(times):
+        q_item["wrong_count"] += 1
+        app._record("wrong", q_item, delta=1)
+    return q_item
+
+
+def test_events_are_journaled_without_rewriting_the_bank(make_app, tmp_path):
+    app = make_app(BANK)
+    before = (tmp_path / "quiz.json").read_bytes()
+    answer_wrong(app, 3)
+    assert (tmp_path / "quiz.json").read_bytes() == before
+    assert [e["delta"] for e in app.journal.load_events()] == [1, 1, 1]
+
+
+def test_replay_after_crash_applies_journal_once(make_app, tmp_path):
+    app = make_app(BANK)
+    answer_wrong(app, 2)
+    app.journal.close()  # 저장 없이 종료된 상황
+
+    restarted = make_app()
+    assert restarted.quiz_data[0]["wrong_count"] == 3
+    assert load_bank(tmp_path)["quiz"][0]["wrong_count"] == 3
+    assert not (tmp_path / "quiz.journal").exists()
+
+
+def test_crash_between_bank_save_and_journal_clear_does_not_double_apply(make_app, tmp_path, monkeypatch):
+    app = make_app(BANK)
+    answer_wrong(app, 2)
+    monkeypatch.setattr(app.journal, "clear", lambda: None)  # 은행 교체 직후 종료
+    assert app.save_bank()
+    app.journal.close()
+    assert load_bank(tmp_path)["generation"] == 1
+
+    restarted = make_app()
+    assert restarted.quiz_data[0]["wrong_count"] == 3
+    assert not (tmp_path / "quiz.journal").exists()
+
+
+def test_events_after_a_save_are_still_replayed(make_app, tmp_path):
+    app = make_app(BANK)
+    answer_wrong(app)
+    app.save_bank()
+    answer_wrong(app)
+    app.journal.close()
+
+    assert make_app().quiz_data[0]["wrong_count"] == 3
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    journal = QuizJournal(str(tmp_path / "quiz.journal"))
+    journal.append({"op": "wrong", "id": "a", "delta": 1})
+    journal.close()
+    with open(tmp_path / "quiz.journal", "a", encoding="utf-8") as f:
+        f.write('{"op": "wro')
+    assert journal.load_events() == [{"op": "wrong", "id": "a", "delta": 1}]
@@ -0,0 +1,57 @@
+# test_quiz_parser.py
+import io
+import json
+from quiz_parser import QuizParser, QuizRecord
+
+SOURCE = """
+첫 번째 문제
+두 번째 줄
+:= 정답1 || 정답2
+:! 힌트
+:+
+
+:+
+세 번째 문제
+:= 답
+"""
+
+
+def test_iter_records_reports_source_line_ranges():
+    records = list(QuizParser().iter_records(io.StringIO(SOURCE)))
+    assert records == [
+        QuizRecord("첫 번째 문제\n두 번째 줄", ["정답1", "정답2"], "힌트", 2, 5),
+        QuizRecord("세 번째 문제", ["답"], None, 9, 10),
+    ]
+
+
+def test_iter_records_matches_block_parser():
+    parser = QuizParser()
+    streamed = [tuple(r)[:3] for r in parser.iter_records(io.StringIO(SOURCE))]
+    blocks = [parser.parse_quiz_block(b) for b in parser.parse_file_into_blocks(SOURCE) if b.strip()]
+    assert streamed == blocks
+
+
+def test_iter_records_handles_crlf_lines():
+    records = list(QuizParser().iter_records(io.StringIO("문제\r\n:= 답\r\n:+\r\n", newline="")))
+    assert records == [QuizRecord("문제", ["답"], None, 1, 2)]
+
+
+def test_error_mid_file_rolls_back_and_saves_nothing(make_app, tmp_path, monkeypatch, capsys):
+    bank = [{"question": "기존 문제", "answers": ["기존 답"], "wrong_count": 0}]
+    app = make_app(bank)
+    before = (tmp_path / "quiz.json").read_bytes()
+
+    def broken_records(path):
+        # 두 문항을 정상적으로 읽은 뒤 오류가 나는 파일
+        yield from QuizParser().iter_records(io.StringIO("기존 문제\n:= 새 답\n:+\n새 문제\n:= 답\n:+\n"))
+        raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    monkeypatch.setattr(app.parser, "iter_file_records", broken_records)
+    app.add_quiz_from_file("broken.txt")
+
+    out = capsys.readouterr().out
+    assert "4~5행" in out and "저장하지 않았습니다" in out
+    assert [q.to_dict() for q in app.quiz_data] == bank
+    assert app._dirty == {}
+    assert (tmp_path / "quiz.json").read_bytes() == before
+    assert json.loads(before)["quiz"] == bank
@@ -0,0 +1,150 @@
+# test_quiz_server.py
+import os
+import json
+import asyncio
+import pytest
+from http import HTTPStatus
+from conftest import write_bank
+from quiz_server import MAIN_BANK, HttpError, QuizBank, QuizServer
+
+SHARED = {"question": "두 은행에 모두 있는 문제", "answers": ["공통"]}
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_bank("quiz.json", [dict(SHARED), {"question": "기본 문제", "answers": ["기본"]}])
+    (tmp_path / "groups").mkdir()
+    write_bank("groups/그룹.json", [dict(SHARED)])
+    bank = QuizBank("quiz.json", "groups")
+    srv = QuizServer(bank, "quiz.json")
+    yield srv
+    srv.attempt_log.close()
+    srv.bank_journal.close()
+    bank.watcher.close()
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("body", [{"banks": 5}, {"banks": [1]}, {"banks": "그룹"}, {"user": ["a"]}, {"mode": 3}])
+def test_wrong_body_types_are_bad_requests(server, body):
+    with pytest.raises(HttpError) as e:
+        server.route("POST", "/sessions", body)
+    assert e.value.status == HTTPStatus.BAD_REQUEST
+
+
+def test_non_string_answer_is_bad_request(server):
+    sid = server.route("POST", "/sessions", {"banks": ["그룹"]})["session"]
+    with pytest.raises(HttpError) as e:
+        server.route("POST", f"/sessions/{sid}/answer", {"answer": {"x": 1}})
+    assert e.value.status == HTTPStatus.BAD_REQUEST
+
+
+class FakeWriter:
+    def __init__(self):
+        self.data = b""
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def request(server, raw):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        writer = FakeWriter()
+        await server.handle_client(reader, writer)
+        return writer
+    return asyncio.run(run())
+
+
+def post(path, body):
+    payload = json.dumps(body).encode("utf-8")
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {len(payload)}\r\nConnection: close\r\n\r\n").encode() + payload
+
+
+def test_bad_body_gets_400_instead_of_dropped_connection(server):
+    writer = request(server, post("/sessions", {"banks": 5}))
+    assert writer.data.startswith(b"HTTP/1.1 400 ")
+
+
+def test_unexpected_error_gets_500(server, monkeypatch):
+    def broken(*args):
+        raise RuntimeError("예상하지 못한 오류")
+    monkeypatch.setattr(server, "route", broken)
+    writer = request(server, post("/sessions", {}))
+    assert writer.data.startswith(b"HTTP/1.1 500 ") and writer.closed
+
+
+def answer_wrong(server, banks):
+    sid = server.route("POST", "/sessions", {"banks": banks})["session"]
+    server.route("POST", f"/sessions/{sid}/answer", {"answer": "오답"})
+
+
+def test_attempts_remember_the_bank_they_were_asked_from(server):
+    answer_wrong(server, ["그룹"])
+    asyncio.run(server.flush())
+    assert [a["bank"] for a in read_lines("server_attempts.jsonl")] == ["그룹"]
+    assert server.attempts.labels()[next(iter(server.attempts.labels()))]["group"] == "그룹"
+    assert not os.path.exists("quiz.journal")  # 그룹 은행의 오답은 기본 퀴즈 파일 저널에 남기지 않음
+
+
+def test_main_bank_wrong_answers_go_to_journal(server):
+    sid = server.route("POST", "/sessions", {"banks": [MAIN_BANK]})["session"]
+    for _ in range(2):
+        server.route("POST", f"/sessions/{sid}/answer", {"answer": "오답"})
+    asyncio.run(server.flush())
+    assert len(read_lines("quiz.journal")) == 2
+
+
+def test_failed_flush_is_retried_without_duplicates(server, monkeypatch):
+    answer_wrong(server, [MAIN_BANK])
+    original = server.attempts.flush
+    calls = []
+
+    def failing_flush():
+        calls.append(1)
+        raise OSError("디스크 가득 참")
+    monkeypatch.setattr(server.attempts, "flush", failing_flush)
+    asyncio.run(server.flush())
+    assert calls and len(server._retry) == 1
+
+    monkeypatch.setattr(server.attempts, "flush", original)
+    asyncio.run(server.flush())
+    assert server._retry == []
+    assert len(read_lines("server_attempts.jsonl")) == 1
+    assert len(read_lines("quiz.journal")) == 1
+    with server.attempts.columns() as cols:
+        assert cols.rows == 1
+
+
+def test_flush_loop_survives_errors(server, monkeypatch):
+    calls = []
+
+    async def broken_reload():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("일시적인 오류")
+    monkeypatch.setattr(server, "reload_changes", broken_reload)
+    monkeypatch.setattr("quiz_server.FLUSH_INTERVAL", 0.01)
+
+    async def run():
+        task = asyncio.create_task(server.flush_loop())
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(calls) >= 2:
+                break
+        task.cancel()
+    asyncio.run(run())
+    assert len(calls) >= 2
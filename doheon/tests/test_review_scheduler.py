@@ -0,0 +1,70 @@
+# test_review_scheduler.py
+import os
+import json
+from review_scheduler import ReviewScheduler, DAY
+from quiz_ids import item_id
+from quiz_item import QuizItem
+
+NOW = 1_000_000.0
+
+
+def make_items(*wrong_counts):
+    return [QuizItem(f"문제 {i}", ["답"], None, wrong) for i, wrong in enumerate(wrong_counts)]
+
+
+def scheduler(tmp_path):
+    return ReviewScheduler(str(tmp_path / "review_state.json"), item_id)
+
+
+def drain(queue, now=NOW):
+    popped = []
+    while (q_item := queue.pop(now)) is not None:
+        popped.append(q_item)
+    return popped
+
+
+def test_failed_queue_pops_most_wrong_first_regardless_of_due(tmp_path):
+    sched = scheduler(tmp_path)
+    easy, hard, medium = make_items(1, 10, 4)
+    sched.record(hard, True, now=NOW)  # 복습 시각이 먼 미래여도 난이도가 우선
+    queue = sched.queue([easy, hard, medium], respect_due=False)
+    assert drain(queue) == [hard, medium, easy]
+
+
+def test_due_queue_orders_by_due_time_then_difficulty(tmp_path):
+    sched = scheduler(tmp_path)
+    a, b, c = make_items(0, 5, 2)
+    sched.record(a, True, now=NOW - 2 * DAY)  # 하루 뒤가 복습 시각 → 이미 지남
+    sched.record(c, True, now=NOW)            # 아직 복습 시각이 아님
+    queue = sched.queue([a, b, c])
+    assert drain(queue) == [b, a]
+    assert len(queue) == 1
+
+
+def test_wrong_answer_is_retried_soon_and_push_replaces_old_entry(tmp_path):
+    sched = scheduler(tmp_path)
+    a, b = make_items(0, 0)
+    queue = sched.queue([a, b])
+    first = queue.pop(NOW)
+    sched.record(first, False, now=NOW)
+    queue.push(first)
+    assert len(queue) == 2
+    assert queue.pop(NOW) is not first
+    assert queue.pop(NOW) is None
+    assert queue.pop(NOW + sched.RETRY_DELAY) is first
+
+
+def test_save_round_trips_and_survives_interrupted_write(tmp_path, monkeypatch):
+    sched = scheduler(tmp_path)
+    (q_item,) = make_items(0)
+    sched.record(q_item, True, now=NOW)
+    sched.save()
+    assert scheduler(tmp_path).due(q_item) == NOW + DAY
+
+    before = (tmp_path / "review_state.json").read_bytes()
+    sched.record(q_item, False, now=NOW)
+    monkeypatch.setattr(os, "replace", lambda src, dst: (_ for _ in ()).throw(OSError("중단")))
+    sched.save()
+    assert (tmp_path / "review_state.json").read_bytes() == before
+    assert json.loads(before)[item_id(q_item)]["streak"] == 1
+    assert os.listdir(tmp_path) == ["review_state.json"]
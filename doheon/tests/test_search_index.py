@@ -0,0 +1,64 @@
+# test_search_index.py
+import json
+from search_index import SearchIndex, load_group_file, text_grams
+from quiz_item import QuizItem
+from quiz_ids import item_id
+
+ITEMS = [
+    QuizItem("데이터베이스 정규화의 목적은?", ["이상 현상 제거"]),
+    QuizItem("트랜잭션의 특성 4가지는?", ["원자성, 일관성, 고립성, 지속성"], "ACID"),
+    QuizItem("OSI 7계층 중 전송 계층 프로토콜은?", ["TCP", "UDP"]),
+]
+
+
+def build():
+    index = SearchIndex()
+    index.add_all(ITEMS)
+    return index
+
+
+def questions(hits):
+    return [q_item["question"] for _, _, q_item in hits]
+
+
+def test_text_grams_are_syllable_unigrams_and_bigrams():
+    assert text_grams("정규화") == ["정", "규", "화", "정규", "규화"]
+
+
+def test_search_matches_korean_without_word_boundaries():
+    index = build()
+    assert questions(index.search("정규화"))[0] == ITEMS[0]["question"]
+    assert questions(index.search("트랜잭션이"))[0] == ITEMS[1]["question"]
+
+
+def test_search_covers_answers_and_hints():
+    index = build()
+    assert questions(index.search("acid")) == [ITEMS[1]["question"]]
+    assert questions(index.search("udp")) == [ITEMS[2]["question"]]
+
+
+def test_readding_an_item_replaces_its_postings():
+    index = build()
+    ITEMS[2].add_answers(["SCTP"])
+    try:
+        index.add(ITEMS[2])
+        assert len(index) == 3
+        assert questions(index.search("sctp")) == [ITEMS[2]["question"]]
+        index.remove(("quiz", item_id(ITEMS[2])))
+        assert index.search("sctp") == [] and len(index) == 2
+    finally:
+        ITEMS[2]["answers"] = ["TCP", "UDP"]
+
+
+def test_group_file_reindex_and_delete(tmp_path):
+    index = build()
+    path = tmp_path / "보안.json"
+    path.write_text(json.dumps({"quiz": [{"question": "대칭키 암호 예시는?", "answers": ["AES"]}]}, ensure_ascii=False),
+                    encoding="utf-8")
+    load_group_file(index, str(path))
+    hits = index.search("aes")
+    assert [(group, q["question"]) for _, group, q in hits] == [("보안", "대칭키 암호 예시는?")]
+
+    path.unlink()
+    load_group_file(index, str(path))
+    assert index.search("aes") == [] and len(index) == 3
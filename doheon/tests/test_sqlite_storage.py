@@ -0,0 +1,77 @@
+# test_sqlite_storage.py
+import json
+from sqlite_storage import SQLiteQuizFileManager, migrate_json_to_sqlite
+from quiz_ids import question_id
+
+BANK = [
+    {"question": "RAID 1의 방식은?", "answers": ["미러링"], "wrong_count": 1},
+    {"question": "RAID 0의 방식은?", "answers": ["스트라이핑"], "wrong_count": 0, "hint": "속도"},
+]
+
+
+def open_db(tmp_path):
+    return SQLiteQuizFileManager(str(tmp_path / "quiz.db"))
+
+
+def test_round_trip_keeps_order_and_extra_keys(tmp_path):
+    storage = open_db(tmp_path)
+    items = [dict(BANK[0], source="기출"), BANK[1]]
+    assert storage.save_file(items)
+    assert storage.load_file() == items
+    storage.close()
+
+
+def test_update_items_changes_only_given_items_and_appends_new(tmp_path):
+    storage = open_db(tmp_path)
+    storage.save_file(BANK)
+    changed = dict(BANK[1], wrong_count=5)
+    new = {"question": "RAID 5의 방식은?", "answers": ["패리티 분산"], "wrong_count": 0}
+    assert storage.update_items([changed, new])
+    assert storage.load_file() == [BANK[0], changed, new]
+    assert storage.find_by_hash(question_id("RAID 0의 방식은?"))["wrong_count"] == 5
+    assert [q["question"] for q in storage.query(min_wrong_count=1, order_by_wrong=True)] == \
+        ["RAID 0의 방식은?", "RAID 1의 방식은?"]
+    storage.close()
+
+
+def test_migrate_json_to_sqlite_keeps_groups_apart(tmp_path):
+    (tmp_path / "groups").mkdir()
+    (tmp_path / "quiz.json").write_text(json.dumps({"quiz": BANK}, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "groups" / "네트워크.json").write_text(
+        json.dumps({"quiz": [{"question": "ARP는?", "answers": ["주소 변환"]}]}, ensure_ascii=False), encoding="utf-8")
+    counts = migrate_json_to_sqlite(str(tmp_path / "quiz.db"), str(tmp_path / "quiz.json"), str(tmp_path / "groups"))
+    assert counts == {"quiz": 2, "네트워크": 1}
+    storage = open_db(tmp_path)
+    assert storage.groups() == [("quiz", 2), ("네트워크", 1)]
+    storage.close()
+
+
+def test_journal_replay_reaches_sqlite_bank(make_app, tmp_path):
+    app = make_app(BANK, quiz_file="quiz.db")
+    q_item = app.quiz_data[0]
+    q_item["wrong_count"] += 1
+    app._record("wrong", q_item, delta=1)
+    app.journal.close()  # 저장 없이 종료
+
+    restarted = make_app(quiz_file="quiz.db")
+    assert restarted.quiz_data[0]["wrong_count"] == 2
+    assert not (tmp_path / "quiz.journal").exists()
+    restarted.quiz_file_manager.close()
+
+    storage = open_db(tmp_path)
+    assert storage.load_file()[0]["wrong_count"] == 2
+    assert storage.generation == 1
+    storage.close()
+    assert make_app(quiz_file="quiz.db").quiz_data[0]["wrong_count"] == 2
+
+
+def test_sqlite_generation_prevents_double_replay(make_app, tmp_path, monkeypatch):
+    app = make_app(BANK, quiz_file="quiz.db")
+    q_item = app.quiz_data[1]
+    q_item["wrong_count"] += 1
+    app._record("wrong", q_item, delta=1)
+    monkeypatch.setattr(app.journal, "clear", lambda: None)
+    assert app.save_bank()
+    app.journal.close()
+
+    assert make_app(quiz_file="quiz.db").quiz_data[1]["wrong_count"] == 1
@@ -1,12 +1,14 @@
 # ui.py
 import os
 import platform
+import instrument
 
 class QuizUI:
     """콘솔 기반 사용자 인터페이스를 관리하는 클래스"""
     def __init__(self):
         self.clear_cmd = "cls" if platform.system() == "Windows" else "clear"
 
+    @instrument.timed("render.menu")
     def show_menu(self):
         """메인 메뉴를 화면에 표시합니다."""
         self.clear() 
@@ -17,8 +19,11 @@ class QuizUI:
         print("2. 최근에 틀린 문제 풀어보기")
         print("3. 이전에 틀렸던 문제 다시 풀어보기 (많이 틀린 것 우선)")
         print("4. 문제 추가하기")
-        print("5. 문답 전체 마크다운으로 출력하기")
+        print("5. 문답 내보내기 (마크다운/HTML/CSV)")
         print("6. 마지막으로 풀은 문제 답안 정답 처리")
+        print("7. 복습 일정에 맞춰 풀어보기 (간격 반복)")
+        print("8. 문제 검색하기")
+        print("9. 풀이 통계 보기")
         print("0. 종료")
         print("="*30)
 
@@ -27,7 +32,7 @@ class QuizUI:
         while True:
             try:
                 choice = input("원하시는 메뉴를 선택하세요: ")
-                if choice in ['1', '2', '3', '4', '5', '6', '0']:
+                if choice in ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0']:
                     return choice
                 else:
                     print("유효하지 않은 번호입니다. 다시 입력해주세요.")
@@ -35,6 +40,7 @@ class QuizUI:
                 print("\n프로그램을 종료합니다.")
                 return '0'
 
+    @instrument.timed("render.clear")
     def clear(self):
         """콘솔 화면을 지웁니다."""
         os.system(self.clear_cmd)
@@ -1,8 +1,20 @@
 ﻿import os
+import sys
 import json
+import time
 import random
+import argparse
 import textwrap
 
+# doheon 폴더의 공용 모듈(캐시 등)을 함께 사용합니다.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "doheon"))
+import bank_cache
+import instrument
+from answer_matcher import AnswerMatcher
+from attempt_store import AttemptStore
+from quiz_item import ShuffledView, to_items
+from file_manager import write_atomic
+
 def print_wrapped_preserve(text, width=25):
     paragraphs = text.split("\n")  # 원래 줄바꿈 기준으로 분리
     for para in paragraphs:
@@ -12,27 +24,74 @@ def print_wrapped_preserve(text, width=25):
             for line in textwrap.wrap(para, width):
                 print(line)
 
+MANIFEST_NAME = ".manifest.json"  # 그룹 파일 목록 캐시 (파일 이름, 수정 시각, 크기, 문제 수)
+
+@instrument.timed("manifest.load")
+def load_manifest(folder="quiz_groups"):
+    """
+    그룹 파일을 열지 않고 파일 정보만으로 그룹 목록을 만듭니다.
+    수정 시각과 크기가 캐시와 같으면 캐시에 저장된 문제 수를 그대로 사용합니다.
+    """
+    manifest_path = os.path.join(folder, MANIFEST_NAME)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        cached = {}
+
+    manifest = {}
+    with os.scandir(folder) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if not entry.name.endswith(".json") or entry.name.startswith("."):  # 캐시/임시 파일 제외
+                continue
+            stat = entry.stat()
+            info = {"file": entry.name, "mtime": stat.st_mtime_ns, "size": stat.st_size, "count": None}
+            old = cached.get(entry.name)
+            if old and old.get("mtime") == info["mtime"] and old.get("size") == info["size"]:
+                info["count"] = old.get("count")
+            name, _ = os.path.splitext(entry.name)  # 확장자 제거
+            manifest[name] = info
+    return manifest
+
+
+def save_manifest(manifest, folder="quiz_groups"):
+    """그룹 목록 캐시를 임시 파일에 쓴 뒤 교체합니다. (중간에 끊겨도 이전 캐시가 남음)"""
+    data = {info["file"]: info for info in manifest.values()}
+    try:
+        write_atomic(os.path.join(folder, MANIFEST_NAME), json.dumps(data, ensure_ascii=False).encode("utf-8"))
+    except OSError as e:
+        print(f"그룹 목록 캐시를 저장하지 못했습니다: {e}")
+
+
+@instrument.timed("group.load")
+def load_group(manifest, name, folder="quiz_groups"):
+    """선택한 그룹 파일 하나만 읽고, 문제 수가 바뀌었으면 캐시를 갱신합니다."""
+    info = manifest[name]
+    try:
+        data = bank_cache.load_json(os.path.join(folder, info["file"])) # 변경이 없으면 컴파일된 캐시를 사용
+    except json.JSONDecodeError as e:
+        print(f"{info['file']} 파일을 읽는 중 오류 발생: {e}")
+        return []
+    quizzes = to_items(data["quiz"]) if "quiz" in data and isinstance(data["quiz"], list) else []
+    if info["count"] != len(quizzes):
+        info["count"] = len(quizzes)
+        save_manifest(manifest, folder)
+    return quizzes
+
+
 def load_quiz(folder="quiz_groups"):
-    quiz_groups = {}
-    for filename in os.listdir(folder):
-        if filename.endswith(".json"):
-            file_path = os.path.join(folder, filename)
-            name, _ = os.path.splitext(filename)  # 확장자 제거
-            with open(file_path, "r", encoding="utf-8") as f:
-                try:
-                    data = json.load(f)
-                    if "quiz" in data and isinstance(data["quiz"], list):
-                        quiz_groups[name] = data["quiz"]
-                except json.JSONDecodeError as e:
-                    print(f"{filename} 파일을 읽는 중 오류 발생: {e}")
-    return quiz_groups
-
-
-def select_quiz_group(quiz_groups):
+    """모든 그룹을 한꺼번에 읽어 {그룹 이름: 문제 목록} 형태로 반환합니다."""
+    manifest = load_manifest(folder)
+    return {name: load_group(manifest, name, folder) for name in manifest}
+
+
+def select_quiz_group(manifest):
+    """그룹을 선택받아 풀이할 그룹 이름 목록을 반환합니다. ('a'는 전체)"""
     # 메뉴 출력
-    keys = list(quiz_groups.keys())
+    keys = list(manifest.keys())
     for i, name in enumerate(keys, start=1):
-        print(f"{i}. {name}")
+        count = manifest[name]["count"]
+        print(f"{i}. {name}" + (f" ({count}문제)" if count is not None else ""))
     print("a. 모두 풀어보기")
 
     while True:
@@ -40,28 +99,42 @@ def select_quiz_group(quiz_groups):
         choice = input("선택: ").strip()
 
         if choice.lower() == "a":  # 모두 풀기
-            all_quizzes = []
-            for group in quiz_groups.values():
-                all_quizzes.extend(group)
-            return all_quizzes
+            return keys
 
         if choice.isdigit():
             idx = int(choice) - 1
             if 0 <= idx < len(keys):
-                return quiz_groups[keys[idx]]
+                return [keys[idx]]
 
         print("잘못된 입력입니다.")
 
-def run_quiz(quiz_list):
-    quiz_list = quiz_list[:]
-    random.shuffle(quiz_list)
-    total = len(quiz_list)
+def iter_groups(manifest, names, folder="quiz_groups"):
+    """그룹 순서를 섞은 뒤 한 그룹씩 읽어 (그룹 이름, 문제 목록)으로 내놓습니다."""
+    names = names[:]
+    random.shuffle(names)
+    for name in names:
+        yield name, load_group(manifest, name, folder)
+
+def iter_shuffled(quiz_groups):
+    """그룹을 하나씩 받아 섞은 뒤 (그룹 이름, 문제)를 차례로 내놓습니다."""
+    for name, quiz_list in quiz_groups:
+        for quiz in ShuffledView(quiz_list):  # 목록 복사 없이 인덱스만 섞음
+            yield name, quiz
+
+def run_quiz(quiz_groups, total=None, attempts=None):
+    """
+    그룹 단위로 문제를 섞어 출제합니다.
+    quiz_groups는 (그룹 이름, 문제 목록)을 하나씩 내놓는 이터러블이며, 다음 그룹은 필요할 때 읽습니다.
+    attempts(AttemptStore)를 주면 풀이 이력을 기록합니다.
+    """
+    matcher = AnswerMatcher()
     asked = 0
     correct = 0
 
-    for i, quiz in enumerate(quiz_list, start=1):
-        print(f"\n--- 문제 {i}/{total} ---")
+    for i, (group, quiz) in enumerate(iter_shuffled(quiz_groups), start=1):
+        print(f"\n--- 문제 {i}/{total} ---" if total else f"\n--- 문제 {i} ---")
         print_wrapped_preserve(quiz["question"])
+        asked_at = time.perf_counter()
 
         # 사용자 입력 받기
         user_answer = input("정답 입력: ").strip()
@@ -71,8 +144,13 @@ def run_quiz(quiz_list):
             print("\n퀴즈를 종료합니다.")
             break
 
-        if user_answer.lower() in [a.lower() for a in quiz["answers"]]:
+        match = matcher.grade(quiz, user_answer)
+        if attempts is not None:
+            attempts.record(quiz, bool(match), (time.perf_counter() - asked_at) * 1000, group)
+        if match:
             print("정답입니다!")
+            if match != "exact":
+                print(f"(표기 차이 허용) 정답: {' || '.join(quiz['answers'])}")
             correct += 1
         else:
             print("오답입니다.")
@@ -84,8 +162,18 @@ def run_quiz(quiz_list):
         print(f"총 {asked}문제 중 {correct}문제 정답 ({correct/asked*100:.2f}%)")
     else:
         print("풀은 문제가 없습니다.")
+    if attempts is not None:
+        attempts.flush()
+
+def main():
+    manifest = load_manifest()
+    selected = select_quiz_group(manifest)
+    counts = [manifest[name]["count"] for name in selected]
+    total = sum(counts) if None not in counts else None
+    attempts = AttemptStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), "doheon", "attempt_stats"))
+    run_quiz(iter_groups(manifest, selected), total, attempts)
 
 if __name__ == "__main__":
-    quizzes = load_quiz()
-    selected = select_quiz_group(quizzes)
-    run_quiz(selected)
+    arg_parser = argparse.ArgumentParser(description="그룹별 퀴즈 풀기")
+    instrument.add_arguments(arg_parser)
+    instrument.run(main, arg_parser.parse_args())